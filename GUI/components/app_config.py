@@ -1,7 +1,6 @@
 import tkinter as tk
 from tkinter import ttk
 import os
-from PIL import Image, ImageTk
 
 class AppConfig:
     def __init__(self, root):
@@ -13,7 +12,9 @@ class AppConfig:
         """
         self.root = root
         self.setup_window()
-        self.setup_icon()
+        
+        # Loading the icon needs Pillow, so wait until the window is showing
+        self.root.after_idle(self.setup_icon)
         
     def setup_window(self):
         """Configure the main window"""
@@ -22,67 +23,67 @@ class AppConfig:
         # Set minimum window size
         self.root.minsize(800, 450)
         
+        # One tab per encounter
+        self.notebook = ttk.Notebook(self.root)
+        self.notebook.pack(fill=tk.BOTH, expand=True)
+        
+    def create_encounter_frames(self):
+        """
+        Add a tab laid out with a character list and a detail panel
+        
+        Returns:
+            (tab, list_frame, detail_frame) for the new tab
+        """
         # Create main container frame with grid
-        self.main_container = ttk.Frame(self.root)
-        self.main_container.pack(fill=tk.BOTH, expand=True)
+        main_container = ttk.Frame(self.notebook)
         
         # Configure grid weights
-        self.main_container.grid_columnconfigure(0, weight=1, minsize=400)  # Left frame gets more space
-        self.main_container.grid_columnconfigure(1, weight=0)  # Right frame doesn't expand
-        self.main_container.grid_rowconfigure(0, weight=1)
+        main_container.grid_columnconfigure(0, weight=1, minsize=400)  # Left frame gets more space
+        main_container.grid_columnconfigure(1, weight=0)  # Right frame doesn't expand
+        main_container.grid_rowconfigure(0, weight=1)
         
         # Create main frames
-        self.character_list_frame = ttk.Frame(self.main_container)
-        self.character_list_frame.grid(row=0, column=0, sticky='nsew', padx=5, pady=5)
+        character_list_frame = ttk.Frame(main_container)
+        character_list_frame.grid(row=0, column=0, sticky='nsew', padx=5, pady=5)
         
         # Create a wrapper frame to control the maximum width of the right frame
-        right_wrapper = ttk.Frame(self.main_container)
+        right_wrapper = ttk.Frame(main_container)
         right_wrapper.grid(row=0, column=1, sticky='nsew', padx=5, pady=5)
         right_wrapper.grid_columnconfigure(0, weight=1)
         right_wrapper.grid_rowconfigure(0, weight=1)
         
         # Create the actual right frame with fixed width but variable height
-        self.character_detail_frame = ttk.Frame(right_wrapper, width=300)
-        self.character_detail_frame.grid(row=0, column=0, sticky='nsew')
+        character_detail_frame = ttk.Frame(right_wrapper, width=300)
+        character_detail_frame.grid(row=0, column=0, sticky='nsew')
         
         # Allow vertical growth while keeping fixed width
-        self.character_detail_frame.grid_columnconfigure(0, weight=1)
-        self.character_detail_frame.grid_rowconfigure(0, weight=1)
+        character_detail_frame.grid_columnconfigure(0, weight=1)
+        character_detail_frame.grid_rowconfigure(0, weight=1)
         
         # Create inner frame to maintain fixed width
-        inner_frame = ttk.Frame(self.character_detail_frame)
+        inner_frame = ttk.Frame(character_detail_frame)
         inner_frame.grid(row=0, column=0, sticky='new')
         inner_frame.grid_propagate(False)  # Keep fixed width
         inner_frame.configure(width=300)
         
-        # Store inner frame reference
-        self._detail_inner_frame = inner_frame
+        return main_container, character_list_frame, inner_frame
         
     def setup_icon(self):
         """Set up the application icon based on platform"""
         ico_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'app.ico')
         try:
-            # Load icon for window decoration
-            icon_image = Image.open(ico_path)
-            icon_photo = ImageTk.PhotoImage(icon_image)
-            
             # Handle icon setting based on platform
-            if os.name == 'nt':  # Windows
+            if os.name == 'nt':  # Windows reads .ico files natively
                 self.root.iconbitmap(ico_path)
-            else:  # Linux/Unix
-                self.root.iconphoto(True, icon_photo)
+                return
+            
+            # Linux/Unix needs Pillow to convert the .ico, imported on first use
+            from PIL import Image, ImageTk
+            icon_image = Image.open(ico_path)
+            icon_photo = ImageTk.PhotoImage(icon_image)
+            self.root.iconphoto(True, icon_photo)
             
             # Keep a reference to prevent garbage collection
             self._icon_photo = icon_photo
         except Exception as e:
             print(f"Failed to load application icon: {e}")
-            
-    @property
-    def list_frame(self):
-        """Get the character list frame"""
-        return self.character_list_frame
-        
-    @property
-    def detail_frame(self):
-        """Get the character detail frame"""
-        return self._detail_inner_frame
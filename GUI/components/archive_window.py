@@ -0,0 +1,97 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+class ArchiveWindow:
+    def __init__(self, root, app):
+        """
+        Initialize the campaign archive browser
+
+        Args:
+            root: The root window
+            app: The main GUI, which owns the archive and encounter tabs
+        """
+        self.root = root
+        self.app = app
+        self.archive = app.archive
+        self.shown = []  # ArchiveEntry per tree row, in order
+
+        # Create window
+        self.window = tk.Toplevel(root)
+        self.window.title("Campaign Archive")
+        self.window.geometry("720x420")
+
+        self.setup_widgets()
+        self.update_results()
+
+    def setup_widgets(self):
+        """Create the search entry, results table and buttons"""
+        main_frame = ttk.Frame(self.window, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Search by date, encounter or participant
+        search_frame = ttk.Frame(main_frame)
+        search_frame.pack(fill=tk.X, pady=(0, 5))
+        ttk.Label(search_frame, text="Search:").pack(side=tk.LEFT, padx=(0, 5))
+        self.search_var = tk.StringVar()
+        search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
+        search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        search_entry.focus_set()
+        self.search_var.trace_add('write', lambda *args: self.update_results())
+
+        # Results
+        columns = ('ended', 'encounter', 'rounds', 'participants')
+        self.result_tree = ttk.Treeview(main_frame, columns=columns, show='headings', selectmode='browse')
+        self.result_tree.heading('ended', text='Ended')
+        self.result_tree.heading('encounter', text='Encounter')
+        self.result_tree.heading('rounds', text='Rounds')
+        self.result_tree.heading('participants', text='Participants')
+        self.result_tree.column('ended', width=130, anchor=tk.W)
+        self.result_tree.column('encounter', width=120, anchor=tk.W)
+        self.result_tree.column('rounds', width=60, anchor=tk.CENTER)
+        self.result_tree.column('participants', width=380, anchor=tk.W)
+        self.result_tree.pack(fill=tk.BOTH, expand=True)
+        self.result_tree.bind('<Double-Button-1>', lambda e: self.restore())
+
+        # Buttons
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=(10, 0))
+        self.count_label = ttk.Label(button_frame, text="")
+        self.count_label.pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Close", command=self.window.destroy).pack(side=tk.RIGHT)
+        ttk.Button(button_frame, text="Restore", command=self.restore).pack(side=tk.RIGHT, padx=(0, 5))
+
+    def update_results(self):
+        """List the archived combats matching the search, newest first"""
+        try:
+            self.shown = self.archive.search(self.search_var.get())
+        except OSError as e:
+            self.count_label.configure(text=f"Can't read the archive: {e}")
+            return
+        self.result_tree.delete(*self.result_tree.get_children())
+        for idx, entry in enumerate(self.shown):
+            self.result_tree.insert('', 'end', iid=str(idx), values=(
+                entry.ended,
+                entry.encounter,
+                entry.rounds,
+                ", ".join(entry.participants)
+            ))
+        total = len(self.archive.entries())
+        self.count_label.configure(text=f"{len(self.shown)} of {total} combats")
+
+    def restore(self):
+        """Open the selected combat in a new encounter tab"""
+        selection = self.result_tree.selection()
+        if not selection:
+            return
+        entry = self.shown[int(selection[0])]
+        try:
+            save_data = self.archive.load(entry)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to restore combat: {str(e)}", parent=self.window)
+            return
+
+        self.app.new_encounter()
+        encounter = self.app.encounter
+        encounter.engine.load_dict(save_data)
+        encounter.rename(f"{entry.encounter or 'Combat'} #{entry.number}")
+        self.app.write_encounter_list()
@@ -0,0 +1,171 @@
+import tkinter as tk
+from tkinter import ttk
+from character.validation import check_health, FieldError, parse_name, parse_whole
+from GUI.components.inline_validator import InlineValidator
+
+# (field, heading, width, parser arguments after the text)
+COLUMNS = (
+    ('name', 'Name', 20, ()),
+    ('initiative', 'Initiative', 8, ("Initiative",)),
+    ('initiative_bonus', 'Bonus', 6, ("Initiative bonus",)),
+    ('health', 'Health', 6, ("Health", 0)),
+    ('maxhp', 'Max HP', 6, ("Max HP", 0)),
+    ('ac', 'AC', 5, ("AC", 0)),
+)
+
+class BulkEditWindow:
+    def __init__(self, root, engine, characters):
+        """
+        Initialize a spreadsheet-style editor for several characters
+
+        Cells can be edited freely; nothing reaches the engine until Apply,
+        which validates every edited row and commits them as one batch with
+        a single sort and repaint.
+
+        Args:
+            root: The root window
+            engine: CombatEngine the characters belong to
+            characters: Characters to show, one row each
+        """
+        self.root = root
+        self.engine = engine
+        self.characters = list(characters)
+        self.cells = []  # one {field: entry} per character
+        self.original = []  # one {field: text} per character
+
+        # Create window
+        self.window = tk.Toplevel(root)
+        self.window.title(f"Bulk Edit - {len(self.characters)} characters")
+        self.window.geometry("560x420")
+
+        self.setup_widgets()
+
+    def setup_widgets(self):
+        """Create the scrollable grid, status line and buttons"""
+        main_frame = ttk.Frame(self.window, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        style = ttk.Style()
+        style.configure('Changed.TEntry', fieldbackground='#fff5cc')
+
+        # Buttons and status at the bottom
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=(10, 0))
+        ttk.Button(button_frame, text="Apply", command=self.apply).pack(side=tk.RIGHT)
+        ttk.Button(button_frame, text="Cancel", command=self.window.destroy).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="Revert", command=self.revert).pack(side=tk.LEFT)
+
+        self.status_label = ttk.Label(main_frame, text="")
+        self.status_label.pack(side=tk.BOTTOM, anchor=tk.W)
+        self.validator = InlineValidator(self.status_label)
+
+        # Scrollable grid of entries
+        canvas = tk.Canvas(main_frame, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
+        canvas.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        grid = ttk.Frame(canvas)
+        canvas.create_window((0, 0), window=grid, anchor=tk.NW)
+        grid.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
+        self.canvas = canvas
+
+        for column, (field, heading, width, args) in enumerate(COLUMNS):
+            ttk.Label(grid, text=heading).grid(row=0, column=column, sticky=tk.W, padx=1)
+
+        for row, char in enumerate(self.characters, 1):
+            entries = {}
+            texts = {}
+            for column, (field, heading, width, args) in enumerate(COLUMNS):
+                text = str(getattr(char, field))
+                entry = ttk.Entry(grid, width=width)
+                entry.insert(0, text)
+                entry.grid(row=row, column=column, sticky=tk.EW, padx=1, pady=1)
+                entry.bind('<KeyRelease>', lambda e, r=row - 1, f=field: self._mark_changed(r, f), add='+')
+                entry.bind('<Up>', lambda e, r=row - 1, c=column: self._move(r - 1, c))
+                entry.bind('<Down>', lambda e, r=row - 1, c=column: self._move(r + 1, c))
+                entry.bind('<Return>', lambda e, r=row - 1, c=column: self._move(r + 1, c))
+                entries[field] = entry
+                texts[field] = text
+            self.cells.append(entries)
+            self.original.append(texts)
+
+        self.window.bind('<Control-Return>', lambda e: self.apply())
+        self.window.bind('<Escape>', lambda e: self.window.destroy())
+        if self.cells:
+            self.cells[0]['name'].focus_set()
+
+    def _move(self, row, column):
+        """Focus the cell in the same column of another row"""
+        if 0 <= row < len(self.cells):
+            entry = self.cells[row][COLUMNS[column][0]]
+            entry.focus_set()
+            entry.select_range(0, tk.END)
+
+            # Keep the focused row in view
+            self.canvas.update_idletasks()
+            top, bottom = self.canvas.yview()
+            fraction = row / len(self.cells)
+            if not top <= fraction < bottom:
+                self.canvas.yview_moveto(max(0.0, fraction - (bottom - top) / 2))
+        return 'break'
+
+    def _mark_changed(self, row, field):
+        """Tint a cell whose text differs from the character's value"""
+        entry = self.cells[row][field]
+        if entry in self.validator.errors:
+            return
+        changed = entry.get() != self.original[row][field]
+        entry.configure(style='Changed.TEntry' if changed else 'TEntry')
+
+    def edits(self):
+        """
+        Parse every edited row, marking the invalid cells
+
+        Returns:
+            (character, {field: value}) pairs for the rows with changes
+        """
+        edits = []
+        for char, entries, texts in zip(self.characters, self.cells, self.original):
+            if all(entries[field].get() == texts[field] for field in texts):
+                continue
+            values = {}
+            for field, heading, width, args in COLUMNS:
+                parser = parse_name if field == 'name' else parse_whole
+                values[field] = self.validator.parse(entries[field], parser, *args)
+            if None in values.values():
+                continue
+            try:
+                check_health(values['health'], values['maxhp'])
+            except FieldError as e:
+                self.validator.mark(entries['health'], f"{char.name}: {e}")
+                continue
+            changes = {field: value for field, value in values.items()
+                       if str(value) != texts[field]}
+            if changes:
+                edits.append((char, changes))
+        return edits
+
+    def apply(self):
+        """Commit every edited row as a single engine change"""
+        self.validator.clear()
+        edits = self.edits()
+        if not self.validator.valid:
+            return
+
+        # Skip characters removed from combat while the grid was open
+        present = {id(char) for char in self.engine.characters}
+        edits = [(char, fields) for char, fields in edits if id(char) in present]
+        if edits:
+            self.engine.update_characters(edits)
+        self.window.destroy()
+
+    def revert(self):
+        """Put every cell back to the character's value"""
+        self.validator.clear()
+        for entries, texts in zip(self.cells, self.original):
+            for field, entry in entries.items():
+                entry.delete(0, tk.END)
+                entry.insert(0, texts[field])
+                entry.configure(style='TEntry')
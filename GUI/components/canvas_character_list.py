@@ -0,0 +1,516 @@
+import tkinter as tk
+from tkinter import ttk
+from character.validation import FieldError, parse_name, parse_whole
+
+ROW_HEIGHT = 22
+HEADER_HEIGHT = 22
+BAR_HEIGHT = 12
+
+# (column, heading, width)
+COLUMNS = (
+    ('name', 'Name', 170),
+    ('initiative', 'Init', 50),
+    ('bonus', 'Bonus', 50),
+    ('health', 'Health', 130),
+    ('ac', 'AC', 40),
+    ('conditions', 'Conditions', 140),
+    ('custom_fields', 'Custom Fields', 200),
+)
+
+COLORS = {
+    'background': '#ffffff',
+    'stripe': '#f4f4f4',
+    'selected': '#cce0ff',
+    'current': '#fff2b3',
+    'grid': '#d0d0d0',
+    'bar_back': '#e6e6e6',
+    'healthy': '#4caf50',
+    'bloodied': '#e0a030',
+    'down': '#d04040',
+}
+
+class CanvasCharacterList:
+    def __init__(self, parent_frame, parent):
+        """
+        Initialize a character list drawn on a canvas, for mass battles
+
+        Only the rows in view exist as canvas items: a fixed pool of row
+        slots is re-pointed at other characters when the list scrolls, so
+        drawing and scrolling cost the same for 50 or 50,000 combatants.
+        It offers the same methods and parent callbacks as CharacterList.
+
+        Args:
+            parent_frame: Frame to place the character list in
+            parent: Parent window (main GUI) that contains character management methods
+        """
+        self.parent_frame = parent_frame
+        self.parent = parent
+        self.engine = parent.engine
+        self.popup_entry = None
+        self.suppress_selection_event = False
+
+        self._characters = []  # every character, in initiative order
+        self._shown = []  # characters passing the filter, in initiative order
+        self._rows = {}  # id(character) -> index in _shown
+        self._chars = {}  # id(character) -> character, for item lookups
+        self._filter_predicate = None
+        self._selected = {}  # id(character) -> character
+        self._anchor = None  # row index shift-click selects from
+        self._top = 0  # pixel offset of the view into the list
+        self._slots = []  # canvas item ids for each drawn row
+        self._width = 0
+
+        self.setup_character_list()
+
+        # Repaint from engine events
+        self.engine.subscribe(self._on_engine_event)
+
+    def setup_character_list(self):
+        """Initialize the header, canvas and buttons"""
+        # Character List Label
+        ttk.Label(self.parent_frame, text="Characters (mass battle view)").pack()
+
+        # Filter bar above the list
+        from GUI.components.filter_bar import FilterBar
+        self.filter_bar = FilterBar(self.parent_frame, self.set_filter)
+
+        # Buttons Frame
+        btn_frame = ttk.Frame(self.parent_frame)
+        btn_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=5)
+
+        self.copy_button = ttk.Button(btn_frame, text="Copy Character", command=self.parent.copy_character)
+        self.copy_button.pack(side=tk.LEFT, padx=2)
+        ttk.Button(btn_frame, text="Delete", command=self.parent.delete_character).pack(side=tk.LEFT, padx=2)
+        ttk.Button(btn_frame, text="End Combat", command=self.parent.end_combat).pack(side=tk.LEFT, padx=2)
+
+        # The scrollbar drives the view directly; the canvas never holds every row
+        self.y_scrollbar = ttk.Scrollbar(self.parent_frame, orient="vertical", command=self.yview)
+        self.y_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.header = tk.Canvas(self.parent_frame, height=HEADER_HEIGHT, highlightthickness=0,
+                                background=COLORS['stripe'])
+        self.header.pack(fill=tk.X)
+        self.canvas = tk.Canvas(self.parent_frame, highlightthickness=0, background=COLORS['background'],
+                                takefocus=True)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+
+        self.font = ('TkDefaultFont', 10)
+        self.bold_font = ('TkDefaultFont', 10, 'bold')
+
+        # Column x positions
+        self._columns = {}
+        x = 0
+        for name, heading, width in COLUMNS:
+            self._columns[name] = (x, width)
+            self.header.create_text(x + 4, HEADER_HEIGHT // 2, text=heading, anchor=tk.W, font=self.bold_font)
+            x += width
+
+        self.canvas.bind('<Configure>', lambda e: self._layout())
+        self.canvas.bind('<Button-1>', self.on_click)
+        self.canvas.bind('<Shift-Button-1>', lambda e: self.on_click(e, extend=True))
+        self.canvas.bind('<Control-Button-1>', lambda e: self.on_click(e, toggle=True))
+        self.canvas.bind('<Double-1>', self.on_double_click)
+        self.canvas.bind('<Up>', lambda e: self._step_selection(-1))
+        self.canvas.bind('<Down>', lambda e: self._step_selection(1))
+        self.canvas.bind('<Prior>', lambda e: self.yview('scroll', -1, 'pages'))
+        self.canvas.bind('<Next>', lambda e: self.yview('scroll', 1, 'pages'))
+        self.canvas.bind('<MouseWheel>', lambda e: self.yview('scroll', -1 if e.delta > 0 else 1, 'units'))
+        self.canvas.bind('<Button-4>', lambda e: self.yview('scroll', -1, 'units'))
+        self.canvas.bind('<Button-5>', lambda e: self.yview('scroll', 1, 'units'))
+
+    def get_copy_button_position(self):
+        """Get the position and size of the copy button"""
+        return {
+            'x': self.copy_button.winfo_rootx(),
+            'y': self.copy_button.winfo_rooty(),
+            'width': self.copy_button.winfo_width(),
+            'height': self.copy_button.winfo_height()
+        }
+
+    # Scrolling
+
+    def _view_height(self):
+        return max(self.canvas.winfo_height(), 1)
+
+    def _max_top(self):
+        return max(0, len(self._shown) * ROW_HEIGHT - self._view_height())
+
+    def yview(self, *args):
+        """Scrollbar protocol: 'moveto FRACTION' or 'scroll N units|pages'"""
+        if args and args[0] == 'moveto':
+            top = float(args[1]) * len(self._shown) * ROW_HEIGHT
+        elif args and args[0] == 'scroll':
+            step = ROW_HEIGHT if args[2] == 'units' else self._view_height() - ROW_HEIGHT
+            top = self._top + int(args[1]) * step
+        else:
+            return
+        self._scroll_to(top)
+        return 'break'
+
+    def _scroll_to(self, top):
+        top = int(max(0, min(top, self._max_top())))
+        if top != self._top:
+            self._top = top
+            self._draw()
+        self._update_scrollbar()
+
+    def _update_scrollbar(self):
+        total = len(self._shown) * ROW_HEIGHT
+        if total <= 0:
+            self.y_scrollbar.set(0, 1)
+            return
+        self.y_scrollbar.set(self._top / total, min(1.0, (self._top + self._view_height()) / total))
+
+    def see(self, row):
+        """Scroll the least amount needed to show a row"""
+        y = row * ROW_HEIGHT
+        if y < self._top:
+            self._scroll_to(y)
+        elif y + ROW_HEIGHT > self._top + self._view_height():
+            self._scroll_to(y + ROW_HEIGHT - self._view_height())
+
+    # Drawing
+
+    def _layout(self):
+        """Size the slot pool to the canvas height and redraw"""
+        needed = self._view_height() // ROW_HEIGHT + 2
+        width = max(self.canvas.winfo_width(), sum(width for name, heading, width in COLUMNS))
+        while len(self._slots) < needed:
+            self._slots.append(self._create_slot())
+        while len(self._slots) > needed:
+            for item in self._slots.pop().values():
+                self.canvas.delete(item)
+        self._width = width
+        self._top = min(self._top, self._max_top())
+        self._draw()
+        self._update_scrollbar()
+
+    def _create_slot(self):
+        """Create the canvas items for one drawn row"""
+        canvas = self.canvas
+        slot = {
+            'background': canvas.create_rectangle(0, 0, 0, 0, width=0),
+            'bar_back': canvas.create_rectangle(0, 0, 0, 0, width=0, fill=COLORS['bar_back']),
+            'bar': canvas.create_rectangle(0, 0, 0, 0, width=0),
+            'line': canvas.create_line(0, 0, 0, 0, fill=COLORS['grid']),
+        }
+        for name, heading, width in COLUMNS:
+            slot[name] = canvas.create_text(0, 0, anchor=tk.W, font=self.font)
+        return slot
+
+    def _draw(self):
+        """Point each slot at the row now under it"""
+        first = self._top // ROW_HEIGHT
+        for offset, slot in enumerate(self._slots):
+            self._draw_row(first + offset, slot)
+
+    def _draw_row(self, row, slot):
+        """Draw a character into a slot, or hide the slot past the end of the list"""
+        canvas = self.canvas
+        if row >= len(self._shown):
+            for item in slot.values():
+                canvas.itemconfigure(item, state=tk.HIDDEN)
+            return
+        char = self._shown[row]
+        y = row * ROW_HEIGHT - self._top
+        middle = y + ROW_HEIGHT // 2
+
+        if id(char) in self._selected:
+            fill = COLORS['selected']
+        elif self._is_current(char):
+            fill = COLORS['current']
+        else:
+            fill = COLORS['stripe'] if row % 2 else COLORS['background']
+        canvas.coords(slot['background'], 0, y, self._width, y + ROW_HEIGHT)
+        canvas.itemconfigure(slot['background'], fill=fill, state=tk.NORMAL)
+        canvas.coords(slot['line'], 0, y + ROW_HEIGHT - 1, self._width, y + ROW_HEIGHT - 1)
+        canvas.itemconfigure(slot['line'], state=tk.NORMAL)
+
+        # Health bar behind the health text
+        x, width = self._columns['health']
+        bar_width = width - 8
+        ratio = max(0.0, min(1.0, char.health / char.maxhp)) if char.maxhp > 0 else 0.0
+        top = middle - BAR_HEIGHT // 2
+        canvas.coords(slot['bar_back'], x + 4, top, x + 4 + bar_width, top + BAR_HEIGHT)
+        canvas.itemconfigure(slot['bar_back'], state=tk.NORMAL)
+        canvas.coords(slot['bar'], x + 4, top, x + 4 + bar_width * ratio, top + BAR_HEIGHT)
+        canvas.itemconfigure(slot['bar'], fill=self._bar_color(char), state=tk.NORMAL)
+
+        font = self.bold_font if self._is_current(char) else self.font
+        for name, text in zip(self._columns, self._format_row(char)):
+            x, width = self._columns[name]
+            if name == 'health':
+                canvas.coords(slot[name], x + width // 2, middle)
+                canvas.itemconfigure(slot[name], text=text, font=font, anchor=tk.CENTER, state=tk.NORMAL)
+            else:
+                canvas.coords(slot[name], x + 4, middle)
+                canvas.itemconfigure(slot[name], text=text, font=font, state=tk.NORMAL)
+
+    def _draw_rows(self, rows):
+        """Redraw only the given row indexes that are in view"""
+        first = self._top // ROW_HEIGHT
+        for row in rows:
+            offset = row - first
+            if 0 <= offset < len(self._slots):
+                self._draw_row(row, self._slots[offset])
+
+    def _is_current(self, char):
+        """Whether it is this character's turn; a group takes its turn together"""
+        current = self.engine.current
+        if current is None:
+            return False
+        return char is current or (current.group is not None and char.group == current.group)
+
+    @staticmethod
+    def _bar_color(char):
+        if char.health <= 0:
+            return COLORS['down']
+        if char.health * 2 <= char.maxhp:
+            return COLORS['bloodied']
+        return COLORS['healthy']
+
+    def _format_row(self, char):
+        """Build the column texts for a character"""
+        name = f"{char.name} [{char.group}]" if char.group is not None else char.name
+        return (
+            name,
+            char.initiative,
+            char.initiative_bonus,
+            f"{char.health} / {char.maxhp}",
+            char.ac,
+            ', '.join(condition.name for condition in char.conditions),
+            ', '.join(f"{k}: {v}" for k, v in char.custom_fields.items())
+        )
+
+    # Updates
+
+    def update_character_list(self, characters):
+        """Show the given characters in order, redrawing only the rows in view"""
+        self._characters = list(characters)
+        self._chars = {id(char): char for char in self._characters}
+        self._selected = {key: char for key, char in self._selected.items() if key in self._chars}
+        self._apply_filter()
+
+    def refresh_characters(self, characters):
+        """Redraw the rows of characters whose fields changed"""
+        if self._filter_predicate is not None:
+            for char in characters:
+                passes = bool(self._filter_predicate(char))
+                if passes != (id(char) in self._rows):
+                    # A character entered or left the filter
+                    self._apply_filter()
+                    return
+        self._draw_rows([self._rows[id(char)] for char in characters if id(char) in self._rows])
+
+    def set_filter(self, predicate):
+        """Show only characters matching the predicate (None shows everyone)"""
+        self._filter_predicate = predicate
+        self._apply_filter()
+
+    def _apply_filter(self):
+        predicate = self._filter_predicate
+        if predicate is None:
+            self._shown = self._characters
+        else:
+            self._shown = [char for char in self._characters if predicate(char)]
+        self._rows = {id(char): row for row, char in enumerate(self._shown)}
+        self._top = min(self._top, self._max_top())
+        self._draw()
+        self._update_scrollbar()
+
+    def _on_engine_event(self, event, data):
+        """Repaint only what the engine reports as changed"""
+        if event == 'turn':
+            # The highlight moves; only rows in view can show it
+            self._draw()
+            if data is not None and id(data) in self._rows:
+                self.see(self._rows[id(data)])
+        elif event == 'changed':
+            self.refresh_characters(data)
+        elif event in ('added', 'removed', 'reordered', 'reset'):
+            self.update_character_list(self.engine.characters)
+
+    # Selection
+
+    def get_character(self, item):
+        """Get the character for an item (this list's items are id(character))"""
+        return self._chars.get(item)
+
+    def get_item(self, char):
+        """Get the item for a character, whether or not it is filtered out"""
+        return id(char) if id(char) in self._chars else None
+
+    def select_character(self, char):
+        """Select and scroll to a character's row if it passes the current filter"""
+        row = self._rows.get(id(char))
+        if row is None:
+            return False
+        self._set_selection({id(char): char}, row)
+        self.see(row)
+        return True
+
+    def get_selected_character(self):
+        """Get the currently selected character"""
+        for char in self._shown_selection():
+            return char
+        return None
+
+    def get_selected_characters(self):
+        """Get every selected character, in list order"""
+        return self._shown_selection()
+
+    def _shown_selection(self):
+        if not self._selected:
+            return []
+        rows = sorted(self._rows[key] for key in self._selected if key in self._rows)
+        return [self._shown[row] for row in rows]
+
+    def _set_selection(self, selected, anchor):
+        changed_rows = [self._rows[key] for key in set(self._selected) ^ set(selected) if key in self._rows]
+        self._selected = selected
+        self._anchor = anchor
+        self._draw_rows(changed_rows)
+        self.on_select(None)
+
+    def _row_at(self, y):
+        row = (int(y) + self._top) // ROW_HEIGHT
+        return row if 0 <= row < len(self._shown) else None
+
+    def _column_at(self, x):
+        for name, (left, width) in self._columns.items():
+            if left <= x < left + width:
+                return name
+        return COLUMNS[-1][0]
+
+    def on_click(self, event, extend=False, toggle=False):
+        """Select a row; shift extends from the last click, control toggles"""
+        self.canvas.focus_set()
+        self.cancel_edit()
+        row = self._row_at(event.y)
+        if row is None:
+            # Clicked in an empty area
+            self._set_selection({}, None)
+            return
+        char = self._shown[row]
+        if extend and self._anchor is not None:
+            low, high = sorted((self._anchor, row))
+            selected = {id(c): c for c in self._shown[low:high + 1]}
+            self._set_selection(selected, self._anchor)
+        elif toggle:
+            selected = dict(self._selected)
+            if selected.pop(id(char), None) is None:
+                selected[id(char)] = char
+            self._set_selection(selected, row)
+        else:
+            self._set_selection({id(char): char}, row)
+
+    def _step_selection(self, step):
+        """Move the selection with the arrow keys"""
+        if not self._shown:
+            return 'break'
+        row = self._anchor + step if self._anchor is not None else 0
+        row = max(0, min(row, len(self._shown) - 1))
+        self.select_character(self._shown[row])
+        return 'break'
+
+    def on_select(self, event):
+        """Handle selection of a character"""
+        if self.suppress_selection_event:
+            return
+        if hasattr(self.parent, 'on_character_selected'):
+            self.parent.on_character_selected(self.get_selected_character())
+
+    # Editing
+
+    def on_double_click(self, event):
+        """Edit the clicked cell in place"""
+        row = self._row_at(event.y)
+        if row is None:
+            return
+        char = self._shown[row]
+        column_name = self._column_at(event.x)
+        if column_name == 'custom_fields':
+            self.parent.edit_custom_fields(id(char))
+            return
+        if column_name == 'conditions':
+            # Conditions are managed from the quick edit panel
+            return
+
+        values = {
+            'name': char.name,
+            'initiative': char.initiative,
+            'bonus': char.initiative_bonus,
+            'health': char.health,
+            'ac': char.ac,
+        }
+        self.start_edit(char, row, column_name, str(values[column_name]))
+
+    def start_edit(self, char, row, column_name, current_value):
+        """Place an entry over a cell"""
+        self.cancel_edit()
+        x, width = self._columns[column_name]
+        y = row * ROW_HEIGHT - self._top
+        self.current_edit = {'char': char, 'column_name': column_name}
+
+        self.popup_entry = ttk.Entry(self.canvas)
+        self.popup_entry.insert(0, current_value)
+        self.popup_entry.select_range(0, tk.END)
+        self.popup_entry.place(x=x, y=y, width=width, height=ROW_HEIGHT)
+
+        from GUI.components.inline_validator import InlineValidator
+        self.popup_status = ttk.Label(self.canvas, text="")
+        self.popup_status.place(x=x, y=y + ROW_HEIGHT)
+        self.popup_validator = InlineValidator(self.popup_status)
+
+        self.popup_entry.focus_set()
+        self.popup_entry.bind('<Return>', lambda e: self.finish_edit())
+        self.popup_entry.bind('<Escape>', lambda e: self.cancel_edit())
+        # Leaving the cell with an invalid value keeps the old one
+        self.popup_entry.bind('<FocusOut>', lambda e: self.finish_edit(revert_invalid=True))
+
+    def finish_edit(self, revert_invalid=False):
+        """Save the edited value through the engine, which redraws the row"""
+        if self.popup_entry is None:
+            return
+        char = self.current_edit['char']
+        column_name = self.current_edit['column_name']
+        new_value = self.popup_entry.get()
+        try:
+            if column_name == 'name':
+                value = parse_name(new_value)
+            elif column_name == 'initiative':
+                value = parse_whole(new_value, "Initiative")
+            elif column_name == 'bonus':
+                value = parse_whole(new_value, "Initiative bonus")
+            elif column_name == 'health':
+                value = parse_whole(new_value, "Health", 0)
+            else:
+                value = parse_whole(new_value, "AC", 0)
+        except FieldError as e:
+            if revert_invalid:
+                self.cancel_edit()
+            else:
+                self.popup_validator.mark(self.popup_entry, str(e))
+                self.popup_entry.focus_set()
+            return
+
+        self.cancel_edit()
+        if column_name == 'name':
+            self.engine.update_character(char, name=value)
+        elif column_name == 'initiative':
+            self.engine.update_character(char, initiative=value)
+            self.select_character(char)
+        elif column_name == 'bonus':
+            self.engine.update_character(char, initiative_bonus=value)
+        elif column_name == 'health':
+            # Cap health at max HP instead of showing warning
+            self.engine.set_health(char, value)
+        else:
+            self.engine.update_character(char, ac=value)
+
+    def cancel_edit(self):
+        """Cancel the current edit"""
+        if self.popup_entry is not None:
+            entry, self.popup_entry = self.popup_entry, None
+            entry.destroy()
+            self.popup_status.destroy()
@@ -1,6 +1,8 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
 from character.character import Character
+from character.validation import parse_initiative, parse_name, parse_token, parse_whole
+from GUI.components.inline_validator import InlineValidator
 
 class CharacterDetails:
     def __init__(self, parent_frame, parent):
@@ -50,6 +52,20 @@ class CharacterDetails:
         self.ac_entry = ttk.Entry(self.parent_frame, textvariable=self.ac_var)
         self.ac_entry.bind('<Return>', lambda e: self.add_character())
         
+        # Token image, shown in the character list and quick edit panel
+        self.token_label = ttk.Label(self.parent_frame, text="Token Image:")
+        self.token_frame = ttk.Frame(self.parent_frame)
+        self.token_var = tk.StringVar()
+        self.token_entry = ttk.Entry(self.token_frame, textvariable=self.token_var)
+        self.token_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.token_entry.bind('<Return>', lambda e: self.add_character())
+        ttk.Button(self.token_frame, text="Browse...", command=self.browse_token).pack(side=tk.LEFT, padx=(5, 0))
+        
+        # Player Character toggle
+        self.player_var = tk.BooleanVar(value=False)
+        self.player_check = ttk.Checkbutton(self.parent_frame, text="Player Character",
+                                            variable=self.player_var)
+        
         # Custom Fields Frame
         self.custom_frame = ttk.LabelFrame(self.parent_frame, text="Custom Fields")
         
@@ -67,6 +83,10 @@ class CharacterDetails:
         self.add_char_button = ttk.Button(self.parent_frame, text="Add Character", 
                                         command=self.add_character)
         
+        # Explains invalid fields instead of a dialog per mistake
+        self.status_label = ttk.Label(self.parent_frame, text="", wraplength=220)
+        self.validator = InlineValidator(self.status_label)
+        
         # Pack widgets in the correct order based on mode
         if hasattr(self, 'template_mode') and self.template_mode:
             self._pack_template_mode()
@@ -87,6 +107,10 @@ class CharacterDetails:
         self.ac_label.pack(anchor=tk.W)
         self.ac_entry.pack(fill=tk.X, pady=(0, 10))
         
+        # Token
+        self.token_label.pack(anchor=tk.W)
+        self.token_frame.pack(fill=tk.X, pady=(0, 10))
+        
         # Custom Fields
         self.custom_frame.pack(fill=tk.X, pady=5)
         self.custom_fields_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -95,6 +119,7 @@ class CharacterDetails:
         
         # Add Character Button
         self.add_char_button.pack(fill=tk.X, pady=10)
+        self.status_label.pack(anchor=tk.W)
         
     def _pack_normal_mode(self):
         """Pack widgets in normal mode order"""
@@ -118,6 +143,13 @@ class CharacterDetails:
         self.ac_label.pack(anchor=tk.W)
         self.ac_entry.pack(fill=tk.X, pady=(0, 10))
         
+        # Token
+        self.token_label.pack(anchor=tk.W)
+        self.token_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        # Player Character
+        self.player_check.pack(anchor=tk.W, pady=(0, 10))
+        
         # Custom Fields
         self.custom_frame.pack(fill=tk.X, pady=5)
         self.custom_fields_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -126,42 +158,54 @@ class CharacterDetails:
         
         # Add Character Button
         self.add_char_button.pack(fill=tk.X, pady=10)
+        self.status_label.pack(anchor=tk.W)
 
     def add_character(self, event=None):
-        """Add a new character with the current field values"""
-        try:
-            # Create a new character with the current field values
-            name = self.name_var.get()
-            if not name.strip():
-                messagebox.showerror("Error", "Please enter a name for the character")
-                return
-                
-            health_value = int(self.health_var.get() or 0)
-            char = Character(
-                name=name,
-                initiative=int(self.initiative_var.get() or 0),
-                initiative_bonus=int(self.bonus_var.get() or 0),
-                health=health_value,
-                maxhp=health_value,  # In template mode, health value is max HP
-                ac=int(self.ac_var.get() or 0)
-            )
-            
-            # Add custom fields
-            for frame in self.custom_fields_frame.winfo_children():
-                entries = [w for w in frame.winfo_children() if isinstance(w, ttk.Entry)]
-                if len(entries) == 2:
-                    field_name = entries[0].get().strip()
-                    if field_name:  # Only add if field name is not empty
-                        char.custom_fields[field_name] = entries[1].get()
-            
-            # Add character through parent's add_character method
-            self.parent.add_character(char)
-            
-            # Clear the form for the next character
-            self.clear_character_details()
-            
-        except ValueError as e:
-            messagebox.showerror("Error", "Please enter valid numbers for Initiative, Health, and AC")
+        """Add a new character with the current field values
+        
+        Invalid fields are highlighted and explained below the button; the
+        form is kept as typed so they can be fixed in place.
+        """
+        validator = self.validator
+        name = validator.parse(self.name_entry, parse_name)
+        bonus = validator.parse(self.bonus_entry, parse_whole, "Initiative bonus", None, 0)
+        health_value = validator.parse(self.health_entry, parse_whole, "Health", 0, 0)
+        ac = validator.parse(self.ac_entry, parse_whole, "AC", 0, 0)
+        token = validator.parse(self.token_entry, parse_token)
+        if not validator.valid:
+            return
+        
+        # Create a new character with the current field values
+        char = Character(
+            name=name,
+            initiative=0,
+            initiative_bonus=bonus,
+            health=health_value,
+            maxhp=health_value,  # In template mode, health value is max HP
+            ac=ac,
+            is_player=self.player_var.get(),
+            token=token
+        )
+        
+        # Add custom fields
+        for frame in self.custom_fields_frame.winfo_children():
+            entries = [w for w in frame.winfo_children() if isinstance(w, ttk.Entry)]
+            if len(entries) == 2:
+                field_name = entries[0].get().strip()
+                if field_name:  # Only add if field name is not empty
+                    char.custom_fields[field_name] = entries[1].get()
+        
+        # Initiative may be a number or a dice expression such as 1d20+initiative_bonus
+        initiative = validator.parse(self.initiative_entry, parse_initiative, char)
+        if initiative is None:
+            return
+        char.initiative = initiative
+        
+        # Add character through parent's add_character method
+        self.parent.add_character(char)
+        
+        # Clear the form for the next character
+        self.clear_character_details()
 
     def clear_character_details(self):
         """Clear all fields in the character details panel"""
@@ -170,6 +214,9 @@ class CharacterDetails:
         self.bonus_var.set("0")
         self.health_var.set("")
         self.ac_var.set("")
+        self.player_var.set(False)
+        self.token_var.set("")
+        self.validator.clear()
         
         for widget in self.custom_fields_frame.winfo_children():
             widget.destroy()
@@ -196,11 +243,14 @@ class CharacterDetails:
         
     def show_template(self, template):
         """Show template data in the form"""
+        self.validator.clear()
         self.name_var.set(template.name)
         self.initiative_var.set(str(template.initiative))
         self.bonus_var.set(str(template.initiative_bonus))
         self.health_var.set(str(template.maxhp))
         self.ac_var.set(str(template.ac))
+        self.player_var.set(template.is_player)
+        self.token_var.set(template.token or "")
         
         # Clear existing custom fields
         for widget in self.custom_fields_frame.winfo_children():
@@ -214,6 +264,16 @@ class CharacterDetails:
         self.name_entry.focus()
         self.name_entry.select_range(0, tk.END)
 
+    def browse_token(self):
+        """Pick a token image file"""
+        from tkinter import filedialog
+        path = filedialog.askopenfilename(
+            title="Choose Token Image",
+            filetypes=[("Images", "*.png *.jpg *.jpeg *.gif *.webp *.bmp"), ("All files", "*.*")]
+        )
+        if path:
+            self.token_var.set(path)
+
     def add_custom_field(self, field_name=None, value=None):
         """Add a new custom field to the form"""
         frame = ttk.Frame(self.custom_fields_frame)
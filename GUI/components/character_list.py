@@ -1,5 +1,11 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
+from character.validation import FieldError, parse_name, parse_whole
+from GUI.components.token_images import LIST_TOKEN_SIZE
+
+# Width of the first column, with and without room for token images
+TOKEN_COLUMN_WIDTH = 56
+PLAIN_COLUMN_WIDTH = 20
 
 class CharacterList:
     def __init__(self, parent_frame, parent):
@@ -13,26 +19,51 @@ class CharacterList:
         self.parent_frame = parent_frame
         self.parent = parent
         self.popup_entry = None
-        self.round_counter = getattr(parent, 'round_counter', None)
+        self.engine = parent.engine
         self.suppress_selection_event = False
         
-        # Set up trace on current character if available
-        if self.round_counter and hasattr(self.round_counter, 'current_character'):
-            self.round_counter.current_character.trace_add('write', self._on_current_character_change)
-            
+        # Row bookkeeping so updates reuse existing tree items
+        self._rows = {}  # id(character) -> (character, item)
+        self._item_chars = {}  # item -> character
+        self._row_values = {}  # item -> last values written to the tree
+        self._row_groups = {}  # item -> group the row is shown under (None at the top level)
+        self._groups = {}  # group name -> parent item
+        self._group_children = {}  # parent item -> member items in initiative order
+        self._order = []  # top-level items in initiative order, including filtered ones
+        self._visible = {}  # parent ('' for the top level) -> items currently attached under it
+        self._bold_item = None
+        
+        # Token images, shown only on the rows in view
+        self.token_images = parent.app.token_images
+        self._has_tokens = False
+        self._row_images = {}  # item -> PhotoImage it shows
+        self._tokens_pending = None
+        
+        # Filter state
+        self._filter_predicate = None
+        self._filter_cache = {}  # item -> (row key, passes filter)
+        
         self.setup_character_list()
         
+        # Repaint from engine events
+        self.engine.subscribe(self._on_engine_event)
+        
     def setup_character_list(self):
         """Initialize the character list view"""
         # Character List Label
         ttk.Label(self.parent_frame, text="Characters").pack()
         
+        # Filter bar above the list
+        from GUI.components.filter_bar import FilterBar
+        self.filter_bar = FilterBar(self.parent_frame, self.set_filter)
+        
         # Create bold style for current character
         self.style = ttk.Style()
         self.style.configure('Bold.Treeview.Item', font=('TkDefaultFont', 12, 'bold'))
         
         # Create Treeview
         self.character_tree = ttk.Treeview(self.parent_frame)
+        self.character_tree.tag_configure('bold', font=('TkDefaultFont', 11, 'bold'))
 
         
         # Add vertical scrollbar
@@ -43,22 +74,24 @@ class CharacterList:
         x_scrollbar = ttk.Scrollbar(self.parent_frame, orient="horizontal", command=self.character_tree.xview)
         x_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
         
-        # Configure tree scrolling
-        self.character_tree.configure(yscrollcommand=y_scrollbar.set, xscrollcommand=x_scrollbar.set)
+        # Configure tree scrolling; scrolling also brings other rows' tokens into view
+        self.y_scrollbar = y_scrollbar
+        self.character_tree.configure(yscrollcommand=self._on_yscroll, xscrollcommand=x_scrollbar.set)
         
         # Configure tree to expand with window
         self.character_tree.pack(fill=tk.BOTH, expand=True)
         
         # Configure columns
-        self.character_tree['columns'] = ('name', 'initiative', 'bonus', 'health', 'ac', 'custom_fields')
+        self.character_tree['columns'] = ('name', 'initiative', 'bonus', 'health', 'ac', 'conditions', 'custom_fields')
         
         # Format columns with minimum widths and stretch enabled
-        self.character_tree.column('#0', width=0, stretch=tk.NO)  # Hidden ID column
+        self.character_tree.column('#0', width=PLAIN_COLUMN_WIDTH, minwidth=20, stretch=tk.NO)  # Expand/collapse for groups and tokens
         self.character_tree.column('name', anchor=tk.W, width=120, minwidth=100, stretch=tk.NO)
         self.character_tree.column('initiative', anchor=tk.CENTER, width=75, minwidth=75, stretch=tk.NO)
         self.character_tree.column('bonus', anchor=tk.CENTER, width=50, minwidth=50, stretch=tk.NO)
         self.character_tree.column('health', anchor=tk.CENTER, width=100, minwidth=100, stretch=tk.NO)
         self.character_tree.column('ac', anchor=tk.CENTER, width=40, minwidth=40, stretch=tk.NO)
+        self.character_tree.column('conditions', anchor=tk.W, width=140, minwidth=100, stretch=tk.NO)
         self.character_tree.column('custom_fields', anchor=tk.W, width=200, minwidth=150, stretch=tk.YES)
         
         # Create headings
@@ -68,6 +101,7 @@ class CharacterList:
         self.character_tree.heading('bonus', text='Bonus', anchor=tk.CENTER)
         self.character_tree.heading('health', text='Health', anchor=tk.CENTER)
         self.character_tree.heading('ac', text='AC', anchor=tk.CENTER)
+        self.character_tree.heading('conditions', text='Conditions', anchor=tk.W)
         self.character_tree.heading('custom_fields', text='Custom Fields', anchor=tk.W)
         
         # Bind double-click event
@@ -76,6 +110,12 @@ class CharacterList:
         self.character_tree.bind('<<TreeviewSelect>>', self.on_select)
         # Bind click event for empty area detection
         self.character_tree.bind('<Button-1>', self.on_click)
+        # Resizing shows more or fewer rows
+        self.character_tree.bind('<Configure>', lambda e: self._schedule_tokens())
+        self.character_tree.bind('<<TreeviewOpen>>', lambda e: self._schedule_tokens())
+        self.character_tree.bind('<<TreeviewClose>>', lambda e: self._schedule_tokens())
+        self.character_tree.bind('<Destroy>', self._on_destroy)
+        self.token_images.subscribe(self._on_tokens_ready)
         
         # Buttons Frame
         btn_frame = ttk.Frame(self.parent_frame)
@@ -118,15 +158,23 @@ class CharacterList:
         # Get column name from column number
         column_name = self.character_tree['columns'][int(column[1]) - 1]
         
+        # Group rows only edit the initiative their members share
+        if item in self._group_children:
+            if column_name in ('initiative', 'bonus'):
+                current_value = self.character_tree.item(item)['values'][int(column[1]) - 1]
+                self.start_edit(item, column, column_name, str(current_value))
+            return
+        
         # Handle special fields
         if column_name == 'custom_fields':
             self.parent.edit_custom_fields(item)
             return
+        if column_name == 'conditions':
+            # Conditions are managed from the quick edit panel
+            return
         
         # Get the character
-        items = self.character_tree.get_children()
-        char_index = items.index(item)
-        char = self.parent.characters[char_index]
+        char = self.get_character(item)
         
         # Get the current value
         current_value = self.character_tree.item(item)['values'][int(column[1]) - 1]
@@ -154,7 +202,7 @@ class CharacterList:
             return
             
         # Store current edit info
-        self.current_edit = {'item': item, 'column_name': column_name}
+        self.current_edit = {'item': item, 'column_name': column_name, 'bbox': bbox}
         
         if column_name == 'health' and max_hp is not None:
             # Create frame to hold both entry and max hp label
@@ -181,73 +229,81 @@ class CharacterList:
             # Position the entry widget
             self.popup_entry.place(x=bbox[0], y=bbox[1], width=bbox[2], height=bbox[3])
         
+        # Invalid values are explained under the cell rather than in a dialog
+        from GUI.components.inline_validator import InlineValidator
+        self.popup_status = ttk.Label(self.character_tree, text="")
+        self.popup_validator = InlineValidator(self.popup_status)
+        
         # Give focus to the entry
         self.popup_entry.focus_set()
         
         # Bind events
         self.popup_entry.bind('<Return>', lambda e: self.finish_edit())
         self.popup_entry.bind('<Escape>', lambda e: self.cancel_edit())
-        self.popup_entry.bind('<FocusOut>', lambda e: self.finish_edit())
+        # Leaving the cell with an invalid value keeps the old one
+        self.popup_entry.bind('<FocusOut>', lambda e: self.finish_edit(revert_invalid=True))
 
 
-    def finish_edit(self):
-        """Save the edited value"""
-        if not hasattr(self, 'current_edit'):
+    def finish_edit(self, revert_invalid=False):
+        """Save the edited value
+        
+        An invalid value marks the cell and keeps it open for correction, or
+        cancels the edit when revert_invalid is set.
+        """
+        if not hasattr(self, 'current_edit') or self.popup_entry is None:
             return
             
         # Get the edit info
         item = self.current_edit['item']
         column_name = self.current_edit['column_name']
         
-        # Get the character index
-        items = self.character_tree.get_children()
-        char_index = items.index(item)
-        char = self.parent.characters[char_index]
+        # Get the character; a group row edits through its first member
+        char = self.get_character(item) or self._group_leader(item)
+        if char is None:
+            self.cancel_edit()
+            return
+        
+        # Get value from popup_entry
+        new_value = self.popup_entry.get()
+        try:
+            if column_name == 'name':
+                value = parse_name(new_value)
+            elif column_name == 'initiative':
+                value = parse_whole(new_value, "Initiative")
+            elif column_name == 'bonus':
+                value = parse_whole(new_value, "Initiative bonus")
+            elif column_name == 'health':
+                value = parse_whole(new_value, "Health", 0)
+            else:
+                value = parse_whole(new_value, "AC", 0)
+        except FieldError as e:
+            if revert_invalid:
+                self.cancel_edit()
+                return
+            self.popup_validator.mark(self.popup_entry, str(e))
+            x, y, width, height = self.current_edit['bbox']
+            self.popup_status.place(x=x, y=y + height)
+            self.popup_status.lift()
+            self.popup_entry.focus_set()
+            return
         
         try:
-            # Get value from popup_entry
-            new_value = self.popup_entry.get().strip()
-            
-            # Update the character attribute based on column
+            # Update the character through the engine, which repaints the list
             if column_name == 'name':
-                char.name = new_value
+                self.engine.update_character(char, name=value)
             elif column_name == 'initiative':
-                char.initiative = int(new_value)
-                # Select this character after sorting
-                self.last_edited_name = char.name
+                self.engine.update_character(char, initiative=value)
             elif column_name == 'bonus':
-                char.initiative_bonus = int(new_value)
-                # Select this character after sorting
-                self.last_edited_name = char.name
+                self.engine.update_character(char, initiative_bonus=value)
             elif column_name == 'health':
-                try:
-                    new_health = int(new_value)
-                    if new_health < 0:
-                        raise ValueError("Health cannot be negative")
-                    # Cap health at max HP instead of showing warning
-                    char.health = min(new_health, char.maxhp)
-                except ValueError as e:
-                    messagebox.showerror("Invalid Input", str(e))
-                    self.popup_entry.focus_set()
-                    return
+                # Cap health at max HP instead of showing warning
+                self.engine.set_health(char, value)
             elif column_name == 'ac':
-                char.ac = int(new_value)
-            
-            # Update the display
-            self.parent.update_character_list()
-            
-            # If we just edited initiative, reselect the character
-            if column_name == 'initiative' and hasattr(self, 'last_edited_name'):
-                for item in self.character_tree.get_children():
-                    values = self.character_tree.item(item)['values']
-                    if values[0] == self.last_edited_name:  # Check name
-                        self.character_tree.selection_set(item)
-                        self.character_tree.see(item)  # Ensure visible
-                        break
-                delattr(self, 'last_edited_name')
+                self.engine.update_character(char, ac=value)
             
-        except ValueError as e:
-            messagebox.showerror("Error", str(e) if str(e) else f"Invalid value for {column_name}")
+            # If we just edited initiative, reselect the character after sorting
+            if column_name == 'initiative':
+                self.select_character(char)
         finally:
             self.cancel_edit()
 
@@ -256,58 +312,340 @@ class CharacterList:
         if self.popup_entry:
             self.popup_entry.destroy()
             self.popup_entry = None
+        if hasattr(self, 'popup_status'):
+            self.popup_status.destroy()
+            del self.popup_status
         if hasattr(self, 'popup_frame'):
             self.popup_frame.destroy()
             del self.popup_frame
 
 
     def update_character_list(self, characters):
-        """Update the character list display"""
-        # Clear existing items
-        for item in self.character_tree.get_children():
-            self.character_tree.delete(item)
-            
-        # Sort characters by initiative
-        sorted_chars = sorted(characters, key=lambda x: (-x.initiative, -x.initiative_bonus))
-        
-        # Get current character name
-        current_name = None
-        if self.round_counter and hasattr(self.round_counter, 'current_character'):
-            current_name = self.round_counter.current_character.get()
-        
-        # Add characters to tree
-        for char in sorted_chars:
-            # Format custom fields for display
-            custom_fields_str = ', '.join(f"{k}: {v}" for k, v in char.custom_fields.items())
+        """Update the character list display
+        
+        Characters are shown in the given order, which the engine keeps in
+        initiative order. Existing rows are reused: only rows whose values
+        changed are rewritten, rows for removed characters are deleted and new
+        characters are inserted. Grouped characters are shown under a
+        collapsible row for their group.
+        """
+        current = self.engine.current
+        
+        order = []
+        group_children = {}
+        seen = set()
+        inserted = False
+        bold_item = None
+        has_tokens = False
+        for char in characters:
+            has_tokens = has_tokens or char.token is not None
+            values = self._format_row(char)
+            row = self._rows.get(id(char))
+            if row is None:
+                item = self.character_tree.insert('', 'end', values=values)
+                self._rows[id(char)] = (char, item)
+                self._item_chars[item] = char
+                inserted = True
+            else:
+                item = row[1]
+                if self._row_values.get(item) != values:
+                    self.character_tree.item(item, values=values)
+            self._row_values[item] = values
+            self._row_groups[item] = char.group
+            seen.add(id(char))
             
-            # Insert the character
-            item = self.character_tree.insert('', 'end', values=(
-                char.name,
-                char.initiative,
-                char.initiative_bonus,
-                f"{char.health} | {char.maxhp}",
-                char.ac,
-                custom_fields_str
-            ))
+            if char.group is None:
+                row_item = item
+                order.append(item)
+            else:
+                row_item = self._groups.get(char.group)
+                if row_item is None:
+                    row_item = self.character_tree.insert('', 'end', open=False)
+                    self._groups[char.group] = row_item
+                    inserted = True
+                if row_item not in group_children:
+                    group_children[row_item] = []
+                    order.append(row_item)
+                group_children[row_item].append(item)
             
-            # Apply bold style if this is the current character
-            if current_name and char.name == current_name:
-                self.character_tree.tag_configure('bold', font=('TkDefaultFont', 11, 'bold'))
-                self.character_tree.item(item, tags=('bold',))
-
-    def _on_current_character_change(self, *args):
-        """Called when the current character changes"""
-        if hasattr(self.parent, 'characters'):
-            self.update_character_list(self.parent.characters)
+            # Remember which row belongs to the current character
+            if char is current:
+                bold_item = row_item
+        
+        # Drop rows for characters that are no longer in the list
+        stale = [key for key in self._rows if key not in seen]
+        if stale:
+            stale_items = [self._rows.pop(key)[1] for key in stale]
+            self.character_tree.delete(*stale_items)
+            for item in stale_items:
+                self._item_chars.pop(item, None)
+                self._row_values.pop(item, None)
+                self._row_groups.pop(item, None)
+                self._filter_cache.pop(item, None)
+            if self._bold_item in stale_items:
+                self._bold_item = None
+        
+        # Drop group rows with no members left, detaching any children first
+        # so members that moved out of the group aren't deleted with it
+        for group, row_item in list(self._groups.items()):
+            if row_item not in group_children:
+                self.character_tree.set_children(row_item)
+                self.character_tree.delete(row_item)
+                del self._groups[group]
+                self._row_values.pop(row_item, None)
+                if self._bold_item == row_item:
+                    self._bold_item = None
+        
+        self._group_children = group_children
+        for row_item in group_children:
+            self._refresh_group(row_item)
+        
+        self._set_bold_item(bold_item)
+        
+        self._order = order
+        # New rows are attached on insert, so the filter must always re-apply then
+        self._apply_filter(force=inserted)
+        self._set_has_tokens(has_tokens)
+
+    def refresh_characters(self, characters):
+        """Rewrite the rows of characters whose fields changed"""
+        groups = set()
+        for char in characters:
+            item = self.get_item(char)
+            if item is None:
+                continue
+            if char.token is not None and not self._has_tokens:
+                self._set_has_tokens(True)
+            if self._row_groups.get(item) != char.group:
+                # Moving between groups changes the tree's shape
+                self.update_character_list(self.engine.characters)
+                return
+            values = self._format_row(char)
+            if self._row_values.get(item) != values:
+                self.character_tree.item(item, values=values)
+                self._row_values[item] = values
+            if char.group is not None:
+                groups.add(self._groups[char.group])
+        for row_item in groups:
+            self._refresh_group(row_item)
+        self._apply_filter()
+        self._schedule_tokens()
+
+    def _refresh_group(self, row_item):
+        """Rewrite a group row from its members"""
+        members = [self._item_chars[item] for item in self._group_children[row_item]]
+        values = self._format_group(members)
+        if self._row_values.get(row_item) != values:
+            self.character_tree.item(row_item, values=values)
+            self._row_values[row_item] = values
+
+    def _group_leader(self, item):
+        """Get the first member of a group row"""
+        children = self._group_children.get(item)
+        return self._item_chars[children[0]] if children else None
+
+    def _turn_item(self, char):
+        """Get the top-level row that represents a character's turn"""
+        if char.group is not None and char.group in self._groups:
+            return self._groups[char.group]
+        return self.get_item(char)
+
+    def _set_bold_item(self, bold_item):
+        """Move the bold tag only if the current character changed rows"""
+        if bold_item != self._bold_item:
+            if self._bold_item is not None:
+                self.character_tree.item(self._bold_item, tags=())
+            if bold_item is not None:
+                self.character_tree.item(bold_item, tags=('bold',))
+            self._bold_item = bold_item
+
+    def _format_row(self, char):
+        """Build the tree values for a character"""
+        # Format custom fields for display
+        custom_fields_str = ', '.join(f"{k}: {v}" for k, v in char.custom_fields.items())
+        return (
+            char.name,
+            char.initiative,
+            char.initiative_bonus,
+            f"{char.health} | {char.maxhp}",
+            char.ac,
+            ', '.join(condition.name for condition in char.conditions),
+            custom_fields_str
+        )
+
+    def _format_group(self, members):
+        """Build the tree values for a group row"""
+        leader = members[0]
+        standing = sum(1 for char in members if char.health > 0)
+        return (
+            f"{leader.group} ({standing}/{len(members)})",
+            leader.initiative,
+            leader.initiative_bonus,
+            f"{sum(char.health for char in members)} | {sum(char.maxhp for char in members)}",
+            leader.ac,
+            '',
+            ''
+        )
+
+    def _set_has_tokens(self, has_tokens):
+        """Make room for token images while anyone has one, and show them"""
+        if has_tokens != self._has_tokens:
+            self._has_tokens = has_tokens
+            self.character_tree.column('#0', width=TOKEN_COLUMN_WIDTH if has_tokens else PLAIN_COLUMN_WIDTH)
+        self._schedule_tokens()
+
+    def _on_yscroll(self, first, last):
+        """Move the scrollbar and show the tokens of the rows scrolled into view"""
+        self.y_scrollbar.set(first, last)
+        self._schedule_tokens()
+
+    def _on_tokens_ready(self, sources):
+        """Show thumbnails that finished while their rows were waiting"""
+        self._schedule_tokens()
+
+    def _on_destroy(self, event):
+        if event.widget is self.character_tree:
+            self.token_images.unsubscribe(self._on_tokens_ready)
+
+    def _schedule_tokens(self):
+        """Update the shown tokens once the tree is idle, however many changes came first"""
+        if self._tokens_pending is None and (self._has_tokens or self._row_images):
+            self._tokens_pending = self.character_tree.after_idle(self._show_tokens)
+
+    def _visible_items(self):
+        """Get the rows currently in view, top to bottom"""
+        tree = self.character_tree
+        height = tree.winfo_height()
+        items = []
+        y = 0
+        while y < height:
+            item = tree.identify_row(y)
+            bbox = tree.bbox(item) if item else None
+            if not bbox:
+                if items:
+                    break
+                y += 4  # Still in the heading
+                continue
+            items.append(item)
+            y = bbox[1] + bbox[3]
+        return items
+
+    def _show_tokens(self):
+        """Give the rows in view their token images and take them from the others
+        
+        Only rows in view hold images, so a long roster keeps a screenful of
+        thumbnails alive and the rest can leave the token cache.
+        """
+        self._tokens_pending = None
+        tree = self.character_tree
+        shown = {}
+        if self._has_tokens:
+            for item in self._visible_items():
+                char = self._item_chars.get(item) or self._group_leader(item)
+                if char is not None and char.token is not None:
+                    image = self.token_images.get(char.token, LIST_TOKEN_SIZE)
+                    if image is not None:
+                        shown[item] = image
+        for item in self._row_images.keys() - shown.keys():
+            if tree.exists(item):
+                tree.item(item, image='')
+        for item, image in shown.items():
+            if self._row_images.get(item) is not image:
+                tree.item(item, image=image)
+        self._row_images = shown
+
+    def set_filter(self, predicate):
+        """Show only characters matching the predicate (None shows everyone)"""
+        self._filter_predicate = predicate
+        self._filter_cache.clear()
+        self._apply_filter()
+        self._schedule_tokens()
+
+    def _passes_filter(self, item):
+        """Check a character row against the filter, re-evaluating only changed rows"""
+        char = self._item_chars[item]
+        key = (self._row_values[item], char.is_player)
+        cached = self._filter_cache.get(item)
+        if cached is None or cached[0] != key:
+            cached = (key, bool(self._filter_predicate(char)))
+            self._filter_cache[item] = cached
+        return cached[1]
+
+    def _apply_filter(self, force=False):
+        """Detach rows that fail the filter and reattach rows that pass it
+        
+        Predicate results are cached per row and only re-evaluated when the
+        row's data changed, so re-filtering after an edit touches one character.
+        A group row stays visible while any of its members pass.
+        """
+        filtering = self._filter_predicate is not None
+        visible = {}
+        top = []
+        for item in self._order:
+            children = self._group_children.get(item)
+            if children is None:
+                if not filtering or self._passes_filter(item):
+                    top.append(item)
+            else:
+                shown = [child for child in children if self._passes_filter(child)] if filtering else children
+                visible[item] = shown
+                if shown:
+                    top.append(item)
+        visible[''] = top
+        
+        # A single set_children call per parent reorders, detaches and reattaches rows
+        for parent, items in visible.items():
+            if force or self._visible.get(parent) != items:
+                self.character_tree.set_children(parent, *items)
+        self._visible = visible
+
+    def get_character(self, item):
+        """Get the character shown in a tree item"""
+        return self._item_chars.get(item)
+
+    def select_character(self, char):
+        """Select and scroll to a character's row if it passes the current filter"""
+        item = self.get_item(char)
+        if item is None:
+            return False
+        parent = self._groups.get(char.group, '') if char.group is not None else ''
+        if item not in self._visible.get(parent, ()) or (parent and parent not in self._visible.get('', ())):
+            return False
+        self.character_tree.selection_set(item)
+        self.character_tree.see(item)  # Ensure visible
+        return True
+
+    def get_item(self, char):
+        """Get the tree item showing a character, whether or not it is filtered out"""
+        row = self._rows.get(id(char))
+        return row[1] if row else None
+
+    def _on_engine_event(self, event, data):
+        """Repaint only what the engine reports as changed"""
+        if event == 'turn':
+            self._set_bold_item(self._turn_item(data) if data is not None else None)
+        elif event == 'changed':
+            self.refresh_characters(data)
+        elif event in ('added', 'removed', 'reordered', 'reset'):
+            self.update_character_list(self.engine.characters)
     
     def get_selected_character(self):
         """Get the currently selected character"""
         selected = self.character_tree.selection()
         if not selected:
             return None
-        items = self.character_tree.get_children()
-        char_index = items.index(selected[0])
-        return self.parent.characters[char_index]
+        return self.get_character(selected[0])
+        
+    def get_selected_characters(self):
+        """Get every selected character, in list order; a selected group counts as all its members"""
+        chars = []
+        for item in self.character_tree.selection():
+            if item in self._group_children:
+                chars.extend(self._item_chars[child] for child in self._group_children[item])
+            elif item in self._item_chars:
+                chars.append(self._item_chars[item])
+        # A member may be selected along with its group
+        return list({id(char): char for char in chars}.values())
         
     def on_select(self, event):
         """Handle selection of a character"""
@@ -0,0 +1,261 @@
+import tkinter as tk
+from tkinter import ttk
+from character.validation import FieldError, parse_amount
+from combat.search_index import SearchIndex
+from GUI.components.inline_validator import InlineValidator
+
+DAMAGE_WORDS = {'d', 'dmg', 'damage'}
+HEAL_WORDS = {'h', 'heal'}
+MAX_RESULTS = 10
+
+class CommandPalette:
+    def __init__(self, root, app, actions):
+        """
+        Initialize the command palette
+
+        Typing a name fuzzy-matches combatants (select them), templates (add
+        one to the encounter), encounter presets (spawn them) and commands
+        (run them). 'd AMOUNT [NAME]' and
+        'h AMOUNT [NAME]' damage or heal, the current combatant when no name
+        is given; AMOUNT may be a dice expression.
+
+        The names are indexed once and only re-indexed after the roster or
+        the template library changes, so each keystroke just queries.
+
+        Args:
+            root: The root window
+            app: The main GUI
+            actions: (label, shortcut, callback) tuples to offer
+        """
+        self.root = root
+        self.app = app
+        self.actions = actions
+        self.index = SearchIndex()
+        self.matches = []  # (text shown, callback) for the listed results
+        self._engine = None
+        self._names = {}  # id(character) -> indexed name
+        self._dirty = True
+
+        self.app.template_store.subscribe(self._on_library_event)
+        self.setup_window()
+
+    def setup_window(self):
+        """Create the hidden palette window"""
+        self.window = tk.Toplevel(self.root)
+        self.window.title("Command Palette")
+        self.window.transient(self.root)
+        self.window.withdraw()
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        frame = ttk.Frame(self.window, padding="8")
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        self.query_var = tk.StringVar()
+        self.entry = ttk.Entry(frame, textvariable=self.query_var, width=48)
+        self.entry.pack(fill=tk.X)
+        self.query_var.trace_add('write', lambda *args: self.update_results())
+
+        self.results = tk.Listbox(frame, height=MAX_RESULTS, exportselection=False, activestyle='none')
+        self.results.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+        self.results.bind('<Double-Button-1>', lambda e: self.execute())
+
+        self.status_label = ttk.Label(frame, text="")
+        self.status_label.pack(anchor=tk.W)
+        self.validator = InlineValidator(self.status_label)
+
+        self.entry.bind('<Return>', lambda e: self.execute())
+        self.entry.bind('<Escape>', lambda e: self.close())
+        self.entry.bind('<Down>', lambda e: self._move(1))
+        self.entry.bind('<Up>', lambda e: self._move(-1))
+
+    def open(self, text=""):
+        """Show the palette with the given text typed"""
+        self._sync()
+        self.validator.clear()
+        self.query_var.set(text)
+        self.entry.icursor(tk.END)
+
+        # Near the top of the main window, like an editor's palette
+        self.root.update_idletasks()
+        x = self.root.winfo_rootx() + (self.root.winfo_width() - self.window.winfo_reqwidth()) // 2
+        y = self.root.winfo_rooty() + 60
+        self.window.geometry(f"+{max(x, 0)}+{max(y, 0)}")
+        self.window.deiconify()
+        self.window.lift()
+        self.entry.focus_set()
+
+    def close(self):
+        """Hide the palette and give focus back to the main window"""
+        self.window.withdraw()
+        self.root.focus_set()
+
+    # Index
+
+    def _on_engine_event(self, event, data):
+        if event in ('added', 'removed', 'reset'):
+            self._dirty = True
+        elif event == 'changed':
+            # Health changes are frequent; only a rename needs re-indexing
+            if any(self._names.get(id(char)) != char.name for char in data):
+                self._dirty = True
+
+    def _on_library_event(self, event, data):
+        self._dirty = True
+
+    def _sync(self):
+        """Follow the selected encounter and re-index if anything changed"""
+        engine = self.app.engine
+        if engine is not self._engine:
+            if self._engine is not None:
+                self._engine.unsubscribe(self._on_engine_event)
+            engine.subscribe(self._on_engine_event)
+            self._engine = engine
+            self._dirty = True
+        if self._dirty:
+            self.rebuild_index()
+
+    def rebuild_index(self):
+        """Index the commands, the encounter's combatants and the templates"""
+        index = SearchIndex()
+        for label, shortcut, callback in self.actions:
+            index.add(label, 'action', (shortcut, callback))
+        for char in self._engine.characters:
+            index.add(char.name, 'combatant', char, [char.group] if char.group else ())
+        for template in self.app.template_store.ensure_loaded():
+            index.add(template.name, 'template', template)
+        for preset in self.app.template_store.presets:
+            index.add(preset.name, 'preset', preset)
+        self.index = index
+        self._names = {id(char): char.name for char in self._engine.characters}
+        self._dirty = False
+
+    # Results
+
+    def _parse(self, text):
+        """Split 'd AMOUNT NAME' / 'h AMOUNT NAME' into (verb, amount, name)"""
+        words = text.split(None, 2)
+        if len(words) >= 2 or (words and text.endswith(' ')):
+            verb = words[0].lower()
+            if verb in DAMAGE_WORDS or verb in HEAL_WORDS:
+                amount = words[1] if len(words) > 1 else ''
+                name = words[2] if len(words) > 2 else ''
+                return ('damage' if verb in DAMAGE_WORDS else 'heal'), amount, name
+        return None, '', text
+
+    def _default_target(self):
+        """The combatant whose turn it is, or else the selected one"""
+        engine = self._engine
+        if engine.current is not None:
+            return engine.current
+        return self.app.encounter.character_list.get_selected_character()
+
+    def update_results(self):
+        """List the matches for the typed text"""
+        if self._dirty:
+            self.rebuild_index()
+        self.validator.clear()
+        verb, amount, name = self._parse(self.query_var.get())
+        matches = []
+        if verb is not None:
+            if name.strip():
+                targets = [entry.value for score, entry in self.index.search(name, MAX_RESULTS, ('combatant',))]
+            else:
+                target = self._default_target()
+                targets = [target] if target is not None else []
+            shown = amount or '...'
+            for char in targets:
+                text = f"{verb.capitalize()} {char.name} by {shown}   ({char.health}/{char.maxhp} HP)"
+                matches.append((text, lambda c=char: self._change_health(verb, c, amount)))
+        elif name.strip():
+            for score, entry in self.index.search(name, MAX_RESULTS):
+                if entry.kind == 'combatant':
+                    char = entry.value
+                    text = f"{char.name}   ({char.health}/{char.maxhp} HP)"
+                    matches.append((text, lambda c=char: self._select(c)))
+                elif entry.kind == 'template':
+                    matches.append((f"Add {entry.label} from templates",
+                                    lambda t=entry.value: self._spawn(t)))
+                elif entry.kind == 'preset':
+                    matches.append((f"Spawn {entry.label} ({entry.value.describe()})",
+                                    lambda p=entry.value: self._spawn_preset(p)))
+                else:
+                    shortcut, callback = entry.value
+                    text = f"{entry.label}   [{shortcut}]" if shortcut else entry.label
+                    matches.append((text, callback))
+        else:
+            matches = [(f"{label}   [{shortcut}]" if shortcut else label, callback)
+                       for label, shortcut, callback in self.actions]
+
+        self.matches = matches
+        self.results.delete(0, tk.END)
+        for text, callback in matches:
+            self.results.insert(tk.END, text)
+        if matches:
+            self.results.selection_set(0)
+
+    def _move(self, step):
+        """Move the highlighted result without leaving the entry"""
+        if not self.matches:
+            return 'break'
+        selection = self.results.curselection()
+        current = selection[0] if selection else 0
+        new = max(0, min(current + step, len(self.matches) - 1))
+        self.results.selection_clear(0, tk.END)
+        self.results.selection_set(new)
+        self.results.see(new)
+        return 'break'
+
+    def execute(self):
+        """Run the highlighted result"""
+        selection = self.results.curselection()
+        if not self.matches:
+            return
+        text, callback = self.matches[selection[0] if selection else 0]
+        if callback() is False:
+            return  # Keep the palette open to fix the input
+        self.close()
+
+    # Commands
+
+    def _change_health(self, verb, char, amount_text):
+        """Damage or heal a combatant, marking the entry if the amount is invalid"""
+        try:
+            amount = parse_amount(amount_text, char)
+        except FieldError as e:
+            self.validator.mark(self.entry, str(e))
+            return False
+        if verb == 'damage':
+            self._engine.damage(char, amount)
+        else:
+            self._engine.heal(char, amount)
+        return True
+
+    def _select(self, char):
+        """Select a combatant in the list, which shows them in quick edit"""
+        if not self.app.encounter.character_list.select_character(char):
+            self.validator.mark(self.entry, f"{char.name} is hidden by the list filter")
+            return False
+        return True
+
+    def _spawn(self, template):
+        """Add one copy of a template, numbering the name if it is taken"""
+        existing = {char.name for char in self._engine.characters}
+        name = template.name
+        number = 1
+        while name in existing:
+            name = f"{template.name} {number}"
+            number += 1
+        char = template.copy()
+        char.name = name
+        self._engine.add_character(char)
+        return True
+
+    def _spawn_preset(self, preset):
+        """Add every creature in an encounter preset in one batch"""
+        from character.preset import PresetError, spawn
+        try:
+            spawn(self._engine, preset, self.app.template_store.find, self.app.initiative_formula)
+        except PresetError as e:
+            self.validator.mark(self.entry, str(e))
+            return False
+        return True
@@ -128,8 +128,8 @@ class CustomFieldsDialog:
             if field_name:  # Only add if field name is not empty
                 self.character.custom_fields[field_name] = value_entry.get()
         
-        # Update the display with main GUI's character list
-        self.character_list.update_character_list(self.main_gui.characters)
+        # Notify the engine so the character list repaints
+        self.main_gui.engine.character_changed(self.character)
         
         # Close the dialog
         self.dialog.destroy()
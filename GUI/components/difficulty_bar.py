@@ -0,0 +1,68 @@
+import tkinter as tk
+from tkinter import ttk
+
+# The bar is full at this multiple of the deadly threshold
+BAR_SCALE = 1.5
+
+class DifficultyBar:
+    def __init__(self, parent, meter=None):
+        """
+        Initialize a live encounter difficulty readout
+
+        Args:
+            parent: Frame to place the bar in
+            meter: DifficultyMeter to follow; can be set later with set_meter
+        """
+        self.meter = None
+        self.preview = ()
+
+        self.frame = ttk.Frame(parent)
+        self.frame.pack(fill=tk.X, padx=5, pady=(0, 5))
+
+        self.text_var = tk.StringVar()
+        ttk.Label(self.frame, textvariable=self.text_var, anchor=tk.W).pack(fill=tk.X)
+        self.bar = ttk.Progressbar(self.frame, mode='determinate')
+        self.bar.pack(fill=tk.X)
+        self.frame.bind("<Destroy>", self._on_destroy)
+
+        if meter is not None:
+            self.set_meter(meter)
+
+    def set_meter(self, meter):
+        """Follow another encounter's meter"""
+        if meter is self.meter:
+            return
+        if self.meter is not None:
+            self.meter.unsubscribe(self._on_rating)
+        self.meter = meter
+        meter.subscribe(self._on_rating)
+        self.refresh()
+
+    def set_preview(self, characters):
+        """Also show the difficulty as if these characters were added"""
+        self.preview = list(characters)
+        self.refresh()
+
+    def _on_rating(self, rating):
+        self.refresh()
+
+    def refresh(self):
+        """Show the meter's current totals"""
+        from combat.difficulty import describe
+        if self.meter is None:
+            return
+        rating = self.meter.rating()
+        text = describe(rating)
+        if self.preview:
+            after = self.meter.rating(self.preview)
+            text += f"\nWith selection: {describe(after)}"
+            rating = after
+        self.text_var.set(text)
+        deadly = rating.thresholds[-1]
+        self.bar.configure(maximum=max(deadly * BAR_SCALE, 1), value=min(rating.adjusted_xp, deadly * BAR_SCALE))
+
+    def _on_destroy(self, event):
+        # Stop following the meter however the window goes away
+        if event.widget is self.frame and self.meter is not None:
+            self.meter.unsubscribe(self._on_rating)
+            self.meter = None
@@ -0,0 +1,248 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+from typing import List
+from character.character import Character
+from combat.engine import CombatEngine
+from GUI.components.session_manager import SessionManager
+
+class Encounter:
+    def __init__(self, app, name, session_path=None, state_path=None, mass_battle=False):
+        """
+        Initialize an encounter tab with its own roster, turn state and session file
+        
+        Args:
+            app: The main GUI, which owns the notebook and shared state
+            name: Name shown on the tab
+            session_path: File the encounter is auto-saved to and restored from
+            state_path: File recording whether the encounter is still in combat
+            mass_battle: Show the roster in the canvas list built for thousands of rows
+        """
+        self.app = app
+        self.root = app.root
+        self.name = name
+        self.engine = CombatEngine()
+        self.mass_battle = mass_battle
+        
+        # Running difficulty totals, kept up to date from roster events
+        from combat.difficulty import DifficultyMeter
+        self.difficulty = DifficultyMeter(self.engine)
+        
+        # Turn-by-turn recording of each combat for the replay viewer
+        from combat.replay import ReplayRecorder
+        self.recorder = ReplayRecorder(self.engine, name)
+        
+        # Start-of-round checkpoints for the Rewind button
+        from combat.checkpoints import RoundCheckpoints
+        self.checkpoints = RoundCheckpoints(self.engine)
+        
+        # Lay out the tab
+        self.tab, self.character_list_frame, self.character_detail_frame = app.app_config.create_encounter_frames()
+        app.notebook.add(self.tab, text=name)
+        
+        # Initialize UI
+        self.setup_round_counter()
+        self.setup_difficulty_bar()
+        self.setup_character_list()
+        self.setup_character_details()
+        
+        # Initialize session manager
+        self.session_manager = SessionManager(self, session_path, state_path, app.archive)
+
+    @property
+    def characters(self) -> List[Character]:
+        """The engine's roster, in initiative order"""
+        return self.engine.characters
+
+    def rename(self, name):
+        """Change the name shown on the tab"""
+        self.name = name
+        self.recorder.name = name
+        self.app.notebook.tab(self.tab, text=name)
+
+    def to_dict(self) -> dict:
+        """Describe the tab for the list of open encounters"""
+        return {
+            'name': self.name,
+            'session_path': self.session_manager.session_path,
+            'state_path': self.session_manager.state_path,
+            'mass_battle': self.mass_battle
+        }
+
+    def setup_round_counter(self):
+        """Initialize the round counter"""
+        from GUI.components.round_counter import RoundCounter
+        self.round_counter = RoundCounter(self.character_list_frame, self.engine, gui_ref=self,
+                                         checkpoints=self.checkpoints)
+
+    def setup_difficulty_bar(self):
+        """Initialize the live difficulty readout under the round counter"""
+        from GUI.components.difficulty_bar import DifficultyBar
+        self.difficulty_bar = DifficultyBar(self.character_list_frame, self.difficulty)
+
+    def setup_character_list(self):
+        """Initialize the character list view"""
+        # The list gets its own frame so it can be swapped without touching the round counter
+        self.list_container = ttk.Frame(self.character_list_frame)
+        self.list_container.pack(fill=tk.BOTH, expand=True)
+        if self.mass_battle:
+            from GUI.components.canvas_character_list import CanvasCharacterList
+            self.character_list = CanvasCharacterList(self.list_container, self)
+        else:
+            from GUI.components.character_list import CharacterList
+            self.character_list = CharacterList(self.list_container, self)
+
+    def set_mass_battle(self, enabled):
+        """Switch between the tree list and the canvas list for very large rosters"""
+        if enabled == self.mass_battle:
+            return
+        self.engine.unsubscribe(self.character_list._on_engine_event)
+        self.list_container.destroy()
+        self.mass_battle = enabled
+        self.setup_character_list()
+        self.character_list.update_character_list(self.characters)
+        self.on_character_selected(None)
+
+    def edit_custom_fields(self, item):
+        """Open a dialog to edit custom fields"""
+        # Get the character
+        char = self.character_list.get_character(item)
+        if char is None:
+            return
+        
+        # Create and show the dialog
+        from GUI.components.custom_fields_dialog import CustomFieldsDialog
+        CustomFieldsDialog(self.root, char, self.character_list, self)
+
+    def setup_character_details(self):
+        """Initialize the character details panel"""
+        # Create a frame for character details
+        self.details_frame = ttk.Frame(self.character_detail_frame)
+        self.details_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Create a frame for quick edit
+        self.quick_edit_frame = ttk.Frame(self.character_detail_frame)
+        
+        # Initialize the details panel; quick edit is built on first selection
+        from GUI.components.character_details import CharacterDetails
+        self.character_details = CharacterDetails(self.details_frame, self)
+        self.quick_edit = None
+        
+        # Start with character details visible
+        self.show_character_details()
+
+    def add_character(self, char=None):
+        """Add a character to the encounter
+        
+        Args:
+            char: Optional Character instance. If not provided, creates a new character
+                 using the character details panel.
+        """
+        if char is None:
+            # Proxy to character details panel for backward compatibility
+            self.character_details.add_character()
+        else:
+            # Add provided character to the roster
+            self.engine.add_character(char)
+
+    def clear_character_details(self):
+        """Proxy method to maintain backward compatibility"""
+        self.character_details.clear_character_details()
+
+    def update_character_list(self):
+        """Re-sort the roster and redraw the whole character list"""
+        self.engine.sort()
+        self.character_list.update_character_list(self.characters)
+
+    def copy_character(self):
+        char = self.character_list.get_selected_character()
+        if char is None:
+            messagebox.showwarning("Warning", "Please select a character to copy")
+            return
+        
+        def on_copy_complete(new_char):
+            self.engine.add_character(new_char)
+        
+        # Create and show the dialog
+        from GUI.components.copy_character_dialog import CopyCharacterDialog
+        CopyCharacterDialog(self.root, char, self.characters, on_copy_complete)
+
+    def roll_initiative(self, selected_only=False):
+        """Roll initiative for everyone, or only the selected characters
+        
+        Args:
+            selected_only: Roll only for the characters selected in the list
+        """
+        if selected_only:
+            chars = self.character_list.get_selected_characters()
+            if not chars:
+                messagebox.showwarning("Warning", "Please select the characters to roll for")
+                return
+        else:
+            chars = self.characters
+        
+        from combat.dice import DiceError
+        try:
+            # One batch: a single sort and repaint however many are rolled
+            self.engine.roll_initiative(chars, self.app.initiative_formula)
+        except DiceError as e:
+            messagebox.showerror("Invalid Formula", str(e))
+
+    def bulk_edit(self):
+        """Edit the selected characters, or everyone, in a spreadsheet-style grid"""
+        chars = self.character_list.get_selected_characters()
+        if len(chars) < 2:
+            chars = self.characters
+        if not chars:
+            messagebox.showwarning("Warning", "There are no characters to edit")
+            return
+        
+        from GUI.components.bulk_edit_window import BulkEditWindow
+        BulkEditWindow(self.root, self.engine, chars)
+
+    def delete_character(self):
+        char = self.character_list.get_selected_character()
+        if char is None:
+            messagebox.showwarning("Warning", "Please select a character to delete")
+            return
+        
+        # The engine passes the turn on if it was the deleted character's
+        self.engine.remove_character(char)
+
+    def end_combat(self):
+        """End the current combat, clearing all characters and preventing auto-load"""
+        if messagebox.askyesno("End Combat", "Are you sure you want to end combat?\nIt will be kept in the campaign archive, and all characters removed."):
+            # Close the replay with the final state before the roster is cleared
+            self.recorder.finish()
+            self.session_manager.end_combat()
+
+    def add_custom_field(self, field_name=None, value=None):
+        """Proxy method to maintain backward compatibility"""
+        return self.character_details.add_custom_field(field_name, value)
+
+    def show_character_details(self):
+        """Show the character details panel"""
+        self.quick_edit_frame.pack_forget()
+        self.details_frame.pack(fill=tk.BOTH, expand=True)
+
+    def show_quick_edit(self):
+        """Show the quick edit panel"""
+        if self.quick_edit is None:
+            from GUI.components.quick_edit import QuickEdit
+            self.quick_edit = QuickEdit(self.quick_edit_frame, self)
+        self.details_frame.pack_forget()
+        self.quick_edit_frame.pack(fill=tk.BOTH, expand=True)
+
+    def on_character_selected(self, character):
+        """Handle character selection"""
+        if character:
+            self.show_quick_edit()
+            self.quick_edit.show_character(character)
+        else:
+            self.show_character_details()
+
+    def destroy(self):
+        """Remove the tab and its widgets"""
+        self.recorder.finish()
+        self.difficulty.close()
+        self.app.notebook.forget(self.tab)
+        self.tab.destroy()
@@ -0,0 +1,71 @@
+import tkinter as tk
+from tkinter import ttk
+
+class FilterBar:
+    # Preset filters shown in the dropdown, mapped to their predicates
+    PRESETS = {
+        "All": None,
+        "Bloodied": lambda char: char.health * 2 <= char.maxhp,
+        "Down": lambda char: char.health <= 0,
+        "Players": lambda char: char.is_player,
+        "Monsters": lambda char: not char.is_player,
+    }
+
+    def __init__(self, parent_frame, on_filter_changed):
+        """
+        Initialize the filter bar
+
+        Args:
+            parent_frame: Frame to place the filter bar in
+            on_filter_changed: Callback taking the new predicate (or None to show everything)
+        """
+        self.parent_frame = parent_frame
+        self.on_filter_changed = on_filter_changed
+        self.setup_filter_bar()
+
+    def setup_filter_bar(self):
+        """Create the preset dropdown and name search entry"""
+        self.frame = ttk.Frame(self.parent_frame)
+        self.frame.pack(fill=tk.X, pady=(0, 5))
+
+        # Preset dropdown
+        ttk.Label(self.frame, text="Show:").pack(side=tk.LEFT, padx=(0, 5))
+        self.preset_var = tk.StringVar(value="All")
+        self.preset_combo = ttk.Combobox(self.frame, textvariable=self.preset_var,
+                                         values=list(self.PRESETS), state="readonly", width=10)
+        self.preset_combo.pack(side=tk.LEFT, padx=(0, 10))
+
+        # Name substring search
+        ttk.Label(self.frame, text="Name:").pack(side=tk.LEFT, padx=(0, 5))
+        self.name_var = tk.StringVar()
+        self.name_entry = ttk.Entry(self.frame, textvariable=self.name_var)
+        self.name_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.name_entry.bind('<Escape>', lambda e: self.clear())
+
+        ttk.Button(self.frame, text="Clear", command=self.clear).pack(side=tk.LEFT, padx=(5, 0))
+
+        # Re-filter whenever either control changes
+        self.preset_var.trace_add('write', self._notify)
+        self.name_var.trace_add('write', self._notify)
+
+    def build_predicate(self):
+        """Combine the preset and name search into a single predicate"""
+        preset = self.PRESETS.get(self.preset_var.get())
+        needle = self.name_var.get().strip().lower()
+
+        if preset is None and not needle:
+            return None
+        if not needle:
+            return preset
+        if preset is None:
+            return lambda char: needle in char.name.lower()
+        return lambda char: needle in char.name.lower() and preset(char)
+
+    def clear(self):
+        """Reset the filter to show all characters"""
+        self.name_var.set("")
+        self.preset_var.set("All")
+
+    def _notify(self, *args):
+        """Called when the preset or search text changes"""
+        self.on_filter_changed(self.build_predicate())
@@ -1,5 +1,7 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
+from character.validation import check_health, FieldError, parse_whole
+from GUI.components.inline_validator import InlineValidator
 
 class HealthEditDialog:
     def center_on_parent(self, parent):
@@ -40,7 +42,7 @@ class HealthEditDialog:
         self.dialog.transient(parent)
         
         # Set dialog size
-        self.dialog.geometry("250x150")
+        self.dialog.geometry("250x170")
         self.dialog.resizable(False, False)
         
         # Configure grid
@@ -77,9 +79,14 @@ class HealthEditDialog:
         self.max_hp_entry = ttk.Entry(main_frame, textvariable=self.max_hp_var, width=8)
         self.max_hp_entry.grid(row=1, column=1, sticky='w')
         
+        # Explains invalid values without another dialog
+        self.status_label = ttk.Label(main_frame, text="", wraplength=220)
+        self.status_label.grid(row=2, column=0, columnspan=2, sticky='w')
+        self.validator = InlineValidator(self.status_label)
+        
         # Buttons
         button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=2, column=0, columnspan=2, pady=(5, 0))
+        button_frame.grid(row=3, column=0, columnspan=2, pady=(5, 0))
         
         ttk.Button(button_frame, text="Save", command=self.save_changes).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Cancel", command=self.dialog.destroy).pack(side=tk.LEFT, padx=5)
@@ -94,26 +101,23 @@ class HealthEditDialog:
         
     def save_changes(self):
         """Save the changes to the character"""
+        validator = self.validator
+        current = validator.parse(self.current_hp_entry, parse_whole, "Current HP", 0)
+        maximum = validator.parse(self.max_hp_entry, parse_whole, "Max HP", 0)
+        if not validator.valid:
+            return
         try:
-            current = int(self.current_hp_var.get())
-            maximum = int(self.max_hp_var.get())
-            
-            # Validate values
-            if current < 0 or maximum < 0:
-                raise ValueError("Health values cannot be negative")
-            if current > maximum:
-                raise ValueError("Current HP cannot exceed Max HP")
-                
-            # Update character
-            self.character.health = current
-            self.character.maxhp = maximum
-            
-            # Call completion callback
-            self.on_edit_complete()
+            check_health(current, maximum)
+        except FieldError as e:
+            validator.mark(self.current_hp_entry, str(e))
+            return
             
-            # Close dialog
-            self.dialog.destroy()
-            
-        except ValueError as e:
-            messagebox.showerror("Error", str(e) if str(e) != "invalid literal for int() with base 10" 
-                               else "Please enter valid numbers for health values")
+        # Update character
+        self.character.health = current
+        self.character.maxhp = maximum
+        
+        # Call completion callback
+        self.on_edit_complete()
+        
+        # Close dialog
+        self.dialog.destroy()
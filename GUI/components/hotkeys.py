@@ -0,0 +1,84 @@
+import tkinter as tk
+
+# Widgets where a plain key is typing rather than a command
+TEXT_CLASSES = {'Entry', 'TEntry', 'Text', 'Spinbox', 'TSpinbox', 'TCombobox'}
+
+class Hotkeys:
+    def __init__(self, root, app):
+        """
+        Bind the main window's keyboard shortcuts
+
+        Plain keys only act when no text field has focus, so typing a name
+        never advances the turn.
+
+            N / P         next / previous turn
+            D / H         damage / heal the current combatant
+            /             jump to a combatant by name
+            Ctrl+K        command palette (Ctrl+Shift+K from a text field)
+
+        Args:
+            root: The root window
+            app: The main GUI
+        """
+        self.root = root
+        self.app = app
+        self.palette = None
+
+        bindings = (
+            ('<Control-k>', self.open_palette, True),
+            ('<Control-K>', self.open_palette, False),
+            ('<slash>', self.open_palette, True),
+            ('<Key-n>', self.next_turn, True),
+            ('<Key-p>', self.previous_turn, True),
+            ('<Key-d>', lambda: self.open_palette('d '), True),
+            ('<Key-h>', lambda: self.open_palette('h '), True),
+        )
+        for sequence, command, guarded in bindings:
+            root.bind(sequence, lambda e, c=command, g=guarded: self._run(e, c, g))
+
+    def _run(self, event, command, guarded):
+        if guarded and isinstance(event.widget, tk.Misc) and event.widget.winfo_class() in TEXT_CLASSES:
+            return None
+        command()
+        return 'break'
+
+    def actions(self):
+        """
+        Commands offered by the palette
+
+        Returns:
+            (label, shortcut, callback) tuples
+        """
+        app = self.app
+        return [
+            ('Next Turn', 'N', self.next_turn),
+            ('Previous Turn', 'P', self.previous_turn),
+            ('Start Combat', '', lambda: app.encounter.round_counter.start_combat()),
+            ('Roll Initiative for All', '', lambda: app.roll_initiative()),
+            ('Roll Initiative for Selected', '', lambda: app.roll_initiative(selected_only=True)),
+            ('Bulk Edit...', '', lambda: app.encounter.bulk_edit()),
+            ('New Encounter', '', app.new_encounter),
+            ('Save Session', '', app.save_session),
+            ('Templates...', '', app.menu_bar.show_templates),
+            ('Pacing Statistics...', '', app.menu_bar.show_pacing_stats),
+            ('Simulate Encounter...', '', app.menu_bar.show_simulator),
+        ]
+
+    def open_palette(self, text=""):
+        """Show the command palette, optionally with text already typed"""
+        if self.palette is None:
+            from GUI.components.command_palette import CommandPalette
+            self.palette = CommandPalette(self.root, self.app, self.actions())
+        self.palette.open(text)
+
+    def next_turn(self):
+        """Advance the turn in the selected encounter once combat has started"""
+        engine = self.app.engine
+        if engine.combat_started:
+            engine.next_turn()
+
+    def previous_turn(self):
+        """Go back a turn in the selected encounter once combat has started"""
+        engine = self.app.engine
+        if engine.combat_started:
+            engine.previous_turn()
@@ -0,0 +1,81 @@
+import tkinter as tk
+from tkinter import ttk
+from character.validation import FieldError
+
+class InlineValidator:
+    """Marks invalid entries and explains them in a status label.
+
+    Replaces a messagebox per mistake: every invalid field of a form is
+    highlighted at once, and a field's mark is cleared as soon as it is
+    edited again.
+    """
+
+    def __init__(self, status_label):
+        """
+        Initialize the validator
+
+        Args:
+            status_label: Label that shows the message for the invalid fields
+        """
+        self.status_label = status_label
+        self.errors = {}
+        self._bound = set()
+
+        style = ttk.Style()
+        style.configure('Invalid.TEntry', foreground='#b00020', fieldbackground='#ffe0e0')
+        status_label.configure(foreground='#b00020')
+
+    def parse(self, entry, parser, *args):
+        """
+        Run a parser on an entry's text, marking the entry if it fails
+
+        Args:
+            entry: ttk.Entry to read
+            parser: Function taking the text (and args) that raises FieldError
+
+        Returns:
+            The parsed value, or None if the entry was marked
+        """
+        try:
+            value = parser(entry.get(), *args)
+        except FieldError as e:
+            self.mark(entry, str(e))
+            return None
+        self.unmark(entry)
+        return value
+
+    def mark(self, entry, message):
+        """Highlight an entry and show why it is invalid"""
+        if entry not in self._bound:
+            self._bound.add(entry)
+            entry.bind('<Key>', lambda e, w=entry: self.unmark(w), add='+')
+        entry.configure(style='Invalid.TEntry')
+        self.errors[entry] = message
+        self._show()
+
+    def unmark(self, entry):
+        """Clear an entry's highlight"""
+        if self.errors.pop(entry, None) is not None:
+            try:
+                entry.configure(style='TEntry')
+            except tk.TclError:
+                pass  # The entry was destroyed
+            self._show()
+
+    def clear(self):
+        """Clear every highlight and the status text"""
+        for entry in list(self.errors):
+            self.unmark(entry)
+
+    @property
+    def valid(self) -> bool:
+        """Whether no entry is marked"""
+        return not self.errors
+
+    def _show(self):
+        messages = list(self.errors.values())
+        if len(messages) > 1:
+            text = f"{messages[0]} (and {len(messages) - 1} more)"
+        else:
+            text = messages[0] if messages else ""
+        self.status_label.configure(text=text)
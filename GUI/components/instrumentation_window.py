@@ -0,0 +1,130 @@
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+class InstrumentationWindow:
+    # Milliseconds between automatic refreshes while the window is open
+    REFRESH_INTERVAL = 1000
+
+    def __init__(self, root, profiler):
+        """
+        Initialize the instrumentation debug window
+
+        Args:
+            root: The root window
+            profiler: Profiler whose statistics to display
+        """
+        self.root = root
+        self.profiler = profiler
+
+        # Create window
+        self.window = tk.Toplevel(root)
+        self.window.title("Instrumentation")
+        self.window.geometry("700x450")
+
+        self.setup_widgets()
+        self.refresh()
+        self._schedule_refresh()
+
+    def setup_widgets(self):
+        """Create the statistics table, histogram view and buttons"""
+        main_frame = ttk.Frame(self.window, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Enable toggle
+        self.enabled_var = tk.BooleanVar(value=self.profiler.enabled)
+        ttk.Checkbutton(main_frame, text="Instrumentation enabled", variable=self.enabled_var,
+                        command=self.toggle_enabled).pack(anchor=tk.W, pady=(0, 5))
+
+        # Statistics table
+        columns = ('calls', 'total', 'mean', 'p95', 'max')
+        self.stats_tree = ttk.Treeview(main_frame, columns=columns, height=8)
+        self.stats_tree.heading('#0', text='Operation', anchor=tk.W)
+        self.stats_tree.column('#0', width=260)
+        headings = {'calls': 'Calls', 'total': 'Total ms', 'mean': 'Mean ms', 'p95': '~p95 ms', 'max': 'Max ms'}
+        for column in columns:
+            self.stats_tree.heading(column, text=headings[column])
+            self.stats_tree.column(column, width=80, anchor=tk.E)
+        self.stats_tree.pack(fill=tk.BOTH, expand=True)
+        self.stats_tree.bind('<<TreeviewSelect>>', lambda e: self.show_histogram())
+
+        # Histogram for the selected operation
+        self.histogram_text = tk.Text(main_frame, height=8, font=('TkFixedFont', 9), state=tk.DISABLED)
+        self.histogram_text.pack(fill=tk.X, pady=(5, 0))
+
+        # Buttons
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=(10, 0))
+        ttk.Button(button_frame, text="Reset", command=self.reset).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Dump to File...", command=self.dump).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Close", command=self.window.destroy).pack(side=tk.RIGHT)
+
+    def toggle_enabled(self):
+        """Install or remove the timing wrappers"""
+        if self.enabled_var.get():
+            self.profiler.enable()
+        else:
+            self.profiler.disable()
+        self.refresh()
+
+    def refresh(self):
+        """Redraw the statistics table from the profiler"""
+        selected = self.stats_tree.selection()
+        self.stats_tree.delete(*self.stats_tree.get_children())
+        for label, stats in self.profiler.snapshot().items():
+            self.stats_tree.insert('', tk.END, iid=label, text=label, values=(
+                stats['count'],
+                f"{stats['total_ms']:.1f}",
+                f"{stats['mean_ms']:.2f}",
+                f"{stats['p95_ms']:.2f}",
+                f"{stats['max_ms']:.2f}"
+            ))
+        selected = [item for item in selected if self.stats_tree.exists(item)]
+        if selected:
+            self.stats_tree.selection_set(selected)
+        self.show_histogram()
+
+    def show_histogram(self):
+        """Draw a text histogram for the selected operation"""
+        selected = self.stats_tree.selection()
+        lines = []
+        if selected:
+            histogram = self.profiler.histograms.get(selected[0])
+            if histogram and histogram.count:
+                peak = max(histogram.buckets)
+                for bucket, hits in enumerate(histogram.buckets):
+                    if hits:
+                        bar = '#' * max(1, hits * 40 // peak)
+                        lines.append(f"< {2 ** bucket:>10} us  {hits:>7}  {bar}")
+
+        self.histogram_text.configure(state=tk.NORMAL)
+        self.histogram_text.delete('1.0', tk.END)
+        self.histogram_text.insert('1.0', '\n'.join(lines))
+        self.histogram_text.configure(state=tk.DISABLED)
+
+    def reset(self):
+        """Clear all recorded samples"""
+        self.profiler.reset()
+        self.refresh()
+
+    def dump(self):
+        """Dump the statistics to a JSON file"""
+        try:
+            file_path = filedialog.asksaveasfilename(
+                parent=self.window,
+                defaultextension=".json",
+                filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+                initialdir="saves"
+            )
+            if file_path:
+                self.profiler.dump(file_path)
+                messagebox.showinfo("Success", "Instrumentation data dumped successfully!", parent=self.window)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to dump instrumentation data: {str(e)}", parent=self.window)
+
+    def _schedule_refresh(self):
+        """Refresh periodically while the window exists"""
+        if not self.window.winfo_exists():
+            return
+        if self.profiler.enabled:
+            self.refresh()
+        self.window.after(self.REFRESH_INTERVAL, self._schedule_refresh)
@@ -1,7 +1,5 @@
 import tkinter as tk
 from tkinter import messagebox, filedialog
-import os
-import json
 
 class MenuBar:
     def __init__(self, root, parent):
@@ -24,31 +22,58 @@ class MenuBar:
         # File menu
         file_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="File", menu=file_menu)
+        file_menu.add_command(label="New Encounter", command=self.parent.new_encounter)
+        file_menu.add_command(label="Rename Encounter...", command=self.parent.rename_encounter)
+        file_menu.add_command(label="Close Encounter", command=self.parent.close_encounter)
+        file_menu.add_separator()
         file_menu.add_command(label="Save", command=self.save_session)
         file_menu.add_command(label="Save As...", command=self.save_session_as)
         file_menu.add_command(label="Load...", command=self.load_session)
+        file_menu.add_command(label="Campaign Archive...", command=self.show_archive)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self.parent.on_closing)
+        
+        # Combat menu
+        combat_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Combat", menu=combat_menu)
+        combat_menu.add_command(label="Next Turn", accelerator="N", command=lambda: self.parent.hotkeys.next_turn())
+        combat_menu.add_command(label="Previous Turn", accelerator="P",
+                                command=lambda: self.parent.hotkeys.previous_turn())
+        combat_menu.add_command(label="Command Palette...", accelerator="Ctrl+K",
+                                command=lambda: self.parent.hotkeys.open_palette())
+        combat_menu.add_separator()
+        combat_menu.add_command(label="Roll Initiative for All", command=lambda: self.parent.roll_initiative())
+        combat_menu.add_command(label="Roll Initiative for Selected",
+                                command=lambda: self.parent.roll_initiative(selected_only=True))
+        combat_menu.add_command(label="Initiative Formula...", command=self.parent.set_initiative_formula)
+        combat_menu.add_separator()
+        combat_menu.add_command(label="Bulk Edit...", command=lambda: self.parent.encounter.bulk_edit())
+        self.mass_battle_var = tk.BooleanVar(value=False)
+        combat_menu.add_checkbutton(label="Mass Battle View", variable=self.mass_battle_var,
+                                    command=lambda: self.parent.set_mass_battle(self.mass_battle_var.get()))
+        combat_menu.add_separator()
+        combat_menu.add_command(label="Pacing Statistics...", command=self.show_pacing_stats)
+        combat_menu.add_command(label="Simulate Encounter...", command=self.show_simulator)
+        combat_menu.add_command(label="Replay Combat...", command=self.show_replay)
+        combat_menu.add_separator()
+        self.player_view_var = tk.BooleanVar(value=False)
+        combat_menu.add_checkbutton(label="Player View Server", variable=self.player_view_var,
+                                    command=self.toggle_player_view)
+        self.player_view_lan_var = tk.BooleanVar(value=False)
+        combat_menu.add_checkbutton(label="Share Player View on LAN", variable=self.player_view_lan_var)
+        self.combat_menu = combat_menu
         
         # Templates button
         menubar.add_command(label="Templates", command=self.show_templates)
+        
+        # Debug menu
+        debug_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Debug", menu=debug_menu)
+        debug_menu.add_command(label="Instrumentation...", command=self.show_instrumentation)
 
     def save_session(self):
-        """Save the current session to the default file"""
-        try:
-            # Save character data
-            save_path = os.path.join('saves', 'last_session.json')
-            self.parent.save_to_file(save_path)
-            
-            # Update combat state
-            state_path = os.path.join('saves', 'combat_state.json')
-            os.makedirs(os.path.dirname(state_path), exist_ok=True)
-            with open(state_path, 'w') as f:
-                json.dump({'in_combat': True}, f)
-                
-            messagebox.showinfo("Success", "Session saved successfully!")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save session: {str(e)}")
+        """Save the selected encounter to its session file"""
+        self.parent.save_session()
     
     def save_session_as(self):
         """Save the current session to a chosen file"""
@@ -78,7 +103,53 @@ class MenuBar:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load session: {str(e)}")
             
+    def show_archive(self):
+        """Browse, search and restore finished combats"""
+        from GUI.components.archive_window import ArchiveWindow
+        ArchiveWindow(self.root, self.parent)
+
     def show_templates(self):
         """Show the templates management screen"""
         from GUI.components.templates_screen import TemplatesScreen
         TemplatesScreen(self.root, self.parent)
+
+    def show_pacing_stats(self):
+        """Show turn timing and pacing statistics"""
+        from GUI.components.pacing_stats_window import PacingStatsWindow
+        PacingStatsWindow(self.root, self.parent.engine.turn_timer)
+
+    def show_simulator(self):
+        """Estimate the selected encounter's outcome by simulating many fights"""
+        from GUI.components.simulation_window import SimulationWindow
+        SimulationWindow(self.root, self.parent.engine)
+
+    def show_replay(self):
+        """Pick a recorded combat and scrub through it turn by turn"""
+        from combat.replay import REPLAY_DIR, Replay
+        from GUI.components.replay_window import ReplayWindow
+        file_path = filedialog.askopenfilename(
+            filetypes=[("Combat replays", "*.jsonl"), ("All files", "*.*")],
+            initialdir=REPLAY_DIR
+        )
+        if not file_path:
+            return
+        try:
+            replay = Replay(file_path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Failed to open replay: {str(e)}")
+            return
+        ReplayWindow(self.root, replay)
+
+    def toggle_player_view(self):
+        """Start or stop the player view server from the menu"""
+        if self.player_view_var.get():
+            started = self.parent.start_player_view(lan=self.player_view_lan_var.get())
+            self.player_view_var.set(started)
+        else:
+            self.parent.stop_player_view()
+
+    def show_instrumentation(self):
+        """Show the instrumentation debug window"""
+        from profiling.profiler import profiler
+        from GUI.components.instrumentation_window import InstrumentationWindow
+        InstrumentationWindow(self.root, profiler)
@@ -0,0 +1,96 @@
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+class PacingStatsWindow:
+    def __init__(self, root, turn_timer):
+        """
+        Initialize the pacing statistics window
+
+        Args:
+            root: The root window
+            turn_timer: TurnTimer holding the recorded turns
+        """
+        self.root = root
+        self.turn_timer = turn_timer
+
+        # Create window
+        self.window = tk.Toplevel(root)
+        self.window.title("Pacing Statistics")
+        self.window.geometry("560x360")
+
+        self.setup_widgets()
+        self.refresh()
+
+    def setup_widgets(self):
+        """Create the summary labels, per-character table and buttons"""
+        main_frame = ttk.Frame(self.window, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Summary line
+        self.summary_var = tk.StringVar()
+        ttk.Label(main_frame, textvariable=self.summary_var).pack(anchor=tk.W, pady=(0, 10))
+
+        # Per-character table
+        columns = ('name', 'turns', 'average', 'median', 'p90', 'longest')
+        self.stats_tree = ttk.Treeview(main_frame, columns=columns, show='headings')
+        headings = {
+            'name': 'Character',
+            'turns': 'Turns',
+            'average': 'Average',
+            'median': 'Median',
+            'p90': '90th %',
+            'longest': 'Longest',
+        }
+        for column in columns:
+            self.stats_tree.heading(column, text=headings[column])
+            self.stats_tree.column(column, width=70, anchor=tk.CENTER)
+        self.stats_tree.column('name', width=150, anchor=tk.W)
+        self.stats_tree.pack(fill=tk.BOTH, expand=True)
+
+        # Buttons
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=(10, 0))
+        ttk.Button(button_frame, text="Refresh", command=self.refresh).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Export CSV...", command=self.export_csv).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Close", command=self.window.destroy).pack(side=tk.RIGHT)
+
+    def refresh(self):
+        """Recompute statistics from the recorded turns"""
+        summary = self.turn_timer.summary()
+        self.summary_var.set(
+            f"Turns: {summary['turns']}    "
+            f"Average turn: {format_duration(summary['average'])}    "
+            f"Rounds per hour: {summary['rounds_per_hour']:.1f}"
+        )
+
+        self.stats_tree.delete(*self.stats_tree.get_children())
+        stats = self.turn_timer.character_stats()
+        for name, values in sorted(stats.items(), key=lambda kv: -kv[1]['average']):
+            self.stats_tree.insert('', tk.END, values=(
+                name,
+                values['turns'],
+                format_duration(values['average']),
+                format_duration(values['median']),
+                format_duration(values['p90']),
+                format_duration(values['longest'])
+            ))
+
+    def export_csv(self):
+        """Export every recorded turn to a CSV file"""
+        try:
+            file_path = filedialog.asksaveasfilename(
+                parent=self.window,
+                defaultextension=".csv",
+                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+                initialdir="saves"
+            )
+            if file_path:
+                self.turn_timer.export_csv(file_path)
+                messagebox.showinfo("Success", "Turn times exported successfully!", parent=self.window)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to export turn times: {str(e)}", parent=self.window)
+
+def format_duration(seconds):
+    """Format a duration in seconds as m:ss"""
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    return f"{minutes}:{seconds:02d}"
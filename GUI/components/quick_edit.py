@@ -1,5 +1,6 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+from GUI.components.token_images import PANEL_TOKEN_SIZE
 
 class QuickEdit:
     def __init__(self, parent_frame, parent):
@@ -13,8 +14,13 @@ class QuickEdit:
         self.parent_frame = parent_frame
         self.parent = parent
         self.current_character = None
+        self.token_images = parent.app.token_images
+        self.token_image = None  # Shown image, kept alive even if the token cache lets it go
         self.setup_quick_edit()
         
+        # Keep the panel in sync with engine changes
+        self.parent.engine.subscribe(self._on_engine_event)
+        
     def setup_quick_edit(self):
         """Initialize the quick edit panel"""
         # Name section
@@ -22,6 +28,20 @@ class QuickEdit:
         self.name_label = ttk.Label(self.parent_frame, text="", font=('TkDefaultFont', 12))
         self.name_label.pack(fill=tk.X, pady=(0, 10))
         
+        # Token section
+        token_frame = ttk.LabelFrame(self.parent_frame, text="Token")
+        token_frame.pack(fill=tk.X, pady=5)
+        
+        self.token_label = ttk.Label(token_frame, text="No image", anchor=tk.CENTER)
+        self.token_label.pack(side=tk.LEFT, padx=5, pady=5)
+        self.token_label.bind('<Destroy>', lambda e: self.token_images.unsubscribe(self._on_tokens_ready))
+        self.token_images.subscribe(self._on_tokens_ready)
+        
+        token_btns = ttk.Frame(token_frame)
+        token_btns.pack(side=tk.RIGHT, padx=5, pady=5)
+        ttk.Button(token_btns, text="Choose...", command=self.choose_token).pack(fill=tk.X, pady=(0, 5))
+        ttk.Button(token_btns, text="Clear", command=self.clear_token).pack(fill=tk.X)
+        
         # Health section
         self.health_frame = ttk.LabelFrame(self.parent_frame, text="Health")
         self.health_frame.pack(fill=tk.X, pady=5)
@@ -56,6 +76,34 @@ class QuickEdit:
         ttk.Button(btn_frame, text="Heal", command=self.heal).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(btn_frame, text="Damage", command=self.damage).pack(side=tk.LEFT)
         
+        # Conditions section
+        conditions_frame = ttk.LabelFrame(self.parent_frame, text="Conditions")
+        conditions_frame.pack(fill=tk.X, pady=5)
+        
+        self.conditions_listbox = tk.Listbox(conditions_frame, height=4, exportselection=False)
+        self.conditions_listbox.pack(fill=tk.X, padx=5, pady=5)
+        
+        condition_form = ttk.Frame(conditions_frame)
+        condition_form.pack(fill=tk.X, padx=5)
+        
+        ttk.Label(condition_form, text="Name:").grid(row=0, column=0, sticky=tk.W)
+        self.condition_name_var = tk.StringVar()
+        ttk.Entry(condition_form, textvariable=self.condition_name_var, width=12).grid(row=0, column=1, sticky=tk.EW, padx=(5, 0))
+        
+        ttk.Label(condition_form, text="Rounds:").grid(row=1, column=0, sticky=tk.W)
+        self.condition_rounds_var = tk.StringVar()
+        ttk.Entry(condition_form, textvariable=self.condition_rounds_var, width=12).grid(row=1, column=1, sticky=tk.EW, padx=(5, 0))
+        
+        ttk.Label(condition_form, text="HP/turn:").grid(row=2, column=0, sticky=tk.W)
+        self.condition_hp_var = tk.StringVar()
+        ttk.Entry(condition_form, textvariable=self.condition_hp_var, width=12).grid(row=2, column=1, sticky=tk.EW, padx=(5, 0))
+        condition_form.columnconfigure(1, weight=1)
+        
+        condition_btns = ttk.Frame(conditions_frame)
+        condition_btns.pack(fill=tk.X, padx=5, pady=5)
+        ttk.Button(condition_btns, text="Add", command=self.add_condition).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(condition_btns, text="Remove", command=self.remove_condition).pack(side=tk.LEFT)
+        
         # Add some padding at the bottom to maintain spacing
         ttk.Frame(self.parent_frame, height=30).pack(pady=5, fill=tk.X)
 
@@ -71,7 +119,50 @@ class QuickEdit:
             self.current_hp_label.config(text="-")
             self.max_hp_label.config(text="-")
             self.health_mod_var.set("")
+        self._show_token()
+        self._show_conditions()
+            
+    def _show_token(self):
+        """Show the shown character's token, or why there is none yet"""
+        token = self.current_character.token if self.current_character else None
+        image = self.token_images.get(token, PANEL_TOKEN_SIZE) if token else None
+        if image is not None:
+            self.token_label.config(image=image, text="")
+        elif token is None:
+            self.token_label.config(image='', text="No image")
+        elif self.token_images.error(token, PANEL_TOKEN_SIZE):
+            self.token_label.config(image='', text="Can't read image")
+        else:
+            self.token_label.config(image='', text="Loading...")
+        self.token_image = image
+            
+    def _on_tokens_ready(self, sources):
+        """Show the token once its thumbnail has been made"""
+        if self.current_character is not None and self.current_character.token in sources:
+            self._show_token()
             
+    def _show_conditions(self):
+        """Fill the conditions list for the shown character"""
+        self.conditions_listbox.delete(0, tk.END)
+        if self.current_character:
+            next_turn_round = self.parent.engine.next_turn_round(self.current_character)
+            for condition in self.current_character.conditions:
+                self.conditions_listbox.insert(tk.END, condition.describe(next_turn_round))
+            
+    def _on_engine_event(self, event, data):
+        """Refresh the panel when the shown character changes or leaves the roster"""
+        if self.current_character is None:
+            return
+        if event == 'changed' and any(char is self.current_character for char in data):
+            self.show_character(self.current_character)
+        elif event in ('round', 'turn'):
+            # Remaining durations count down as the owner's turns start
+            self._show_conditions()
+        elif event == 'removed' and any(char is self.current_character for char in data):
+            self.parent.on_character_selected(None)
+        elif event == 'reset':
+            self.parent.on_character_selected(None)
+
     def _validate_amount(self):
         """Validate and get the health modification amount"""
         try:
@@ -83,27 +174,10 @@ class QuickEdit:
             messagebox.showerror("Invalid Input", str(e) if str(e) != "invalid literal for int() with base 10: ''" else "Please enter a number")
             return None
             
-    def _update_health(self, new_health):
-        """Update character's health and display"""
-        self.current_character.health = new_health
-        self.current_hp_label.config(text=str(new_health))
+    def _update_health(self, change, amount):
+        """Apply a health change through the engine, which repaints the panel and list"""
+        change(self.current_character, amount)
         self.health_mod_var.set("")  # Clear the input field
-        
-        # Store the character's name before update
-        char_name = self.current_character.name
-        
-        # Update the list
-        self.parent.update_character_list()
-        
-        # Find and select the character by name in the updated list
-        tree = self.parent.character_list.character_tree
-        for item in tree.get_children():
-            values = tree.item(item)['values']
-            if values and values[0] == char_name:  # values[0] is the name column
-                self.parent.character_list.suppress_selection_event = True
-                tree.selection_set(item)
-                self.parent.character_list.suppress_selection_event = False
-                break
             
     def heal(self):
         """Heal the character by the specified amount"""
@@ -114,9 +188,8 @@ class QuickEdit:
         if amount is None:
             return
             
-        # Calculate new health, capped at max HP
-        new_health = min(self.current_character.health + amount, self.current_character.maxhp)
-        self._update_health(new_health)
+        # Engine caps health at max HP
+        self._update_health(self.parent.engine.heal, amount)
         
     def damage(self):
         """Damage the character by the specified amount"""
@@ -127,6 +200,61 @@ class QuickEdit:
         if amount is None:
             return
             
-        # Calculate new health, minimum of 0
-        new_health = max(self.current_character.health - amount, 0)
-        self._update_health(new_health)
+        # Engine keeps health at 0 or above
+        self._update_health(self.parent.engine.damage, amount)
+        
+    def choose_token(self):
+        """Pick a token image for the character"""
+        if not self.current_character:
+            return
+        from tkinter import filedialog
+        path = filedialog.askopenfilename(
+            title="Choose Token Image",
+            filetypes=[("Images", "*.png *.jpg *.jpeg *.gif *.webp *.bmp"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        # The file may have been fixed since it last failed to load
+        self.token_images.forget(path)
+        self.parent.engine.update_character(self.current_character, token=path)
+        
+    def clear_token(self):
+        """Remove the character's token image"""
+        if self.current_character and self.current_character.token is not None:
+            self.parent.engine.update_character(self.current_character, token=None)
+        
+    def add_condition(self):
+        """Attach the condition described in the form to the character"""
+        if not self.current_character:
+            return
+        
+        name = self.condition_name_var.get().strip()
+        if not name:
+            messagebox.showerror("Invalid Input", "Please enter a condition name")
+            return
+        try:
+            rounds_text = self.condition_rounds_var.get().strip()
+            rounds = int(rounds_text) if rounds_text else None
+            hp_text = self.condition_hp_var.get().strip()
+            health_per_turn = int(hp_text) if hp_text else 0
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Rounds and HP/turn must be whole numbers")
+            return
+        if rounds is not None and rounds <= 0:
+            messagebox.showerror("Invalid Input", "Rounds must be positive (leave empty for no limit)")
+            return
+        
+        self.parent.engine.add_condition(self.current_character, name, rounds, health_per_turn)
+        self.condition_name_var.set("")
+        self.condition_rounds_var.set("")
+        self.condition_hp_var.set("")
+        
+    def remove_condition(self):
+        """Remove the condition selected in the list"""
+        if not self.current_character:
+            return
+        selection = self.conditions_listbox.curselection()
+        if not selection:
+            return
+        condition = self.current_character.conditions[selection[0]]
+        self.parent.engine.remove_condition(self.current_character, condition)
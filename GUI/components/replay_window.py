@@ -0,0 +1,99 @@
+import tkinter as tk
+from tkinter import ttk
+from combat.engine import CombatEngine
+from GUI.components.round_counter import RoundCounter
+
+class ReplayWindow:
+    def __init__(self, root, replay):
+        """
+        Initialize the combat replay viewer
+
+        The replay is shown through its own CombatEngine, so scrubbing never
+        touches the encounters being tracked.
+
+        Args:
+            root: The root window
+            replay: combat.replay.Replay to show
+        """
+        self.root = root
+        self.replay = replay
+        self.engine = CombatEngine()
+        self.index = 0
+
+        # Create window
+        self.window = tk.Toplevel(root)
+        self.window.title(f"Replay - {replay.header.get('name', 'Combat')} ({replay.header.get('started', '')})")
+        self.window.geometry("560x520")
+
+        self.setup_widgets()
+        self.seek(0)
+
+    def setup_widgets(self):
+        """Create the round display, roster and scrubbing controls"""
+        main_frame = ttk.Frame(self.window, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # The tracker's round and turn display, read-only here
+        self.round_counter = RoundCounter(main_frame, self.engine)
+        for button in (self.round_counter.decrement_button, self.round_counter.increment_button,
+                       self.round_counter.prev_turn_button, self.round_counter.next_turn_button):
+            button.configure(state=tk.DISABLED)
+
+        # Roster at the chosen turn
+        columns = ('name', 'hp', 'ac', 'conditions')
+        self.roster_tree = ttk.Treeview(main_frame, columns=columns, show='headings', selectmode='none')
+        self.roster_tree.heading('name', text='Name')
+        self.roster_tree.heading('hp', text='HP')
+        self.roster_tree.heading('ac', text='AC')
+        self.roster_tree.heading('conditions', text='Conditions')
+        self.roster_tree.column('name', width=160, anchor=tk.W)
+        self.roster_tree.column('hp', width=80, anchor=tk.CENTER)
+        self.roster_tree.column('ac', width=50, anchor=tk.CENTER)
+        self.roster_tree.column('conditions', width=220, anchor=tk.W)
+        self.roster_tree.tag_configure('current', background='lightblue')
+        self.roster_tree.tag_configure('down', foreground='gray')
+        self.roster_tree.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+
+        # Scrubbing controls
+        controls = ttk.Frame(main_frame)
+        controls.pack(fill=tk.X, pady=(10, 0))
+        ttk.Button(controls, text="<", width=3, command=lambda: self.seek(self.index - 1)).pack(side=tk.LEFT)
+        self.scale = ttk.Scale(controls, from_=0, to=max(len(self.replay) - 1, 0), orient=tk.HORIZONTAL,
+                               command=lambda value: self.seek(round(float(value))))
+        self.scale.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        ttk.Button(controls, text=">", width=3, command=lambda: self.seek(self.index + 1)).pack(side=tk.LEFT)
+
+        self.step_label = ttk.Label(main_frame, text="")
+        self.step_label.pack(anchor=tk.W, pady=(5, 0))
+
+        self.window.bind('<Left>', lambda e: self.seek(self.index - 1))
+        self.window.bind('<Right>', lambda e: self.seek(self.index + 1))
+        self.window.bind('<Home>', lambda e: self.seek(0))
+        self.window.bind('<End>', lambda e: self.seek(len(self.replay) - 1))
+
+    def seek(self, index):
+        """Show the combat as it was at a step"""
+        index = max(0, min(index, len(self.replay) - 1))
+        if index == self.index and self.roster_tree.get_children():
+            return
+        self.index = index
+        self.engine.load_dict(self.replay.state_at(index))
+        if round(float(self.scale.get())) != index:
+            self.scale.set(index)
+        self.step_label.configure(text=f"Turn {index + 1} of {len(self.replay)} - {self.replay.label(index)}")
+        self.show_roster()
+
+    def show_roster(self):
+        """List the rebuilt roster, highlighting whose turn it is"""
+        self.roster_tree.delete(*self.roster_tree.get_children())
+        current = self.engine.current
+        current_group = current.group if current is not None else None
+        for char in self.engine.characters:
+            tags = []
+            if char is current or (current_group is not None and char.group == current_group):
+                tags.append('current')
+            if char.health <= 0:
+                tags.append('down')
+            conditions = ", ".join(condition.name for condition in char.conditions)
+            self.roster_tree.insert('', 'end', values=(char.name, f"{char.health}/{char.maxhp}", char.ac, conditions),
+                                    tags=tags)
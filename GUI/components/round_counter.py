@@ -2,11 +2,22 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 
 class RoundCounter:
-    def __init__(self, parent, gui_ref=None):
+    def __init__(self, parent, engine, gui_ref=None, checkpoints=None):
+        """
+        Initialize the round counter
+        
+        Args:
+            parent: Frame to place the round counter in
+            engine: CombatEngine holding the round and turn state
+            gui_ref: Optional reference to the main GUI
+            checkpoints: Optional RoundCheckpoints offered by a Rewind button
+        """
         # Main container frame
         self.frame = ttk.Frame(parent)
         self.frame.pack(fill=tk.X, padx=5, pady=5)
-        self.gui_ref = gui_ref  # Reference to main GUI for character access
+        self.engine = engine
+        self.gui_ref = gui_ref  # Reference to main GUI
+        self.checkpoints = checkpoints
 
         # Start Combat button
         self.start_combat_button = ttk.Button(self.frame, text="Start Combat", command=self.start_combat)
@@ -40,6 +51,13 @@ class RoundCounter:
                                          command=self.increment_round)
         self.increment_button.pack(side=tk.LEFT)
         
+        # Rewind to the start of an earlier round
+        if checkpoints is not None:
+            self.rewind_button = ttk.Menubutton(self.round_frame, text="Rewind")
+            self.rewind_menu = tk.Menu(self.rewind_button, tearoff=0, postcommand=self.update_rewind_menu)
+            self.rewind_button.configure(menu=self.rewind_menu)
+            self.rewind_button.pack(side=tk.LEFT, padx=(10, 0))
+        
         # Create turn control frame
         self.turn_frame = ttk.Frame(self.frame)
         self.turn_frame.pack(fill=tk.X, pady=(5, 0))
@@ -73,85 +91,81 @@ class RoundCounter:
         self.current_character_label = ttk.Label(self.current_turn_frame, textvariable=self.current_character)
         self.current_character_label.pack(side=tk.LEFT, padx=(5, 0))
 
-        # Track combat state
-        self.combat_started = False
+        # Repaint from engine events
+        self.engine.subscribe(self._on_engine_event)
+        self._on_engine_event('round', self.engine.round)
+        self._on_engine_event('turn', self.engine.current)
+        self._on_engine_event('combat', self.engine.combat_started)
+
+    def _on_engine_event(self, event, data):
+        """Update the display when the engine's round, turn or combat state changes"""
+        if event == 'round':
+            self.round_number.set(str(data))
+        elif event == 'turn':
+            self.current_character.set(self.engine.turn_name(data) if data is not None else "-")
+        elif event == 'combat':
+            if data:
+                self.start_combat_button.pack_forget()
+            else:
+                self.start_combat_button.pack(fill=tk.X, pady=(0, 10), before=self.round_frame)
+
+    @property
+    def combat_started(self):
+        """Whether combat has started"""
+        return self.engine.combat_started
+
+    @property
+    def turn_timer(self):
+        """Turn start timestamps for pacing statistics"""
+        return self.engine.turn_timer
 
-        
     def set_round(self, round_num):
         """Set the round number"""
-        self.round_number.set(str(round_num))
+        self.engine.set_round(int(round_num))
 
     def start_combat(self):
         """Handle start combat button press"""
-        characters = []
-        if self.gui_ref:
-            characters = getattr(self.gui_ref, 'characters', [])
-        if not characters:
+        if not self.engine.start_combat():
             messagebox.showwarning("No Characters", "You can't start combat without characters!")
-            return
-        # Set current character to the first in list
-        self.set_current_character(characters[0].name if hasattr(characters[0], 'name') else str(characters[0]))
-        self.combat_started = True
-        self.start_combat_button.pack_forget()
 
     def set_current_character(self, name):
-        self.current_character.set(name)
-
-    def get_character_name(self, char):
-        return getattr(char, 'name', str(char))
+        """Give the turn to the first character with the given name"""
+        self.engine.set_current(self.engine.find(name))
 
     def get_current_character_index(self):
-        characters = getattr(self.gui_ref, 'characters', [])
-        current_name = self.current_character.get()
-        for idx, char in enumerate(characters):
-            if self.get_character_name(char) == current_name:
-                return idx
-        return None
+        return self.engine.current_index()
 
     def next_turn(self):
-        if not self.combat_started or not self.gui_ref:
-            return
-        characters = getattr(self.gui_ref, 'characters', [])
-        if not characters:
-            self.set_current_character("-")
-            return
-        idx = self.get_current_character_index()
-        if idx is None:
-            self.set_current_character(self.get_character_name(characters[0]))
-            return
-        next_idx = (idx + 1) % len(characters)
-        if next_idx == 0:
-            self.increment_round()
-        self.set_current_character(self.get_character_name(characters[next_idx]))
+        self.engine.next_turn()
 
     def previous_turn(self):
-        if not self.combat_started or not self.gui_ref:
-            return
-        characters = getattr(self.gui_ref, 'characters', [])
-        if not characters:
-            self.set_current_character("-")
-            return
-        idx = self.get_current_character_index()
-        if idx is None:
-            self.set_current_character(self.get_character_name(characters[-1]))
-            return
-        prev_idx = (idx - 1) % len(characters)
-        if prev_idx == len(characters) - 1:
-            self.decrement_round()
-        self.set_current_character(self.get_character_name(characters[prev_idx]))
+        self.engine.previous_turn()
 
     def get_round(self):
         """Get the current round number"""
-        return int(self.round_number.get())
+        return self.engine.round
         
     def increment_round(self):
         """Increment the round number"""
-        current = self.get_round()
-        self.set_round(current + 1)
+        self.engine.increment_round()
         
     def decrement_round(self):
         """Decrement the round number, not going below 1"""
-        current = self.get_round()
-        if current > 1:
-            self.set_round(current - 1)
+        self.engine.decrement_round()
+
+    def update_rewind_menu(self):
+        """List the rounds that can be rewound to"""
+        self.rewind_menu.delete(0, tk.END)
+        rounds = self.checkpoints.rounds()
+        if not rounds:
+            self.rewind_menu.add_command(label="No rounds yet", state=tk.DISABLED)
+        for round_number in reversed(rounds):
+            self.rewind_menu.add_command(label=f"Start of round {round_number}",
+                                         command=lambda r=round_number: self.rewind(r))
 
+    def rewind(self, round_number):
+        """Put the encounter back as it was at the start of a round"""
+        if messagebox.askyesno("Rewind", f"Rewind to the start of round {round_number}?\n"
+                                         f"Changes since the start of round {round_number} will be undone; "
+                                         f"later rounds stay available in Rewind."):
+            self.checkpoints.restore(round_number)
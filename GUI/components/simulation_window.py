@@ -0,0 +1,146 @@
+import tkinter as tk
+from tkinter import ttk
+
+# How often to check on running fights
+POLL_MS = 50
+
+class SimulationWindow:
+    def __init__(self, root, engine):
+        """
+        Initialize the encounter simulator window
+
+        Args:
+            root: The root window
+            engine: CombatEngine whose roster is simulated
+        """
+        self.root = root
+        self.engine = engine
+        self.futures = []
+        self.tally = None
+        self.specs = []
+        self._poll_id = None
+
+        # Create window
+        self.window = tk.Toplevel(root)
+        self.window.title("Simulate Encounter")
+        self.window.geometry("520x440")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.setup_widgets()
+
+    def setup_widgets(self):
+        """Create the run controls, summary and per-combatant table"""
+        from combat.simulator import ATTACK_FIELD, ATTACKS_FIELD, DAMAGE_FIELD, DEFAULT_FIGHTS
+
+        main_frame = ttk.Frame(self.window, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Label(main_frame, wraplength=480, justify=tk.LEFT,
+                  text=f"Players fight monsters using the custom fields '{ATTACK_FIELD}' (to-hit bonus), "
+                       f"'{DAMAGE_FIELD}' (dice on a hit) and '{ATTACKS_FIELD}' (per turn, default 1), "
+                       f"starting from current health.").pack(anchor=tk.W, pady=(0, 10))
+
+        # Run controls
+        controls = ttk.Frame(main_frame)
+        controls.pack(fill=tk.X)
+        ttk.Label(controls, text="Fights:").pack(side=tk.LEFT)
+        self.fights_var = tk.StringVar(value=str(DEFAULT_FIGHTS))
+        ttk.Spinbox(controls, from_=100, to=100000, increment=500, width=8,
+                    textvariable=self.fights_var).pack(side=tk.LEFT, padx=5)
+        self.run_button = ttk.Button(controls, text="Run", command=self.run)
+        self.run_button.pack(side=tk.LEFT)
+        self.progress = ttk.Progressbar(controls, mode='determinate')
+        self.progress.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(10, 0))
+
+        # Summary
+        self.summary_var = tk.StringVar()
+        self.status_label = ttk.Label(main_frame, textvariable=self.summary_var, justify=tk.LEFT)
+        self.status_label.pack(anchor=tk.W, pady=10)
+
+        # Per-combatant table
+        columns = ('name', 'side', 'death')
+        self.result_tree = ttk.Treeview(main_frame, columns=columns, show='headings')
+        self.result_tree.heading('name', text='Combatant')
+        self.result_tree.heading('side', text='Side')
+        self.result_tree.heading('death', text='Goes down')
+        self.result_tree.column('name', width=220, anchor=tk.W)
+        self.result_tree.column('side', width=90, anchor=tk.CENTER)
+        self.result_tree.column('death', width=90, anchor=tk.CENTER)
+        self.result_tree.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Button(main_frame, text="Close", command=self.close).pack(anchor=tk.E, pady=(10, 0))
+
+    def run(self):
+        """Start simulating the roster as it is now"""
+        from character.validation import FieldError, parse_whole
+        from combat.simulator import SimulationError, Tally, build_specs, submit
+        try:
+            fights = parse_whole(self.fights_var.get(), "Fights", 1)
+            self.specs = build_specs(self.engine.characters)
+        except (FieldError, SimulationError) as e:
+            self.summary_var.set(str(e))
+            return
+
+        self.cancel()
+        self.tally = Tally(spec.name for spec in self.specs)
+        self.futures = submit(self.specs, fights)
+        self.progress.configure(maximum=fights, value=0)
+        self.run_button.configure(text="Running...", state=tk.DISABLED)
+        self.poll()
+
+    def poll(self):
+        """Fold finished chunks into the result, then check again later"""
+        self._poll_id = None
+        finished = [future for future in self.futures if future.done()]
+        for future in finished:
+            self.futures.remove(future)
+            if future.cancelled():
+                continue
+            try:
+                self.tally.merge(future.result())
+            except Exception as e:
+                self.cancel()
+                self.summary_var.set(f"Simulation failed: {e}")
+                return
+        if finished:
+            self.progress.configure(value=self.tally.fights)
+            self.show_results()
+        if self.futures:
+            self._poll_id = self.window.after(POLL_MS, self.poll)
+        else:
+            self.run_button.configure(text="Run", state=tk.NORMAL)
+
+    def show_results(self):
+        """Show the combined result of the fights finished so far"""
+        tally = self.tally
+        self.summary_var.set(
+            f"{tally.fights} fights\n"
+            f"Players win {tally.rate(tally.party_wins):.0%}, monsters win {tally.rate(tally.monster_wins):.0%}, "
+            f"unfinished {tally.rate(tally.draws):.0%}\n"
+            f"Total party kill {tally.rate(tally.wipes):.0%}\n"
+            f"Expected rounds {tally.expected_rounds:.1f}, "
+            f"players down {tally.expected_party_deaths:.2f}, "
+            f"monsters down {tally.expected_monster_deaths:.2f}"
+        )
+        self.result_tree.delete(*self.result_tree.get_children())
+        for spec, deaths in zip(self.specs, tally.deaths):
+            self.result_tree.insert('', 'end', values=(
+                spec.name,
+                'Player' if spec.is_player else 'Monster',
+                f"{tally.rate(deaths):.0%}"
+            ))
+
+    def cancel(self):
+        """Drop the fights that haven't started"""
+        if self._poll_id is not None:
+            self.window.after_cancel(self._poll_id)
+            self._poll_id = None
+        for future in self.futures:
+            future.cancel()
+        self.futures = []
+        self.run_button.configure(text="Run", state=tk.NORMAL)
+
+    def close(self):
+        """Cancel pending fights and close the window"""
+        self.cancel()
+        self.window.destroy()
@@ -1,40 +1,45 @@
 import tkinter as tk
 from tkinter import ttk
-from character.character import Character
-import os
-import json
-import sys
+from character.template_store import TemplateStore
 
 class TemplateList:
-    def __init__(self, parent_frame, gui_ref):
+    def __init__(self, parent_frame, gui_ref, store=None):
         """
         Initialize the template list component
         
         Args:
             parent_frame: The frame to place this component in
             gui_ref: Reference to the main GUI for callbacks
+            store: Shared TemplateStore; a private one is created if not given
         """
         self.parent_frame = parent_frame
         self.gui_ref = gui_ref
-        self.templates = []
-        
-        # Get the absolute path to the templates directory
-        if getattr(sys, 'frozen', False):
-            # Running as PyInstaller bundle
-            self.template_dir = os.path.join(os.path.dirname(sys.executable), "templates")
-        else:
-            # Running in development
-            self.template_dir = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-                "templates"
-            )
-        os.makedirs(self.template_dir, exist_ok=True)
+        self.store = store if store is not None else TemplateStore()
+        self._rows = {}  # template name -> tree item
         
         # Create template list view
         self.create_template_list()
         
-        # Load existing templates
-        self.load_templates()
+        # Follow library changes row by row, including files changed outside the app
+        self.store.subscribe(self._on_library_event)
+        self.frame.bind("<Destroy>", self._on_destroy)
+        
+        # Show the shared library, reading the disk only on first use
+        try:
+            self.store.ensure_loaded()
+        except Exception as e:
+            print(f"Error loading templates: {str(e)}")
+        self.update_template_list()
+        
+    @property
+    def templates(self):
+        """The shared template library"""
+        return self.store.templates
+        
+    @property
+    def template_dir(self):
+        """Directory the templates are stored in"""
+        return self.store.template_dir
         
     def create_template_list(self):
         """Create the template list treeview with checkboxes"""
@@ -76,40 +81,57 @@ class TemplateList:
         self.checkbox_checked = "☑"  # Larger checked checkbox
         
     def load_templates(self):
-        """Load templates from the templates directory"""
-        
-        self.templates = []
+        """Reload templates from the templates directory"""
         try:
-            for filename in os.listdir(self.template_dir):
-                if filename.endswith(".json"):
-                    with open(os.path.join(self.template_dir, filename), 'r') as f:
-                        template_data = json.load(f)
-                        template = Character.from_dict(template_data)
-                        self.templates.append(template)
-            
-            self.update_template_list()
+            self.store.load()
         except Exception as e:
             print(f"Error loading templates: {str(e)}")
             
     def update_template_list(self):
         """Update the template list display"""
         # Clear existing items
-        for item in self.template_tree.get_children():
-            self.template_tree.delete(item)
+        self.template_tree.delete(*self.template_tree.get_children())
+        self._rows = {}
             
         # Add templates to tree
         for template in self.templates:
-            # Format custom fields as a comma-separated list
-            custom_fields = ", ".join([f"{k}: {v}" for k, v in template.custom_fields.items()])
+            self._insert_row(template)
+            
+    def _row_values(self, template, selected):
+        # Format custom fields as a comma-separated list
+        custom_fields = ", ".join([f"{k}: {v}" for k, v in template.custom_fields.items()])
+        return (
+            selected,
+            template.name,
+            f"{template.health}/{template.maxhp}",
+            template.ac,
+            custom_fields
+        )
+        
+    def _insert_row(self, template):
+        self._rows[template.name] = self.template_tree.insert(
+            "", tk.END, values=self._row_values(template, self.checkbox_unchecked))
+        
+    def _on_library_event(self, event, data):
+        """Update only the rows of templates that were saved or deleted"""
+        if event == 'reset':
+            self.update_template_list()
+        elif event == 'saved':
+            item = self._rows.get(data.name)
+            if item is None:
+                self._insert_row(data)
+            else:
+                # Replaced in place in the library, so the row keeps its position and checkbox
+                self.template_tree.item(item, values=self._row_values(data, self.template_tree.set(item, "Selected")))
+        elif event == 'deleted':
+            for template in data:
+                item = self._rows.pop(template.name, None)
+                if item is not None:
+                    self.template_tree.delete(item)
             
-            values = (
-                self.checkbox_unchecked,  # Unchecked checkbox
-                template.name,
-                f"{template.health}/{template.maxhp}",
-                template.ac,
-                custom_fields
-            )
-            self.template_tree.insert("", tk.END, values=values)
+    def _on_destroy(self, event):
+        if event.widget is self.frame:
+            self.store.unsubscribe(self._on_library_event)
             
     def on_click(self, event):
         """Handle mouse click in the template tree"""
@@ -126,6 +148,8 @@ class TemplateList:
                 current_value = self.template_tree.set(item, "Selected")
                 new_value = self.checkbox_checked if current_value == self.checkbox_unchecked else self.checkbox_unchecked
                 self.template_tree.set(item, "Selected", new_value)
+                if hasattr(self.gui_ref, 'on_selection_changed'):
+                    self.gui_ref.on_selection_changed()
                 return
         
         # Handle template selection (if not clicking checkbox)
@@ -141,14 +165,8 @@ class TemplateList:
                     
     def save_template(self, character):
         """Save a character as a template"""
-        # Save template to file
-        template_path = os.path.join(self.template_dir, f"{character.name}.json")
-        with open(template_path, 'w') as f:
-            json.dump(character.__dict__, f, indent=4)
-            
-        # Add to templates list and update display
-        self.templates.append(character)
-        self.update_template_list()
+        # Save to file and the shared library; the row follows from the library event
+        self.store.save(character)
         
     def get_selected_templates(self):
         """Get list of selected templates"""
@@ -161,15 +179,8 @@ class TemplateList:
         
     def delete_template(self, template):
         """Delete a template from disk and memory"""
-        # Remove from disk
-        template_path = os.path.join(self.template_dir, f"{template.name}.json")
-        try:
-            os.remove(template_path)
-        except OSError:
-            pass  # File might not exist
-            
-        # Remove from memory
-        try:
-            self.templates.remove(template)
-        except ValueError:
-            pass  # Template might not be in list
+        self.store.delete([template])
+        
+    def delete_templates(self, templates):
+        """Delete several templates from disk and memory at once"""
+        self.store.delete(templates)
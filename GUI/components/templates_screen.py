@@ -33,9 +33,11 @@ class TemplatesScreen:
         
         # Initialize components
         self.setup_template_list()
+        self.setup_presets()
         self.setup_character_details()
         
-        # Add buttons at the bottom
+        # Add the difficulty readout and buttons at the bottom
+        self.setup_difficulty()
         self.setup_buttons()
         
     def setup_template_list(self):
@@ -45,7 +47,95 @@ class TemplatesScreen:
         list_frame.pack(fill=tk.BOTH, expand=True)
         
         # Create the template list component
-        self.template_list = TemplateList(list_frame, self)
+        # The library is shared by every templates window and encounter
+        self.template_list = TemplateList(list_frame, self, self.parent.template_store)
+        
+    def setup_presets(self):
+        """Setup the encounter presets panel under the template list"""
+        presets_frame = ttk.LabelFrame(self.left_frame, text="Encounter Presets")
+        presets_frame.pack(fill=tk.X, pady=(10, 0))
+        
+        row = ttk.Frame(presets_frame)
+        row.pack(fill=tk.X, padx=5, pady=5)
+        self.preset_var = tk.StringVar()
+        self.preset_combo = ttk.Combobox(row, textvariable=self.preset_var, state="readonly", width=24)
+        self.preset_combo.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.preset_combo.bind("<<ComboboxSelected>>", lambda e: self.show_preset())
+        ttk.Button(row, text="Spawn", command=self.spawn_preset).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Button(row, text="Delete", command=self.delete_preset).pack(side=tk.LEFT, padx=(5, 0))
+        
+        self.preset_summary = tk.StringVar()
+        ttk.Label(presets_frame, textvariable=self.preset_summary, wraplength=420,
+                  justify=tk.LEFT).pack(fill=tk.X, padx=5)
+        ttk.Button(presets_frame, text="Save Checked as Preset...",
+                   command=self.save_checked_as_preset).pack(anchor=tk.W, padx=5, pady=5)
+        
+        store = self.parent.template_store
+        store.subscribe(self._on_library_event)
+        self.window.bind("<Destroy>", self._on_destroy, add="+")
+        self.update_presets()
+        
+    def _on_library_event(self, event, data):
+        if event in ('presets', 'reset'):
+            self.update_presets()
+        
+    def _on_destroy(self, event):
+        if event.widget is self.window:
+            self.parent.template_store.unsubscribe(self._on_library_event)
+        
+    def update_presets(self):
+        """Refill the preset dropdown from the library"""
+        names = [preset.name for preset in self.parent.template_store.presets]
+        self.preset_combo.configure(values=names)
+        if self.preset_var.get() not in names:
+            self.preset_var.set(names[0] if names else "")
+        self.show_preset()
+        
+    def show_preset(self):
+        """Summarize the chosen preset"""
+        preset = self.parent.template_store.find_preset(self.preset_var.get())
+        self.preset_summary.set(preset.describe() if preset else "Check templates and save them as a preset.")
+        
+    def save_checked_as_preset(self):
+        """Save the checked templates, count and options as a named preset"""
+        from tkinter import simpledialog
+        from character.preset import DEFAULT_PATTERN, EncounterPreset, PresetEntry
+        selected_templates = self.template_list.get_selected_templates()
+        if not selected_templates:
+            tk.messagebox.showinfo("Save Preset", "Check the templates to include first", parent=self.window)
+            return
+        count = self._count()
+        if count is None:
+            return
+        name = simpledialog.askstring("Save Preset", "Preset name:", initialvalue=self.preset_var.get(),
+                                      parent=self.window)
+        if not name or not name.strip():
+            return
+        entries = [PresetEntry(template.name, count, DEFAULT_PATTERN, self.group_var.get(), self.roll_var.get())
+                   for template in selected_templates]
+        self.parent.template_store.save_preset(EncounterPreset(name.strip(), entries))
+        self.preset_var.set(name.strip())
+        self.show_preset()
+        
+    def spawn_preset(self):
+        """Add every creature in the chosen preset to combat at once"""
+        from character.preset import PresetError, spawn
+        store = self.parent.template_store
+        preset = store.find_preset(self.preset_var.get())
+        if preset is None:
+            return
+        try:
+            spawn(self.parent.engine, preset, store.find, self.parent.initiative_formula)
+        except PresetError as e:
+            tk.messagebox.showerror("Spawn Preset", str(e), parent=self.window)
+        
+    def delete_preset(self):
+        """Delete the chosen preset"""
+        store = self.parent.template_store
+        preset = store.find_preset(self.preset_var.get())
+        if preset is not None and tk.messagebox.askyesno(
+                "Delete Preset", f"Delete the preset {preset.name}?", parent=self.window):
+            store.delete_preset(preset)
         
     def setup_character_details(self):
         """Setup the character details panel"""
@@ -68,6 +158,24 @@ class TemplatesScreen:
         # Enable template mode
         self.character_details.set_template_mode(True)
         
+    def setup_difficulty(self):
+        """Show the selected encounter's difficulty, with and without the checked templates"""
+        from GUI.components.difficulty_bar import DifficultyBar
+        difficulty_frame = ttk.LabelFrame(self.window, text="Encounter Difficulty")
+        difficulty_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
+        self.difficulty_bar = DifficultyBar(difficulty_frame, self.parent.encounter.difficulty)
+        
+    def on_selection_changed(self):
+        """Preview the difficulty with the checked templates added"""
+        self.difficulty_bar.set_meter(self.parent.encounter.difficulty)
+        try:
+            count = max(int(self.count_var.get()), 0)
+        except ValueError:
+            count = 0
+        # The meter adds each preview character in O(1) on top of its running totals
+        preview = [template for template in self.template_list.get_selected_templates() for _ in range(count)]
+        self.difficulty_bar.set_preview(preview)
+        
     def setup_buttons(self):
         """Setup the action buttons"""
         button_frame = ttk.Frame(self.window)
@@ -84,6 +192,20 @@ class TemplatesScreen:
             command=self.add_selected_to_combat
         ).pack(side=tk.LEFT, padx=(0, 5))
         
+        # How many of each selected template to add
+        ttk.Label(left_buttons, text="Count:").pack(side=tk.LEFT)
+        self.count_var = tk.StringVar(value="1")
+        self.count_var.trace_add("write", lambda *args: self.on_selection_changed())
+        ttk.Spinbox(left_buttons, from_=1, to=500, width=5, textvariable=self.count_var).pack(side=tk.LEFT, padx=(2, 5))
+        
+        # Identical monsters can share one initiative slot and turn
+        self.group_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(left_buttons, text="Group initiative", variable=self.group_var).pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Saved with presets: roll initiative for the copies as they are spawned
+        self.roll_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(left_buttons, text="Roll initiative", variable=self.roll_var).pack(side=tk.LEFT, padx=(0, 10))
+        
         # Delete Selected button
         ttk.Button(
             left_buttons,
@@ -103,25 +225,40 @@ class TemplatesScreen:
         selected_templates = self.template_list.get_selected_templates()
         if not selected_templates:
             return
+        
+        count = self._count()
+        if count is None:
+            return
+        grouped = self.group_var.get()
             
         # Keep track of skipped templates
         skipped_templates = []
+        existing_names = {char.name for char in self.parent.engine.characters}
+        new_characters = []
         
         # Add each selected template as a new character
         for template in selected_templates:
-            # Check if a character with this name already exists
-            name_exists = any(char.name == template.name for char in self.parent.characters)
-            if name_exists:
+            if count > 1:
+                # Number the copies, continuing past names already in combat
+                names = self._numbered_names(template.name, count, existing_names)
+            elif template.name in existing_names:
+                # Check if a character with this name already exists
                 skipped_templates.append(template.name)
                 continue
+            else:
+                names = [template.name]
+                existing_names.add(template.name)
                 
-            # Create a copy of the template
-            char = template.copy()
-            # Add to the main combat tracker
-            self.parent.characters.append(char)
+            # Create copies of the template
+            for name in names:
+                char = template.copy()
+                char.name = name
+                if grouped:
+                    char.group = template.name
+                new_characters.append(char)
             
-        # Update the main combat tracker display
-        self.parent.update_character_list()
+        # Add to the main combat tracker in one batch
+        self.parent.engine.add_characters(new_characters)
         
         # Show warning if any templates were skipped
         if skipped_templates:
@@ -136,6 +273,30 @@ class TemplatesScreen:
         # Deselect all templates
         for item in self.template_list.template_tree.get_children():
             self.template_list.template_tree.set(item, "Selected", self.template_list.checkbox_unchecked)
+        self.on_selection_changed()
+        
+    def _count(self):
+        """Get the copy count, or None after telling the user it is invalid"""
+        try:
+            count = int(self.count_var.get())
+            if count < 1:
+                raise ValueError
+        except ValueError:
+            tk.messagebox.showerror("Invalid Count", "Please enter a whole number of at least 1", parent=self.window)
+            return None
+        return count
+        
+    def _numbered_names(self, base, count, existing_names):
+        """Get count unused names of the form 'Base N', reserving them in existing_names"""
+        names = []
+        number = 1
+        while len(names) < count:
+            name = f"{base} {number}"
+            number += 1
+            if name not in existing_names:
+                names.append(name)
+                existing_names.add(name)
+        return names
         
     def delete_selected_templates(self):
         """Delete selected templates"""
@@ -143,9 +304,6 @@ class TemplatesScreen:
         if not selected_templates:
             return
             
-        # Delete each selected template
-        for template in selected_templates:
-            self.template_list.delete_template(template)
-        
-        # Update the template list display
-        self.template_list.update_template_list()
+        # One batch for the library and the writer; the rows go with the library event
+        self.template_list.delete_templates(selected_templates)
+        self.on_selection_changed()
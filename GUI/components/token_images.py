@@ -0,0 +1,118 @@
+import tkinter as tk
+from collections import OrderedDict
+from character.token_thumbnails import ThumbnailWorker
+
+# Thumbnail sizes in pixels
+LIST_TOKEN_SIZE = 18
+PANEL_TOKEN_SIZE = 96
+
+# Most PhotoImages kept at once; widgets hold on to the ones they show
+MAX_IMAGES = 200
+
+# How often to collect thumbnails while the worker is busy
+POLL_MS = 50
+
+class TokenImages:
+    """Token thumbnails as PhotoImages, shared by every encounter.
+
+    Thumbnails are made by a ThumbnailWorker thread; get() returns None
+    until one is ready and subscribers are told when it is. The images
+    live in a least-recently-used cache of at most max_images entries, so
+    a roster with hundreds of tokens keeps only the recently shown ones in
+    memory. An image dropped from the cache is rebuilt from its cached PNG
+    the next time it is shown, without the worker.
+    """
+
+    def __init__(self, root, worker=None, max_images=MAX_IMAGES):
+        """
+        Initialize the token image cache
+
+        Args:
+            root: The root window, used to schedule polling
+            worker: ThumbnailWorker making the thumbnails (default: a new one)
+            max_images: Most PhotoImages kept at once
+        """
+        self.root = root
+        self.worker = worker if worker is not None else ThumbnailWorker()
+        self.max_images = max_images
+        self._images = OrderedDict()  # (source, size) -> PhotoImage, least recently used first
+        self._paths = {}  # (source, size) -> cached thumbnail PNG
+        self._errors = {}  # (source, size) -> why no thumbnail could be made
+        self._waiting = set()  # (source, size) requested from the worker
+        self._subscribers = []
+        self._poll_id = None
+
+    def subscribe(self, callback):
+        """Call callback(sources) with the token paths whose thumbnails became ready"""
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """Stop calling a subscribed callback"""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def get(self, source, size):
+        """
+        Get a token's thumbnail
+
+        Returns:
+            The PhotoImage, or None while it is being made or if the image
+            can't be read
+        """
+        key = (source, size)
+        image = self._images.get(key)
+        if image is not None:
+            self._images.move_to_end(key)
+            return image
+        path = self._paths.get(key)
+        if path is not None:
+            try:
+                image = tk.PhotoImage(master=self.root, file=path)
+            except tk.TclError:
+                del self._paths[key]  # The cached file is gone; make it again
+            else:
+                self._images[key] = image
+                while len(self._images) > self.max_images:
+                    self._images.popitem(last=False)
+                return image
+        if key not in self._waiting and key not in self._errors:
+            self._waiting.add(key)
+            self.worker.request(source, size)
+            if self._poll_id is None:
+                self._poll_id = self.root.after(POLL_MS, self._poll)
+        return None
+
+    def error(self, source, size):
+        """Get why a token's thumbnail couldn't be made, or None"""
+        return self._errors.get((source, size))
+
+    def forget(self, source):
+        """Drop everything known about a token image, e.g. after it was chosen again"""
+        for cache in (self._images, self._paths, self._errors):
+            for key in [key for key in cache if key[0] == source]:
+                del cache[key]
+
+    def _poll(self):
+        """Collect finished thumbnails and tell subscribers"""
+        self._poll_id = None
+        ready = set()
+        for thumbnail in self.worker.drain():
+            key = (thumbnail.source, thumbnail.size)
+            self._waiting.discard(key)
+            if thumbnail.path is not None:
+                self._paths[key] = thumbnail.path
+            else:
+                self._errors[key] = thumbnail.error
+            ready.add(thumbnail.source)
+        if self._waiting:
+            self._poll_id = self.root.after(POLL_MS, self._poll)
+        if ready:
+            for callback in list(self._subscribers):
+                callback(ready)
+
+    def close(self):
+        """Stop making thumbnails"""
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
+        self.worker.close()
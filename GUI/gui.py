@@ -1,47 +1,241 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from typing import Dict, List
-import copy
 import json
 import os
+import time
 from character.character import Character
-from PIL import Image, ImageTk
-from GUI.components.quick_edit import QuickEdit
+from combat.dice import DEFAULT_INITIATIVE
+from profiling.profiler import profiler
+
+# Startup budget from process start to the first painted frame
+STARTUP_TARGET_MS = 250
+
+# How often to apply template changes found by the watcher thread
+TEMPLATE_POLL_MS = 500
+
+# Encounter tabs that were open when the application closed
+ENCOUNTERS_PATH = os.path.join('saves', 'encounters.json')
 
 class CombatTrackerGUI:
-    def __init__(self, root):
+    def __init__(self, root, started=None):
+        """
+        Initialize the main window
+        
+        Args:
+            root: The root tkinter window
+            started: Optional time.perf_counter() value when the process started,
+                     used to measure startup time
+        """
         self.root = root
-        self.characters: List[Character] = []
+        self.started = started if started is not None else time.perf_counter()
+        self.initiative_formula = DEFAULT_INITIATIVE
         self.custom_fields: List[str] = []
         self.popup_entry = None
         self.current_round = 1
         
+        # Template library shared by every encounter, read on first use and
+        # written by a background thread so saving never blocks the UI
+        from character.template_store import TemplateStore
+        from character.template_writer import TemplateWriter
+        self.template_writer = TemplateWriter()
+        self.template_store = TemplateStore(writer=self.template_writer)
+        # Watches the template folder once startup has finished
+        self.template_watcher = None
+        # Finished combats; nothing is read until the archive is opened
+        from combat.archive import CampaignArchive
+        self.archive = CampaignArchive()
+        self.encounters = []
+        self.player_view = None
+        
         # Initialize app configuration
         from GUI.components.app_config import AppConfig
         self.app_config = AppConfig(root)
+        self.notebook = self.app_config.notebook
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_encounter_changed)
+        
+        # Token thumbnails shared by every encounter, made by a worker thread
+        from GUI.components.token_images import TokenImages
+        self.token_images = TokenImages(root)
         
         # Create menu bar
         self.create_menu_bar()
         
-        # Store frame references
-        self.character_list_frame = self.app_config.list_frame
-        self.character_detail_frame = self.app_config.detail_frame
-        
-        # Initialize UI
-        self.setup_round_counter()
-        self.setup_character_list()
-        self.setup_character_details()
+        # Keyboard shortcuts and the command palette
+        from GUI.components.hotkeys import Hotkeys
+        self.hotkeys = Hotkeys(root, self)
         
-        # Initialize session manager
-        from GUI.components.session_manager import SessionManager
-        self.session_manager = SessionManager(self)
+        # Reopen the encounter tabs from last time; their sessions load after the first paint
+        for info in self.read_encounter_list():
+            self.open_encounter(**info)
         
-        # Try to load last session
-        self.load_last_session()
+        # Load the last sessions once the first frame has been painted
+        self.root.after_idle(lambda: self.root.after(1, self.finish_startup))
         
         # Bind window close event
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+    def finish_startup(self):
+        """Deferred startup work that doesn't need to block the first paint"""
+        first_frame = time.perf_counter() - self.started
+        for encounter in self.encounters:
+            encounter.session_manager.load_last_session()
+        session_loaded = time.perf_counter() - self.started
+        
+        # Pick up template files edited outside the app, e.g. in a synced folder
+        from character.template_watcher import TemplateWatcher
+        self.template_watcher = TemplateWatcher(self.template_store)
+        self.template_watcher.start()
+        self.poll_template_changes()
+        
+        profiler.record('startup.first_frame', first_frame)
+        profiler.record('startup.session_loaded', session_loaded)
+        if profiler.enabled:
+            print(f"Startup: first frame {first_frame * 1000:.0f} ms "
+                  f"(target {STARTUP_TARGET_MS} ms), last session loaded {session_loaded * 1000:.0f} ms")
+
+    @property
+    def encounter(self):
+        """The encounter in the selected tab"""
+        selected = self.notebook.select()
+        for encounter in self.encounters:
+            if str(encounter.tab) == selected:
+                return encounter
+        return self.encounters[0]
+
+    @property
+    def engine(self):
+        """The selected encounter's combat engine"""
+        return self.encounter.engine
+
+    @property
+    def characters(self) -> List[Character]:
+        """The selected encounter's roster, in initiative order"""
+        return self.encounter.characters
+
+    @property
+    def session_manager(self):
+        """The selected encounter's session manager"""
+        return self.encounter.session_manager
+
+    @property
+    def character_list(self):
+        """The selected encounter's character list"""
+        return self.encounter.character_list
+
+    def on_encounter_changed(self, event=None):
+        """Point the player view and menu at the newly selected encounter"""
+        if not self.encounters:
+            return
+        if self.player_view is not None:
+            self.player_view.set_engine(self.engine)
+        self.menu_bar.mass_battle_var.set(self.encounter.mass_battle)
+
+    def set_mass_battle(self, enabled):
+        """Switch the selected encounter's list view"""
+        self.encounter.set_mass_battle(enabled)
+        self.write_encounter_list()
+
+    def start_player_view(self, lan=False):
+        """
+        Serve the selected encounter to players' browsers
+        
+        Args:
+            lan: Listen on every interface instead of only this computer
+        """
+        from player_view.server import PlayerViewServer
+        server = PlayerViewServer(self.engine, host='0.0.0.0' if lan else '127.0.0.1')
+        try:
+            server.start()
+        except OSError as e:
+            messagebox.showerror("Player View", f"Failed to start the player view server: {str(e)}")
+            return False
+        self.player_view = server
+        messagebox.showinfo("Player View", f"Player view running at {server.url}"
+                            + ("\nOther devices can use this computer's address on the same port." if lan else ""))
+        return True
+
+    def stop_player_view(self):
+        """Stop serving the player view"""
+        if self.player_view is not None:
+            self.player_view.stop()
+            self.player_view = None
+
+    def read_encounter_list(self) -> List[dict]:
+        """Get the encounter tabs to open, or a single default tab"""
+        try:
+            with open(ENCOUNTERS_PATH, 'r') as f:
+                encounters = json.load(f).get('encounters', [])
+            if encounters:
+                return encounters
+        except (OSError, ValueError, AttributeError):
+            pass
+        return [{'name': "Encounter 1"}]
+
+    def write_encounter_list(self):
+        """Remember which encounter tabs are open"""
+        os.makedirs(os.path.dirname(ENCOUNTERS_PATH), exist_ok=True)
+        with open(ENCOUNTERS_PATH, 'w') as f:
+            json.dump({'encounters': [encounter.to_dict() for encounter in self.encounters]}, f, indent=2)
+
+    def open_encounter(self, name, session_path=None, state_path=None, mass_battle=False):
+        """
+        Add an encounter tab
+        
+        Args:
+            name: Name shown on the tab
+            session_path: File the encounter is auto-saved to and restored from
+                          (default: the original single-session file)
+            state_path: File recording whether the encounter is still in combat
+            mass_battle: Use the canvas list built for thousands of rows
+        """
+        from GUI.components.encounter import Encounter
+        encounter = Encounter(self, name, session_path, state_path, mass_battle)
+        self.encounters.append(encounter)
+        return encounter
+
+    def new_encounter(self):
+        """Open a new, empty encounter tab with its own session file"""
+        used_paths = {encounter.session_manager.session_path for encounter in self.encounters}
+        used_names = {encounter.name for encounter in self.encounters}
+        number = 1
+        while True:
+            session_path = os.path.join('saves', f'encounter_{number}.json')
+            name = f"Encounter {number}"
+            if session_path not in used_paths and name not in used_names and not os.path.exists(session_path):
+                break
+            number += 1
+        encounter = self.open_encounter(name, session_path, os.path.join('saves', f'encounter_{number}_state.json'))
+        self.notebook.select(encounter.tab)
+        self.write_encounter_list()
+
+    def rename_encounter(self):
+        """Rename the selected encounter tab"""
+        from tkinter import simpledialog
+        encounter = self.encounter
+        name = simpledialog.askstring("Rename Encounter", "Encounter name:",
+                                      initialvalue=encounter.name, parent=self.root)
+        if name and name.strip():
+            encounter.rename(name.strip())
+            self.write_encounter_list()
+
+    def close_encounter(self):
+        """Close the selected encounter tab, discarding its session"""
+        if len(self.encounters) == 1:
+            messagebox.showinfo("Close Encounter", "The last encounter can't be closed. Use End Combat to clear it.")
+            return
+        encounter = self.encounter
+        if encounter.characters and not messagebox.askyesno(
+                "Close Encounter", f"Close {encounter.name}?\nIts characters and saved session will be removed."):
+            return
+        for path in (encounter.session_manager.session_path, encounter.session_manager.state_path):
+            if os.path.exists(path):
+                os.remove(path)
+        self.encounters.remove(encounter)
+        encounter.destroy()
+        self.on_encounter_changed()
+        self.write_encounter_list()
+
     def create_menu_bar(self):
         """Create the menu bar with File options"""
         from GUI.components.menu_bar import MenuBar
@@ -71,154 +265,67 @@ class CombatTrackerGUI:
         """Proxy method to maintain backward compatibility"""
         self.session_manager.load_from_file(file_path)
         
-    def setup_round_counter(self):
-        """Initialize the round counter"""
-        from GUI.components.round_counter import RoundCounter
-        self.round_counter = RoundCounter(self.character_list_frame, gui_ref=self)
-
-    def setup_character_list(self):
-        """Initialize the character list view"""
-        from GUI.components.character_list import CharacterList
-        self.character_list = CharacterList(self.character_list_frame, self)
-        
-    def update_character_list(self):
-        """Update the character list display"""
-        self.character_list.update_character_list(self.characters)
-
-    def edit_custom_fields(self, item):
-        """Open a dialog to edit custom fields"""
-        # Get the character
-        items = self.character_list.character_tree.get_children()
-        char_index = items.index(item)
-        char = self.characters[char_index]
-        
-        # Create and show the dialog
-        from GUI.components.custom_fields_dialog import CustomFieldsDialog
-        CustomFieldsDialog(self.root, char, self.character_list, self)
-
-    def setup_character_details(self):
-        """Initialize the character details panel"""
-        # Create a frame for character details
-        self.details_frame = ttk.Frame(self.character_detail_frame)
-        self.details_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Create a frame for quick edit
-        self.quick_edit_frame = ttk.Frame(self.character_detail_frame)
-        
-        # Initialize both panels
-        from GUI.components.character_details import CharacterDetails
-        self.character_details = CharacterDetails(self.details_frame, self)
-        self.quick_edit = QuickEdit(self.quick_edit_frame, self)
-        
-        # Start with character details visible
-        self.show_character_details()
-
     def add_character(self, char=None):
-        """Add a character to the combat tracker
-        
-        Args:
-            char: Optional Character instance. If not provided, creates a new character
-                 using the character details panel.
-        """
-        if char is None:
-            # Proxy to character details panel for backward compatibility
-            self.character_details.add_character()
-        else:
-            # Add provided character to the list
-            self.characters.append(char)
-            self.update_character_list()
-
-    def clear_character_details(self):
         """Proxy method to maintain backward compatibility"""
-        self.character_details.clear_character_details()
+        self.encounter.add_character(char)
 
     def update_character_list(self):
-        # Sort characters by initiative (highest to lowest), then bonus, then name
-        sorted_chars = sorted(self.characters, 
-                            key=lambda x: (-x.initiative, -x.initiative_bonus, x.name.lower()))
-        
-        # Update the internal list to maintain sort order
-        self.characters = sorted_chars
-        
-        # Update the character list display
-        self.character_list.update_character_list(self.characters)
+        """Proxy method to maintain backward compatibility"""
+        self.encounter.update_character_list()
+
+    def roll_initiative(self, selected_only=False):
+        """Roll initiative in the selected encounter"""
+        self.encounter.roll_initiative(selected_only)
 
-    def copy_character(self):
-        selected = self.character_list.character_tree.selection()
-        if not selected:
-            messagebox.showwarning("Warning", "Please select a character to copy")
+    def set_initiative_formula(self):
+        """Ask for the dice expression used to roll initiative"""
+        from tkinter import simpledialog
+        from combat.dice import DiceError, compile_expression
+        formula = simpledialog.askstring(
+            "Initiative Formula",
+            "Dice expression rolled for each character\n"
+            "(e.g. 1d20+initiative_bonus, 1d20adv+dex_mod):",
+            initialvalue=self.initiative_formula,
+            parent=self.root
+        )
+        if formula is None:
             return
-        
-        # Get the index of the selected item
-        items = self.character_list.character_tree.get_children()
-        idx = items.index(selected[0])
-        char = self.characters[idx]
-        
-        def on_copy_complete(new_char):
-            self.characters.append(new_char)
-            self.update_character_list()
-        
-        # Create and show the dialog
-        from GUI.components.copy_character_dialog import CopyCharacterDialog
-        CopyCharacterDialog(self.root, char, self.characters, on_copy_complete)
-
-    def delete_character(self):
-        selected = self.character_list.character_tree.selection()
-        if not selected:
-            messagebox.showwarning("Warning", "Please select a character to delete")
+        try:
+            compile_expression(formula)
+        except DiceError as e:
+            messagebox.showerror("Invalid Formula", str(e))
             return
-        
-        # Get the index of the selected item
-        items = self.character_list.character_tree.get_children()
-        idx = items.index(selected[0])
-        
-        deleted_char = self.characters.pop(idx)
-        # If the deleted character was the current turn, advance turn or clear
-        if hasattr(self.round_counter, "current_character"):
-            current_name = self.round_counter.current_character.get()
-            if current_name == getattr(deleted_char, 'name', str(deleted_char)):
-                if self.characters:
-                    # If we're deleting the last character in turn order, increment round
-                    if idx == len(self.characters):
-                        self.round_counter.increment_round()
-                    self.round_counter.set_current_character(getattr(self.characters[0], 'name', str(self.characters[0])))
-                else:
-                    self.round_counter.set_current_character("-")
-        self.update_character_list()
-
-    def end_combat(self):
-        """End the current combat, clearing all characters and preventing auto-load"""
-        if messagebox.askyesno("End Combat", "Are you sure you want to end combat?\nThis will remove all characters and start fresh next time."):
-            self.session_manager.end_combat()
-
-    def add_custom_field(self, field_name=None, value=None):
-        """Proxy method to maintain backward compatibility"""
-        return self.character_details.add_custom_field(field_name, value)
+        self.initiative_formula = formula.strip()
+
+    def poll_template_changes(self):
+        """Apply template changes the watcher thread found and report failed writes, on the Tk thread"""
+        for changes in self.template_watcher.drain():
+            self.template_store.apply_external(changes.saved, changes.removed)
+        errors = []
+        while not self.template_writer.errors.empty():
+            errors.append(self.template_writer.errors.get_nowait())
+        self.root.after(TEMPLATE_POLL_MS, self.poll_template_changes)
+        if errors:
+            messagebox.showerror("Templates", "\n".join(errors))
 
-    def show_character_details(self):
-        """Show the character details panel"""
-        self.quick_edit_frame.pack_forget()
-        self.details_frame.pack(fill=tk.BOTH, expand=True)
-        
-    def show_quick_edit(self):
-        """Show the quick edit panel"""
-        self.details_frame.pack_forget()
-        self.quick_edit_frame.pack(fill=tk.BOTH, expand=True)
-        
-    def on_character_selected(self, character):
-        """Handle character selection"""
-        if character:
-            self.show_quick_edit()
-            self.quick_edit.show_character(character)
-        else:
-            self.show_character_details()
-            
     def on_closing(self):
         """Handle window closing event"""
-        self.session_manager.auto_save_on_close()
+        for encounter in self.encounters:
+            encounter.session_manager.auto_save_on_close()
+            encounter.recorder.finish()
+        try:
+            self.write_encounter_list()
+        except OSError as e:
+            print(f"Failed to save the encounter list: {str(e)}")
+        self.stop_player_view()
+        if self.template_watcher is not None:
+            self.template_watcher.stop()
+        # Don't lose template saves still being written
+        self.template_writer.close(timeout=5)
+        self.token_images.close()
         self.root.destroy()
 
 if __name__ == "__main__":
     root = tk.Tk()
     app = CombatTrackerGUI(root)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
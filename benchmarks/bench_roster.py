@@ -0,0 +1,98 @@
+"""Roster benchmarks: add, delete, sort and turn advancement."""
+import random
+
+from benchmarks.fixtures import EngineHost, make_characters
+
+# Operations timed per repetition
+ADDS = 10
+DELETES = 10
+TURNS = 200
+
+def run(bench, sizes, root=None):
+    """Run the roster benchmarks for every roster size"""
+    for size in sizes:
+        roster = make_characters(size)
+        extra = make_characters(ADDS, seed=1)
+        host = EngineHost(roster, root)
+        engine = host.engine
+        ordered = list(engine.characters)
+
+        def reset():
+            engine.characters[:] = ordered
+            engine.set_round(1)
+
+        # Adding a character re-sorts the roster each time
+        def add():
+            for char in extra:
+                engine.add_character(char)
+        bench.measure('roster.add', size, add, setup=reset, ops=ADDS)
+
+        # Deleting characters from the middle of the roster
+        def delete():
+            for _ in range(min(DELETES, len(engine.characters))):
+                engine.remove_character(engine.characters[len(engine.characters) // 2])
+        bench.measure('roster.delete', size, delete, setup=reset, ops=min(DELETES, size))
+
+        # Full re-sort of a shuffled roster
+        rng = random.Random(size)
+
+        def shuffle():
+            reset()
+            rng.shuffle(engine.characters)
+        bench.measure('roster.sort', size, engine.sort, setup=shuffle)
+
+        # Rolling initiative for the whole roster in one batch
+        roll_rng = random.Random(size)
+        bench.measure('roster.roll_initiative', size,
+                      lambda: engine.roll_initiative(engine.characters, rng=roll_rng), setup=reset)
+
+        # Turn advancement
+        def start():
+            reset()
+            engine.set_combat_started(False)
+            engine.start_combat()
+
+        def advance():
+            for _ in range(TURNS):
+                engine.next_turn()
+        bench.measure('roster.next_turn', size, advance, setup=start, ops=TURNS)
+
+        # Treeview refresh, only when a display is available
+        if root is None:
+            bench.skip(f'roster.ui_refresh[{size}]', 'no display for Tk')
+            continue
+
+        from tkinter import ttk
+        from GUI.components.character_list import CharacterList
+        reset()
+        frame = ttk.Frame(root)
+        character_list = CharacterList(frame, host)
+        bench.measure('roster.ui_refresh.initial', size,
+                      lambda: character_list.update_character_list(engine.characters),
+                      setup=lambda: character_list.update_character_list([]))
+
+        def damage_one():
+            engine.damage(engine.characters[0], 1)
+        bench.measure('roster.ui_refresh.one_changed', size, damage_one)
+
+        def advance_ui():
+            for _ in range(TURNS):
+                engine.next_turn()
+        bench.measure('roster.ui_refresh.next_turn', size, advance_ui, setup=start, ops=TURNS)
+        engine.unsubscribe(character_list._on_engine_event)
+        frame.destroy()
+
+        # The same operations on the mass battle canvas list
+        from GUI.components.canvas_character_list import CanvasCharacterList
+        reset()
+        frame = ttk.Frame(root)
+        frame.pack()
+        canvas_list = CanvasCharacterList(frame, host)
+        root.update_idletasks()
+        bench.measure('roster.canvas_refresh.initial', size,
+                      lambda: canvas_list.update_character_list(engine.characters),
+                      setup=lambda: canvas_list.update_character_list([]))
+        bench.measure('roster.canvas_refresh.one_changed', size, damage_one)
+        bench.measure('roster.canvas_refresh.next_turn', size, advance_ui, setup=start, ops=TURNS)
+        engine.unsubscribe(canvas_list._on_engine_event)
+        frame.destroy()
@@ -0,0 +1,38 @@
+"""Session benchmarks: SessionManager.save_to_file and load_from_file, and the campaign archive."""
+import json
+import os
+
+from benchmarks.fixtures import EngineHost, make_characters
+from combat.archive import CampaignArchive
+
+def run(bench, sizes, work_dir, root=None):
+    """Run the session save/load benchmarks for every roster size"""
+    for size in sizes:
+        host = EngineHost(make_characters(size))
+        host.engine.start_combat()
+        for _ in range(3):
+            host.engine.next_turn()
+
+        file_path = os.path.join(work_dir, f"session_{size}.json")
+        bench.measure('session.save', size, lambda: host.session_manager.save_to_file(file_path))
+
+        loaded = EngineHost()
+        bench.measure('session.load', size, lambda: loaded.session_manager.load_from_file(file_path))
+        if len(loaded.engine.characters) != size:
+            raise RuntimeError(f"Loaded {len(loaded.engine.characters)} characters, expected {size}")
+
+        # A first-release file: a bare list of records without later fields
+        legacy_path = os.path.join(work_dir, f"session_{size}_legacy.json")
+        with open(legacy_path, 'w') as f:
+            json.dump([{'name': char.name, 'initiative': char.initiative, 'health': char.health,
+                        'ac': char.ac, 'custom_fields': char.custom_fields}
+                       for char in host.engine.characters], f)
+        bench.measure('session.load_legacy', size, lambda: loaded.session_manager.load_from_file(legacy_path))
+
+        # Archiving a finished combat, then finding and restoring it among others
+        archive = CampaignArchive(os.path.join(work_dir, f"archive_{size}"))
+        save_data = host.engine.to_dict()
+        bench.measure('archive.append', size, lambda: archive.append(save_data, "Benchmark"))
+        bench.measure('archive.search', size, lambda: archive.search("Combatant 1"))
+        entry = archive.entries()[-1]
+        bench.measure('archive.restore', size, lambda: loaded.engine.load_dict(archive.load(entry)))
@@ -0,0 +1,50 @@
+"""Startup benchmarks: module import time and time to the first frame."""
+import os
+import subprocess
+import sys
+
+from GUI.gui import STARTUP_TARGET_MS
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Imports the application entry point in a fresh interpreter
+IMPORT_PROBE = """
+import time
+started = time.perf_counter()
+import combat_tracker
+print(time.perf_counter() - started)
+"""
+
+# Builds the main window and reports when the first idle callback runs
+FIRST_FRAME_PROBE = """
+import time
+started = time.perf_counter()
+import tkinter as tk
+from GUI.gui import CombatTrackerGUI
+root = tk.Tk()
+app = CombatTrackerGUI(root, started=started)
+root.after_idle(lambda: (print(time.perf_counter() - started), root.destroy()))
+root.mainloop()
+"""
+
+def run_probe(source, work_dir):
+    """Run a probe in a fresh interpreter and return the seconds it printed"""
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    output = subprocess.check_output([sys.executable, '-c', source], cwd=work_dir, env=env, text=True)
+    return float(output.strip().splitlines()[-1])
+
+def run(bench, work_dir, root=None):
+    """Measure cold import and first-frame times against the startup target"""
+    timings = []
+    bench.measure('startup.import', 1, lambda: timings.append(run_probe(IMPORT_PROBE, work_dir)))
+    print(f"  {'':<32} in-process import {min(timings) * 1000:.1f} ms")
+
+    if root is None:
+        bench.skip('startup.first_frame', 'no display for Tk')
+        return
+
+    timings.clear()
+    bench.measure('startup.first_frame', 1, lambda: timings.append(run_probe(FIRST_FRAME_PROBE, work_dir)))
+    first_frame_ms = min(timings) * 1000
+    verdict = 'within' if first_frame_ms <= STARTUP_TARGET_MS else 'OVER'
+    print(f"  {'':<32} first frame {first_frame_ms:.1f} ms, {verdict} the {STARTUP_TARGET_MS} ms target")
@@ -0,0 +1,40 @@
+"""Template benchmarks: library loading and copy/spawn throughput."""
+import os
+
+from benchmarks.fixtures import EngineHost, HeadlessTemplateList, write_templates
+
+# Largest template library written to disk
+MAX_TEMPLATES = 10000
+# Copies spawned per repetition
+SPAWNS = 100
+
+def run(bench, sizes, work_dir, root=None):
+    """Run the template benchmarks for every library size"""
+    for size in sizes:
+        if size > MAX_TEMPLATES:
+            bench.skip(f'templates.load[{size}]', f'library capped at {MAX_TEMPLATES} files')
+            continue
+
+        template_dir = os.path.join(work_dir, f"templates_{size}")
+        write_templates(template_dir, size)
+        template_list = HeadlessTemplateList(template_dir)
+        bench.measure('templates.load', size, template_list.load_templates)
+        if len(template_list.templates) != size:
+            raise RuntimeError(f"Loaded {len(template_list.templates)} templates, expected {size}")
+
+        # Copying a template into a roster of the same size
+        template = template_list.templates[0]
+        host = EngineHost([t.copy() for t in template_list.templates])
+        roster = list(host.engine.characters)
+
+        def reset():
+            host.engine.characters[:] = roster
+
+        def spawn():
+            copies = []
+            for i in range(SPAWNS):
+                char = template.copy()
+                char.name = f"{template.name} copy {i}"
+                copies.append(char)
+            host.engine.add_characters(copies)
+        bench.measure('templates.spawn', size, spawn, setup=reset, ops=SPAWNS)
@@ -0,0 +1,38 @@
+"""Compare two benchmark result files.
+
+Usage:
+    python -m benchmarks.compare BASELINE.json CURRENT.json
+"""
+import argparse
+import json
+
+def load_results(file_path):
+    """Load results keyed by (name, size)"""
+    with open(file_path, 'r') as f:
+        data = json.load(f)
+    return {(r['name'], r['size']): r for r in data['results']}, data.get('meta', {})
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument('baseline')
+    parser.add_argument('current')
+    args = parser.parse_args(argv)
+
+    baseline, baseline_meta = load_results(args.baseline)
+    current, current_meta = load_results(args.current)
+    print(f"baseline: {baseline_meta.get('revision')}  current: {current_meta.get('revision')}")
+    print(f"{'benchmark':<34} {'size':>7} {'baseline ms':>12} {'current ms':>12} {'change':>8}")
+
+    for key in sorted(set(baseline) | set(current), key=lambda k: (k[0], k[1])):
+        name, size = key
+        old = baseline.get(key)
+        new = current.get(key)
+        old_ms = f"{old['min_s'] * 1000:.3f}" if old else '-'
+        new_ms = f"{new['min_s'] * 1000:.3f}" if new else '-'
+        change = ''
+        if old and new and old['min_s'] > 0:
+            change = f"{(new['min_s'] / old['min_s'] - 1) * 100:+.1f}%"
+        print(f"{name:<34} {size:>7} {old_ms:>12} {new_ms:>12} {change:>8}")
+
+if __name__ == '__main__':
+    main()
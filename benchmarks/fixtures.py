@@ -0,0 +1,75 @@
+"""Roster generators and display-free stand-ins for the Tk widgets.
+
+Combat state lives in CombatEngine, which needs no display. The remaining
+stand-ins only replace the parts of the real components that create
+widgets, so the benchmarks time the application's own code paths.
+"""
+from typing import List
+import json
+import os
+import random
+
+from character.character import Character
+from character.template_store import TemplateStore
+from combat.engine import CombatEngine
+from GUI.components.session_manager import SessionManager
+from GUI.components.template_list import TemplateList
+from GUI.components.token_images import TokenImages
+
+def make_characters(count: int, seed: int = 0) -> List[Character]:
+    """Create a roster of characters with random stats and unique names"""
+    rng = random.Random(seed)
+    characters = []
+    for i in range(count):
+        maxhp = rng.randint(5, 200)
+        characters.append(Character(
+            name=f"Combatant {i}",
+            initiative=rng.randint(1, 30),
+            initiative_bonus=rng.randint(-2, 8),
+            health=rng.randint(0, maxhp),
+            maxhp=maxhp,
+            ac=rng.randint(8, 22),
+            is_player=i % 10 == 0,
+            custom_fields={'CR': str(rng.randint(0, 20)), 'Speed': '30'}
+        ))
+    return characters
+
+def write_templates(template_dir: str, count: int, seed: int = 0) -> None:
+    """Write template files the way TemplateList.save_template does"""
+    os.makedirs(template_dir, exist_ok=True)
+    for char in make_characters(count, seed):
+        char.name = char.name.replace('Combatant', 'Template')
+        with open(os.path.join(template_dir, f"{char.name}.json"), 'w') as f:
+            json.dump(char.to_dict(), f, indent=4)
+
+class EngineHost:
+    """Stand-in for CombatTrackerGUI exposing only the engine, token images and button callbacks"""
+
+    def __init__(self, characters=None, root=None):
+        self.engine = CombatEngine()
+        self.engine.add_characters(characters or [])
+        self.session_manager = SessionManager(self)
+        # Services the real app shares between its encounters
+        self.app = self
+        self.token_images = TokenImages(root)
+
+    def copy_character(self):
+        pass
+
+    def delete_character(self):
+        pass
+
+    def end_combat(self):
+        pass
+
+    def on_character_selected(self, character):
+        pass
+
+class HeadlessTemplateList(TemplateList):
+    """TemplateList without the Treeview"""
+
+    def __init__(self, template_dir):
+        self.store = TemplateStore(template_dir)
+
+    def update_template_list(self):
+        pass
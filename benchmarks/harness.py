@@ -0,0 +1,60 @@
+from typing import Callable, Dict, List, Optional
+import statistics
+import time
+
+class BenchmarkRun:
+    """Collects timing results and skipped benchmarks for one suite run"""
+
+    def __init__(self, repeat: int = 5):
+        self.repeat = repeat
+        self.results: List[Dict] = []
+        self.skipped: List[Dict] = []
+
+    def measure(self, name: str, size: int, func: Callable[[], None],
+                setup: Optional[Callable[[], None]] = None, ops: int = 1) -> Dict:
+        """
+        Time a benchmark and store the result
+
+        Args:
+            name: Benchmark name, e.g. 'roster.sort'
+            size: Roster or library size the benchmark ran against
+            func: Code under test, called once per repetition
+            setup: Optional untimed preparation run before every repetition
+            ops: Number of operations func performs, used for per-op figures
+        """
+        timings = []
+        for _ in range(self.repeat):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+
+        result = {
+            'name': name,
+            'size': size,
+            'ops': ops,
+            'repeat': self.repeat,
+            'min_s': min(timings),
+            'median_s': statistics.median(timings),
+            'per_op_us': min(timings) / ops * 1_000_000,
+        }
+        self.results.append(result)
+        print(f"  {name:<32} n={size:<7} min {result['min_s'] * 1000:9.3f} ms"
+              f"  ({result['per_op_us']:10.2f} us/op)")
+        return result
+
+    def skip(self, name: str, reason: str) -> None:
+        """Record a benchmark that could not run in this environment"""
+        self.skipped.append({'name': name, 'reason': reason})
+        print(f"  {name:<32} skipped: {reason}")
+
+def headless_root():
+    """Create a withdrawn Tk root, or return None if no display is available"""
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception:
+        return None
+    root.withdraw()
+    return root
@@ -0,0 +1,84 @@
+"""Run the benchmark suite and save the results as JSON.
+
+Usage:
+    python -m benchmarks.run [--sizes 10,100,1000] [--repeat 5] [--output FILE]
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+
+# Allow running as a script from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import bench_roster, bench_session, bench_startup, bench_templates
+from benchmarks.harness import BenchmarkRun, headless_root
+
+DEFAULT_SIZES = [10, 100, 1000, 10000, 100000]
+QUICK_SIZES = [10, 100, 1000]
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+def git_revision():
+    """Get the current git revision, if available"""
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the combat tracker benchmarks")
+    parser.add_argument('--sizes', help="Comma-separated roster sizes (default: 10 to 100000)")
+    parser.add_argument('--quick', action='store_true', help="Only run sizes up to 1000")
+    parser.add_argument('--repeat', type=int, default=5, help="Repetitions per benchmark")
+    parser.add_argument('--output', help="Result file (default: benchmarks/results/<timestamp>.json)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.sizes:
+        sizes = [int(size) for size in args.sizes.split(',')]
+    else:
+        sizes = QUICK_SIZES if args.quick else DEFAULT_SIZES
+
+    bench = BenchmarkRun(repeat=args.repeat)
+    root = headless_root()
+    started = datetime.datetime.now()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        print("Roster")
+        bench_roster.run(bench, sizes, root=root)
+        print("Session")
+        bench_session.run(bench, sizes, work_dir, root=root)
+        print("Templates")
+        bench_templates.run(bench, sizes, work_dir, root=root)
+        print("Startup")
+        bench_startup.run(bench, work_dir, root=root)
+
+    if root is not None:
+        root.destroy()
+
+    output = args.output or os.path.join(RESULTS_DIR, started.strftime('%Y%m%d-%H%M%S') + '.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump({
+            'meta': {
+                'started': started.isoformat(timespec='seconds'),
+                'revision': git_revision(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'display': root is not None,
+                'repeat': args.repeat,
+                'sizes': sizes,
+            },
+            'results': bench.results,
+            'skipped': bench.skipped,
+        }, f, indent=2)
+    print(f"Results saved to {output}")
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, List, Optional
 import copy
+from character.condition import Condition
 
 @dataclass
 class Character:
@@ -10,7 +11,11 @@ class Character:
     health: int = 0
     maxhp: int = 0
     ac: int = 0
+    is_player: bool = False
+    group: Optional[str] = None  # Characters sharing a group share one initiative slot and turn
     custom_fields: Dict[str, str] = field(default_factory=dict)
+    conditions: List[Condition] = field(default_factory=list)
+    token: Optional[str] = None  # Path to a token image shown beside the name
     
     def copy(self) -> 'Character':
         """Create a deep copy of this character"""
@@ -29,19 +34,30 @@ class Character:
             'health': self.health,
             'maxhp': self.maxhp,
             'ac': self.ac,
-            'custom_fields': self.custom_fields
+            'is_player': self.is_player,
+            'group': self.group,
+            'custom_fields': self.custom_fields,
+            'conditions': [condition.to_dict() for condition in self.conditions],
+            'token': self.token
         }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Character':
-        """Create character from dictionary data"""
-        health = data['health']
+        """Create character from dictionary data in the current format
+        
+        Older records are completed by combat.schema.upgrade_character first.
+        """
+        conditions = data['conditions']
         return cls(
             name=data['name'],
             initiative=data['initiative'],
-            initiative_bonus=data.get('initiative_bonus', 0),  # Handle older saves
-            health=health,
-            maxhp=data.get('maxhp', health),  # For backwards compatibility, use health if maxhp not present
+            initiative_bonus=data['initiative_bonus'],
+            health=data['health'],
+            maxhp=data['maxhp'],
             ac=data['ac'],
-            custom_fields=data['custom_fields']
+            is_player=data['is_player'],
+            group=data['group'],
+            custom_fields=data['custom_fields'],
+            conditions=[Condition.from_dict(c) for c in conditions] if conditions else [],
+            token=data['token']
         )
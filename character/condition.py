@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass(eq=False)
+class Condition:
+    name: str
+    expires_round: Optional[int] = None  # Removed at the owner's turn in this round; None lasts until removed
+    health_per_turn: int = 0  # Applied at the start of each of the owner's turns (negative for damage)
+
+    def rounds_left(self, next_turn_round: int) -> Optional[int]:
+        """
+        Get how many more of the owner's turns this condition lasts
+
+        Args:
+            next_turn_round: Round of the owner's next turn (CombatEngine.next_turn_round),
+                             so a condition added for 3 turns shows 3 until the first of them
+        """
+        if self.expires_round is None:
+            return None
+        return max(0, self.expires_round - next_turn_round)
+
+    def describe(self, next_turn_round: int) -> str:
+        """Format the condition for display, e.g. 'Poisoned (3 rounds, -2 HP/turn)'"""
+        details = []
+        rounds = self.rounds_left(next_turn_round)
+        if rounds == 0:
+            details.append("last round")  # Ends when the owner's next turn starts
+        elif rounds is not None:
+            details.append(f"{rounds} round{'s' if rounds != 1 else ''}")
+        if self.health_per_turn:
+            details.append(f"{self.health_per_turn:+d} HP/turn")
+        return f"{self.name} ({', '.join(details)})" if details else self.name
+
+    def to_dict(self) -> dict:
+        """Convert condition to dictionary for saving"""
+        return {
+            'name': self.name,
+            'expires_round': self.expires_round,
+            'health_per_turn': self.health_per_turn
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Condition':
+        """Create condition from dictionary data in the current format"""
+        return cls(data['name'], data['expires_round'], data['health_per_turn'])
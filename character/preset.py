@@ -0,0 +1,172 @@
+"""Encounter presets: named sets of templates spawned together.
+
+A preset such as "Ambush" lists entries like 1 Ogre, 4 Goblins and
+2 Wolves. Spawning it copies every template, names the copies from the
+entry's pattern, optionally rolls their initiative, and adds them all in
+one engine batch, so the roster is sorted and redrawn once.
+"""
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set
+from character.character import Character
+
+# '{name}' is the template's name and '{n}' the copy's number
+DEFAULT_PATTERN = "{name} {n}"
+
+class PresetError(ValueError):
+    """Raised for a preset that can't be spawned"""
+
+@dataclass
+class PresetEntry:
+    template: str  # Name of the template to copy
+    count: int = 1
+    pattern: str = DEFAULT_PATTERN
+    group: bool = False  # Copies share one initiative slot
+    roll_initiative: bool = False
+
+    def to_dict(self) -> dict:
+        """Convert the entry to a dictionary for saving"""
+        return {
+            'template': self.template,
+            'count': self.count,
+            'pattern': self.pattern,
+            'group': self.group,
+            'roll_initiative': self.roll_initiative
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PresetEntry':
+        """Create an entry from dictionary data"""
+        return cls(
+            template=data['template'],
+            count=data.get('count', 1),
+            pattern=data.get('pattern', DEFAULT_PATTERN),
+            group=data.get('group', False),
+            roll_initiative=data.get('roll_initiative', False)
+        )
+
+@dataclass
+class EncounterPreset:
+    name: str
+    entries: List[PresetEntry] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """Convert the preset to a dictionary for saving"""
+        return {
+            'name': self.name,
+            'entries': [entry.to_dict() for entry in self.entries]
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'EncounterPreset':
+        """Create a preset from dictionary data"""
+        return cls(name=data['name'], entries=[PresetEntry.from_dict(e) for e in data['entries']])
+
+    def describe(self) -> str:
+        """Short summary such as '1 Ogre, 4 Goblin'"""
+        return ", ".join(f"{entry.count} {entry.template}" for entry in self.entries)
+
+def expand_names(pattern: str, base: str, count: int, existing_names: Set[str]) -> List[str]:
+    """
+    Get count unused names from a pattern, reserving them in existing_names
+
+    A single copy is named after the template when that name is free.
+    Numbers continue past names already taken.
+
+    Raises:
+        PresetError: if the pattern is invalid or can't give distinct names
+    """
+    if count == 1 and base not in existing_names:
+        existing_names.add(base)
+        return [base]
+    try:
+        numbered = [pattern.format(name=base, n=number) for number in (1, 2)]
+    except (KeyError, IndexError, ValueError) as e:
+        raise PresetError(f"Invalid name pattern '{pattern}': {e}") from None
+    if numbered[0] == numbered[1]:
+        raise PresetError(f"The name pattern '{pattern}' needs {{n}} to number copies of {base}")
+    names = []
+    number = 1
+    while len(names) < count:
+        name = pattern.format(name=base, n=number)
+        number += 1
+        if name not in existing_names:
+            names.append(name)
+            existing_names.add(name)
+    return names
+
+def unused_group(base: str, used: Set[str]) -> str:
+    """Get the first group name not in use: base, then 'base (2)', 'base (3)'..."""
+    if base not in used:
+        return base
+    number = 2
+    while f"{base} ({number})" in used:
+        number += 1
+    return f"{base} ({number})"
+
+def spawn(engine, preset: EncounterPreset, find_template: Callable[[str], Optional[Character]],
+          expression: Optional[str] = None) -> List[Character]:
+    """
+    Add a preset's characters to an engine with a single sort and refresh
+
+    Args:
+        engine: CombatEngine to add to
+        preset: The preset to spawn
+        find_template: Looks up a template by name
+        expression: Initiative dice expression for entries that roll
+                    (default: combat.dice.DEFAULT_INITIATIVE)
+
+    Raises:
+        PresetError: if a template is missing, a pattern is invalid or the
+            initiative can't be rolled; the roster is left unchanged
+    """
+    existing_names = {char.name for char in engine.characters}
+    # Each spawn gets groups of its own, so reinforcements don't join (and
+    # re-roll) a group already in combat
+    used_groups = {char.group for char in engine.characters if char.group is not None}
+    groups: Dict[str, str] = {}  # template name -> group for this spawn
+    spawned = []
+    to_roll = []
+    for entry in preset.entries:
+        template = find_template(entry.template)
+        if template is None:
+            raise PresetError(f"{preset.name}: there is no template named {entry.template}")
+        for name in expand_names(entry.pattern, template.name, entry.count, existing_names):
+            char = template.copy()
+            char.name = name
+            if entry.group:
+                if template.name not in groups:
+                    groups[template.name] = unused_group(template.name, used_groups)
+                    used_groups.add(groups[template.name])
+                char.group = groups[template.name]
+            spawned.append(char)
+            if entry.roll_initiative:
+                to_roll.append(char)
+
+    if to_roll:
+        _roll_initiative(to_roll, spawned, expression)
+    engine.add_characters(spawned)
+    return spawned
+
+def _roll_initiative(to_roll: List[Character], spawned: List[Character], expression: Optional[str]) -> None:
+    """Roll before anything is added, so a bad expression leaves the roster unchanged
+
+    The spawn's groups are new, so a group's roll only reaches its new members.
+    """
+    from combat.dice import DEFAULT_INITIATIVE, DiceError, compile_expression
+    # Groups roll once, with their first character's fields, like CombatEngine.roll_initiative
+    slots = {}
+    for char in to_roll:
+        slots.setdefault(char.group if char.group is not None else id(char), char)
+    rollers = list(slots.values())
+    try:
+        rolls = compile_expression(expression or DEFAULT_INITIATIVE).roll_many(rollers)
+    except DiceError as e:
+        raise PresetError(f"Initiative: {e}") from None
+    by_group = {}
+    for char, value in zip(rollers, rolls):
+        char.initiative = value
+        if char.group is not None:
+            by_group[char.group] = value
+    for char in spawned:
+        if char.group in by_group:
+            char.initiative = by_group[char.group]
@@ -0,0 +1,235 @@
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import json
+import os
+import sys
+from character.character import Character
+from character.preset import EncounterPreset
+from combat.schema import upgrade_character
+
+def default_template_dir() -> str:
+    """Get the templates directory next to the application"""
+    if getattr(sys, 'frozen', False):
+        # Running as PyInstaller bundle
+        return os.path.join(os.path.dirname(sys.executable), "templates")
+    # Running in development
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "templates")
+
+def scan_dir(template_dir: str) -> Dict[str, Tuple[int, int]]:
+    """Get (modification time, size) of every template file, without reading them"""
+    stats = {}
+    try:
+        entries = os.scandir(template_dir)
+    except FileNotFoundError:
+        return stats
+    with entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.is_file():
+                stat = entry.stat()
+                stats[entry.name] = (stat.st_mtime_ns, stat.st_size)
+    return stats
+
+def read_template(path: str) -> Character:
+    """Read one template file"""
+    with open(path, 'r') as f:
+        # Template files aren't versioned, so complete older records
+        return Character.from_dict(upgrade_character(json.load(f)))
+
+class TemplateStore:
+    """In-memory template library shared by every encounter and templates window.
+
+    Templates are read from disk on first use only; saving and deleting
+    update the cache and the file together, so opening another templates
+    window or switching encounters never reloads the library.
+
+    With a TemplateWriter, saving and deleting templates and presets update
+    the cache and notify at once, and the files are written in the
+    background; failures arrive on the writer's error queue.
+
+    Subscribers are called with (event, data):
+
+        'reset'   None, the library was (re)loaded from disk
+        'saved'   the template that was added or replaced
+        'deleted' list of templates that were removed
+        'presets' list of every encounter preset, after one was saved or deleted
+
+    apply_external() takes changes a TemplateWatcher found on disk and
+    reports them with the same 'saved' and 'deleted' events.
+
+    Encounter presets are kept in a 'presets' folder inside the template
+    directory and loaded with the templates.
+    """
+
+    def __init__(self, template_dir: Optional[str] = None, writer=None):
+        """
+        Args:
+            template_dir: Folder the templates are stored in (default: next to the application)
+            writer: Optional TemplateWriter to save and delete files in the background
+        """
+        self.template_dir = template_dir or default_template_dir()
+        self.writer = writer
+        self.templates: List[Character] = []
+        self.presets: List[EncounterPreset] = []
+        # Template file stats as of the last load, the baseline for watching the folder
+        self.file_stats: Dict[str, Tuple[int, int]] = {}
+        self.loaded = False
+        self._listeners: List[Callable] = []
+
+    def subscribe(self, callback: Callable) -> None:
+        """Register a callback(event, data) for library changes"""
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback: Callable) -> None:
+        """Remove a previously registered callback"""
+        try:
+            self._listeners.remove(callback)
+        except ValueError:
+            pass
+
+    def _emit(self, event: str, data=None) -> None:
+        for callback in list(self._listeners):
+            callback(event, data)
+
+    def path_for(self, name: str) -> str:
+        """Get the file a template with the given name is stored in"""
+        return os.path.join(self.template_dir, f"{name}.json")
+
+    @property
+    def preset_dir(self) -> str:
+        """Folder the encounter presets are stored in"""
+        return os.path.join(self.template_dir, "presets")
+
+    def preset_path_for(self, name: str) -> str:
+        """Get the file a preset with the given name is stored in"""
+        return os.path.join(self.preset_dir, f"{name}.json")
+
+    def ensure_loaded(self) -> List[Character]:
+        """Load the library unless it is already in memory"""
+        if not self.loaded:
+            self.load()
+        return self.templates
+
+    def load(self) -> List[Character]:
+        """(Re)read every template file from disk"""
+        if self.writer is not None:
+            # Read what was saved, not what was on disk before it
+            self.writer.flush()
+        os.makedirs(self.template_dir, exist_ok=True)
+        # Stat before reading, so a file changed meanwhile is seen as changed later
+        file_stats = scan_dir(self.template_dir)
+        templates = [read_template(os.path.join(self.template_dir, filename)) for filename in file_stats]
+        self.templates = templates
+        self.file_stats = file_stats
+        self.presets = self._load_presets()
+        self.loaded = True
+        self._emit('reset')
+        return templates
+
+    def _load_presets(self) -> List[EncounterPreset]:
+        presets = []
+        if os.path.isdir(self.preset_dir):
+            for filename in os.listdir(self.preset_dir):
+                if filename.endswith(".json"):
+                    with open(os.path.join(self.preset_dir, filename), 'r') as f:
+                        presets.append(EncounterPreset.from_dict(json.load(f)))
+        presets.sort(key=lambda preset: preset.name.lower())
+        return presets
+
+    def _write_file(self, path: str, text: str) -> None:
+        """Write a template or preset file, through the writer when there is one"""
+        if self.writer is not None:
+            self.writer.write(path, text)
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(text)
+
+    def _remove_file(self, path: str) -> None:
+        """Delete a template or preset file, through the writer when there is one"""
+        if self.writer is not None:
+            self.writer.remove(path)
+            return
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # File might not exist
+
+    def find(self, name: str) -> Optional[Character]:
+        """Get the template with the given name"""
+        for template in self.templates:
+            if template.name == name:
+                return template
+        return None
+
+    def save(self, character: Character) -> None:
+        """Save a template, replacing any template with the same name"""
+        self._write_file(self.path_for(character.name), json.dumps(character.to_dict(), indent=4))
+
+        existing = self.find(character.name)
+        if existing is not None:
+            self.templates[self.templates.index(existing)] = character
+        else:
+            self.templates.append(character)
+        self._emit('saved', character)
+
+    def delete(self, templates: List[Character]) -> None:
+        """Delete templates from disk and memory"""
+        doomed = {id(template) for template in templates}
+        removed = [template for template in self.templates if id(template) in doomed]
+        for template in templates:
+            self._remove_file(self.path_for(template.name))
+        if removed:
+            self.templates[:] = [template for template in self.templates if id(template) not in doomed]
+            self._emit('deleted', removed)
+
+    def apply_external(self, saved: Iterable[Character], removed: Iterable[str]) -> None:
+        """
+        Take in template files that were changed outside the app
+
+        Args:
+            saved: Templates read from added or changed files
+            removed: Names of templates whose files were removed
+        """
+        saved = list(saved)
+        for character in saved:
+            existing = self.find(character.name)
+            if existing is None:
+                self.templates.append(character)
+            elif existing.to_dict() != character.to_dict():
+                # Not just our own save coming back
+                self.templates[self.templates.index(existing)] = character
+            else:
+                continue
+            self._emit('saved', character)
+        # A renamed file removes its old name but may still hold the same template
+        saved_names = {character.name for character in saved}
+        gone = [template for template in (self.find(name) for name in removed if name not in saved_names)
+                if template is not None]
+        for template in gone:
+            self.templates.remove(template)
+        if gone:
+            self._emit('deleted', gone)
+
+    def find_preset(self, name: str) -> Optional[EncounterPreset]:
+        """Get the encounter preset with the given name"""
+        for preset in self.presets:
+            if preset.name == name:
+                return preset
+        return None
+
+    def save_preset(self, preset: EncounterPreset) -> None:
+        """Save an encounter preset, replacing any preset with the same name"""
+        self._write_file(self.preset_path_for(preset.name), json.dumps(preset.to_dict(), indent=4))
+
+        existing = self.find_preset(preset.name)
+        if existing is not None:
+            self.presets.remove(existing)
+        self.presets.append(preset)
+        self.presets.sort(key=lambda p: p.name.lower())
+        self._emit('presets', self.presets)
+
+    def delete_preset(self, preset: EncounterPreset) -> None:
+        """Delete an encounter preset from disk and memory"""
+        self._remove_file(self.preset_path_for(preset.name))
+        if preset in self.presets:
+            self.presets.remove(preset)
+            self._emit('presets', self.presets)
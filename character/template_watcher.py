@@ -0,0 +1,100 @@
+"""Watching the template folder for changes made outside the app.
+
+TemplateWatcher polls the folder on a background thread, comparing each
+file's modification time and size with the last time it looked. It
+reads only the files that were added or changed and queues the results.
+The Tk thread drains the queue (drain()) and passes the changes to
+TemplateStore.apply_external, so the store and widgets are only touched
+from the Tk thread.
+
+Polling suits shared and synced folders, where file-system notifications
+are often missing.
+"""
+import os
+import queue
+import threading
+from typing import List, NamedTuple, Optional
+from character.character import Character
+from character.template_store import read_template, scan_dir
+
+# Seconds between looks at the folder
+POLL_SECONDS = 2.0
+
+class TemplateChanges(NamedTuple):
+    """What changed in the folder since the last look"""
+    saved: List[Character]  # read from added or changed files
+    removed: List[str]  # names of templates whose files are gone
+
+class TemplateWatcher:
+    """Background poller reporting template files added, changed or removed"""
+
+    def __init__(self, store, interval: float = POLL_SECONDS):
+        """
+        Args:
+            store: TemplateStore whose folder is watched, and whose stats
+                   from its last load are the starting point
+            interval: Seconds between polls
+        """
+        self.store = store
+        self.interval = interval
+        self.changes: "queue.Queue[TemplateChanges]" = queue.Queue()
+        self._known = None  # filename -> (mtime, size) as last seen
+        self._baseline = None  # the store's file_stats the known stats started from
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start polling in a daemon thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="template-watcher", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling"""
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except OSError:
+                pass  # The folder may be briefly unavailable, e.g. a network drive
+
+    def poll(self) -> Optional[TemplateChanges]:
+        """Look at the folder once, queueing and returning any changes"""
+        store = self.store
+        if not store.loaded:
+            return None  # The store will read everything when it's first used
+        if store.file_stats is not self._baseline:
+            # First look, or the store reloaded: start from what it read
+            self._baseline = store.file_stats
+            self._known = dict(self._baseline)
+
+        current = scan_dir(store.template_dir)
+        saved = []
+        for filename, stat in current.items():
+            if self._known.get(filename) == stat:
+                continue
+            try:
+                saved.append(read_template(os.path.join(store.template_dir, filename)))
+            except (OSError, ValueError, KeyError, TypeError):
+                # Probably still being written; try again next time
+                current[filename] = self._known.get(filename)
+                continue
+        removed = [filename[:-len(".json")] for filename in self._known if filename not in current]
+        self._known = {filename: stat for filename, stat in current.items() if stat is not None}
+
+        if not saved and not removed:
+            return None
+        changes = TemplateChanges(saved, removed)
+        self.changes.put(changes)
+        return changes
+
+    def drain(self) -> List[TemplateChanges]:
+        """Take every queued change; call from the Tk thread"""
+        drained = []
+        while True:
+            try:
+                drained.append(self.changes.get_nowait())
+            except queue.Empty:
+                return drained
@@ -0,0 +1,93 @@
+"""Writing and deleting template files on a background thread.
+
+TemplateWriter keeps at most one pending operation per file, so saving
+the same template repeatedly or deleting a batch costs one pass over the
+files. A single thread does all the writes and deletes, one batch at a
+time. Each file is written next to its target and moved into place with
+os.replace, so readers such as the folder watcher never see half a
+file. Failures are queued in `errors` for the Tk thread to report.
+"""
+import os
+import queue
+import threading
+from typing import Dict, Optional
+
+class TemplateWriter:
+    """Single background writer for template files"""
+
+    def __init__(self):
+        self.errors: "queue.Queue[str]" = queue.Queue()
+        self._pending: Dict[str, Optional[str]] = {}  # path -> text to write, or None to delete
+        self._busy = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def write(self, path: str, text: str) -> None:
+        """Queue a file to be written, replacing any pending operation on it"""
+        self._queue(path, text)
+
+    def remove(self, path: str) -> None:
+        """Queue a file to be deleted, replacing any pending operation on it"""
+        self._queue(path, None)
+
+    def _queue(self, path: str, text: Optional[str]) -> None:
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The template writer has been closed")
+            self._pending[path] = text
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="template-writer", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued operation is done, returning False on timeout"""
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Finish the queued operations and stop the thread"""
+        finished = self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        return finished
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                batch, self._pending = self._pending, {}
+                self._busy = True
+            for path, text in batch.items():
+                try:
+                    if text is None:
+                        self._delete(path)
+                    else:
+                        self._write(path, text)
+                except OSError as e:
+                    action = "delete" if text is None else "save"
+                    self.errors.put(f"Failed to {action} {os.path.basename(path)}: {e}")
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()
+
+    @staticmethod
+    def _write(path: str, text: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w') as f:
+            f.write(text)
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def _delete(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass  # Already gone, e.g. never written
@@ -0,0 +1,135 @@
+"""Making token thumbnails on a background thread, without any Tk dependency.
+
+ThumbnailWorker shrinks token images with Pillow in a worker thread. Each
+thumbnail is made once and kept in saves/token_cache as a PNG named after
+the SHA-256 of the source image's bytes and the thumbnail size. The same
+picture used by many characters, or copied under another name, shares
+one file, and later sessions read it straight from the cache. Editing
+the image changes its hash, so a stale thumbnail is never shown.
+
+The Tk thread asks for thumbnails with request() and collects the results
+with drain(); GUI.components.token_images turns them into PhotoImages.
+"""
+import hashlib
+import os
+import queue
+import threading
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+TOKEN_CACHE_DIR = os.path.join('saves', 'token_cache')
+
+class Thumbnail(NamedTuple):
+    """A finished thumbnail request"""
+    source: str  # the token image
+    size: int  # width and height in pixels
+    path: Optional[str]  # the cached PNG, or None if the image couldn't be read
+    error: Optional[str]
+
+def content_hash(path: str) -> str:
+    """Get the SHA-256 of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def make_thumbnail(source: str, size: int, cache_dir: str = TOKEN_CACHE_DIR, digest: Optional[str] = None) -> str:
+    """
+    Get the cached thumbnail of an image, making it if needed
+
+    Args:
+        source: Image file
+        size: Width and height of the square thumbnail
+        cache_dir: Folder the thumbnails are kept in
+        digest: content_hash(source), if already known
+
+    Returns:
+        Path of the thumbnail PNG
+    """
+    if digest is None:
+        digest = content_hash(source)
+    path = os.path.join(cache_dir, f"{digest}-{size}.png")
+    if os.path.exists(path):
+        return path
+
+    # Pillow is only needed once a token has to be shrunk
+    from PIL import Image, ImageOps
+    with Image.open(source) as image:
+        # Crop to a centred square so every token fills its slot
+        thumbnail = ImageOps.fit(image.convert('RGBA'), (size, size), Image.Resampling.LANCZOS)
+    os.makedirs(cache_dir, exist_ok=True)
+    temp_path = f"{path}.{threading.get_ident()}.tmp"
+    thumbnail.save(temp_path, 'PNG')
+    os.replace(temp_path, path)
+    return path
+
+class ThumbnailWorker:
+    """Background thread making token thumbnails on request"""
+
+    def __init__(self, cache_dir: str = TOKEN_CACHE_DIR):
+        """
+        Args:
+            cache_dir: Folder the thumbnails are kept in
+        """
+        self.cache_dir = cache_dir
+        self.results: "queue.Queue[Thumbnail]" = queue.Queue()
+        self._pending: Dict[Tuple[str, int], None] = {}  # (source, size) requests in order, without repeats
+        self._digests: Dict[str, Tuple[Tuple[int, int], str]] = {}  # source -> ((mtime, size), hash)
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def request(self, source: str, size: int) -> None:
+        """Queue a thumbnail; its Thumbnail arrives on `results`"""
+        with self._condition:
+            if self._closed:
+                return
+            self._pending[(source, size)] = None
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="token-thumbnails", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def drain(self) -> List[Thumbnail]:
+        """Take every finished thumbnail; call from the Tk thread"""
+        drained = []
+        while True:
+            try:
+                drained.append(self.results.get_nowait())
+            except queue.Empty:
+                return drained
+
+    def close(self) -> None:
+        """Drop the queued requests and stop the thread"""
+        with self._condition:
+            self._closed = True
+            self._pending = {}
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed)
+                if self._closed:
+                    return
+                key = next(iter(self._pending))
+                del self._pending[key]
+            source, size = key
+            try:
+                path = make_thumbnail(source, size, self.cache_dir, self._digest(source))
+            except Exception as e:
+                # Missing files, unreadable images, or Pillow not installed
+                self.results.put(Thumbnail(source, size, None, str(e)))
+            else:
+                self.results.put(Thumbnail(source, size, path, None))
+
+    def _digest(self, source: str) -> str:
+        """Hash a source image, reusing the hash while the file is unchanged"""
+        stat = os.stat(source)
+        key = (stat.st_mtime_ns, stat.st_size)
+        known = self._digests.get(source)
+        if known is not None and known[0] == key:
+            return known[1]
+        digest = content_hash(source)
+        self._digests[source] = (key, digest)
+        return digest
@@ -0,0 +1,92 @@
+"""Parsing of typed-in character values without any Tk dependency.
+
+Every parser raises FieldError with a message meant to be shown next to
+the field, so forms can mark all invalid fields at once instead of
+stopping at the first one.
+"""
+import os
+from typing import Optional
+
+class FieldError(ValueError):
+    """Raised for a value that can't be used for a field"""
+
+def parse_name(text: str) -> str:
+    """Read a character name"""
+    name = text.strip()
+    if not name:
+        raise FieldError("Name can't be empty")
+    return name
+
+def parse_whole(text: str, label: str, minimum: Optional[int] = None,
+                default: Optional[int] = None) -> int:
+    """
+    Read a whole number
+
+    Args:
+        text: Text typed by the user
+        label: Field name used in the message
+        minimum: Smallest allowed value
+        default: Value for empty text; empty text is invalid without one
+    """
+    text = text.strip()
+    if not text and default is not None:
+        return default
+    try:
+        value = int(text)
+    except ValueError:
+        raise FieldError(f"{label} must be a whole number") from None
+    if minimum is not None and value < minimum:
+        raise FieldError(f"{label} can't be less than {minimum}")
+    return value
+
+def parse_initiative(text: str, context=None) -> int:
+    """Read an initiative value, rolling it if it is a dice expression"""
+    text = text.strip()
+    if not text:
+        return 0
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    from combat.dice import DiceError, roll
+    try:
+        return roll(text, context)
+    except DiceError as e:
+        raise FieldError(f"Initiative: {e}") from None
+
+def parse_amount(text: str, context=None, rng=None) -> int:
+    """Read a damage or healing amount: a whole number or a dice expression
+
+    Args:
+        text: Text typed by the user
+        context: Character whose fields dice expressions may use
+        rng: Optional random.Random for the roll
+    """
+    text = text.strip()
+    if not text:
+        raise FieldError("Enter an amount")
+    try:
+        value = int(text)
+    except ValueError:
+        from combat.dice import DiceError, roll
+        try:
+            value = roll(text, context, rng)
+        except DiceError as e:
+            raise FieldError(str(e)) from None
+    if value < 0:
+        raise FieldError("Amount can't be negative")
+    return value
+
+def parse_token(text: str) -> Optional[str]:
+    """Read a token image path; empty text means no token"""
+    path = text.strip()
+    if not path:
+        return None
+    if not os.path.isfile(path):
+        raise FieldError("Token image not found")
+    return path
+
+def check_health(health: int, maxhp: int) -> None:
+    """Check that current health fits under max HP"""
+    if health > maxhp:
+        raise FieldError("Current HP can't exceed Max HP")
@@ -0,0 +1,131 @@
+"""Campaign archive of finished combats, without any Tk dependency.
+
+Every archived combat is appended to one data file as a zlib-compressed
+session (CombatEngine.to_dict()), and a line describing it is appended
+to a small JSON-lines index next to it: when it ended, the encounter,
+the round reached and who took part, plus where its data starts.
+
+Browsing and searching only read the index; a combat is decompressed
+only when it is restored. Both files are append-only, so archiving
+never rewrites earlier combats. An entry is indexed after its data is
+written, so an interrupted append leaves unreferenced bytes at worst.
+"""
+import json
+import os
+import zlib
+from datetime import datetime
+from typing import List, NamedTuple, Optional, Tuple
+
+DEFAULT_ARCHIVE_PATH = os.path.join('saves', 'campaign_archive')
+
+class ArchiveEntry(NamedTuple):
+    """An archived combat, as described by the index"""
+    number: int
+    ended: str  # ISO date and time
+    encounter: str
+    rounds: int
+    participants: Tuple[str, ...]
+    offset: int  # Where the compressed session starts in the data file
+    length: int
+
+    def to_dict(self) -> dict:
+        """Convert the entry to an index line"""
+        return {
+            'number': self.number,
+            'ended': self.ended,
+            'encounter': self.encounter,
+            'rounds': self.rounds,
+            'participants': list(self.participants),
+            'offset': self.offset,
+            'length': self.length
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ArchiveEntry':
+        """Create an entry from an index line"""
+        return cls(data['number'], data['ended'], data['encounter'], data['rounds'],
+                   tuple(data['participants']), data['offset'], data['length'])
+
+    def matches(self, text: str) -> bool:
+        """Whether every word of a search appears in the date, encounter or a participant"""
+        haystack = " ".join((self.ended, self.encounter, *self.participants)).lower()
+        return all(word in haystack for word in text.lower().split())
+
+class CampaignArchive:
+    """Append-only store of finished combats with an index for browsing"""
+
+    def __init__(self, base_path: str = DEFAULT_ARCHIVE_PATH):
+        """
+        Args:
+            base_path: Path without extension; the data goes in base_path.dat
+                       and the index in base_path.idx
+        """
+        self.data_path = f"{base_path}.dat"
+        self.index_path = f"{base_path}.idx"
+        self._entries: Optional[List[ArchiveEntry]] = None
+
+    def entries(self) -> List[ArchiveEntry]:
+        """Every archived combat, oldest first; the index is read once"""
+        if self._entries is None:
+            entries = []
+            if os.path.exists(self.index_path):
+                with open(self.index_path, 'r') as f:
+                    for line in f:
+                        try:
+                            entries.append(ArchiveEntry.from_dict(json.loads(line)))
+                        except (ValueError, KeyError, TypeError):
+                            continue  # A line cut short by a crash
+            self._entries = entries
+        return self._entries
+
+    def search(self, text: str = "") -> List[ArchiveEntry]:
+        """Archived combats matching a search, newest first"""
+        entries = self.entries()
+        if text.strip():
+            entries = [entry for entry in entries if entry.matches(text)]
+        return list(reversed(entries))
+
+    def append(self, save_data: dict, encounter: str = "", ended: Optional[datetime] = None) -> ArchiveEntry:
+        """
+        Archive a combat
+
+        Args:
+            save_data: Combat state (CombatEngine.to_dict())
+            encounter: Name of the encounter it was fought in
+            ended: When it ended (default: now)
+        """
+        entries = self.entries()
+        blob = zlib.compress(json.dumps(save_data, separators=(',', ':')).encode('utf-8'))
+        directory = os.path.dirname(self.data_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.data_path, 'ab') as f:
+            offset = f.seek(0, os.SEEK_END)
+            f.write(blob)
+
+        entry = ArchiveEntry(
+            number=entries[-1].number + 1 if entries else 1,
+            ended=(ended or datetime.now()).isoformat(sep=' ', timespec='minutes'),
+            encounter=encounter,
+            rounds=save_data.get('round', 1),
+            participants=tuple(char['name'] for char in save_data.get('characters', [])),
+            offset=offset,
+            length=len(blob)
+        )
+        with open(self.index_path, 'a+b') as f:
+            # Start a fresh line if a crash cut the last one short
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.write(json.dumps(entry.to_dict()).encode('utf-8') + b"\n")
+        entries.append(entry)
+        return entry
+
+    def load(self, entry: ArchiveEntry) -> dict:
+        """Read back an archived combat, migrated to the current format"""
+        from combat.schema import migrate
+        with open(self.data_path, 'rb') as f:
+            f.seek(entry.offset)
+            blob = f.read(entry.length)
+        return migrate(json.loads(zlib.decompress(blob).decode('utf-8')))[0]
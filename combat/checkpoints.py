@@ -0,0 +1,165 @@
+"""Round checkpoints for rewinding combat, without any Tk dependency.
+
+RoundCheckpoints keeps the state at the start of every round. Snapshots
+are shared between checkpoints, so keeping every round costs memory in
+proportion to what changed, not to the size of the roster:
+
+- Each character's record is copied only when it changed since its last
+  snapshot. An unchanged character reuses the same Snapshot object.
+- The roster is stored as fixed-size chunks of snapshots. A chunk with no
+  changes is reused from the previous checkpoint while the order stays
+  the same.
+
+Restoring swaps the checkpoint's characters back into the engine. A
+character whose latest snapshot is the checkpoint's is already in that
+state and is reused as it is. Only the others are rebuilt from their
+records, in place, so every other view keeps pointing at the same
+objects.
+"""
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+from character.character import Character
+
+# Snapshots per chunk of the roster
+CHUNK_SIZE = 32
+
+def _copy_record(record: dict) -> dict:
+    """Copy a Character.to_dict() record down to its nested fields, faster than deepcopy"""
+    return {**record, 'custom_fields': dict(record['custom_fields']),
+            'conditions': [dict(condition) for condition in record['conditions']]}
+
+class Snapshot(NamedTuple):
+    """A character's record at some point; never modified once taken"""
+    character: Character
+    record: dict
+
+class Checkpoint(NamedTuple):
+    """The combat at the start of a round"""
+    round: int
+    chunks: Tuple[Tuple[Snapshot, ...], ...]
+    current: Optional[Character]
+
+    def snapshots(self):
+        for chunk in self.chunks:
+            yield from chunk
+
+class RoundCheckpoints:
+    """Keeps a checkpoint at the start of each round of an engine's combat"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.checkpoints: Dict[int, Checkpoint] = {}  # round -> checkpoint
+        self._latest: Dict[int, Snapshot] = {}  # id(character) -> its newest snapshot
+        self._dirty: Set[int] = set()  # ids of characters changed since their newest snapshot
+        self._chunks: Tuple[Tuple[Snapshot, ...], ...] = ()  # of the newest checkpoint
+        self._positions: Dict[int, int] = {}  # id(character) -> roster index at the newest checkpoint
+        self._order_dirty = True
+        self._round_seen = engine.round
+        self._restoring = False
+        engine.subscribe(self._on_engine_event)
+
+    def rounds(self) -> List[int]:
+        """Rounds that can be rewound to, in order"""
+        return sorted(self.checkpoints)
+
+    def clear(self) -> None:
+        """Forget every checkpoint"""
+        self.checkpoints = {}
+        self._latest = {}
+        self._dirty = set()
+        self._chunks = ()
+        self._order_dirty = True
+
+    def _on_engine_event(self, event, data) -> None:
+        if self._restoring:
+            return
+        if event == 'reset':
+            # A different combat was loaded
+            self.clear()
+            self._round_seen = self.engine.round
+            if self.engine.combat_started:
+                self.checkpoint()
+        elif event == 'changed':
+            for char in data:
+                self._dirty.add(id(char))
+        elif event == 'added':
+            self._order_dirty = True
+        elif event == 'removed':
+            for char in data:
+                self._latest.pop(id(char), None)
+                self._dirty.discard(id(char))
+            self._order_dirty = True
+        elif event == 'reordered':
+            self._order_dirty = True
+        elif event == 'combat':
+            if data:
+                self.clear()
+                self.checkpoint()
+            else:
+                self.clear()
+        elif event == 'round':
+            # Only a new round gets a checkpoint; going back a round doesn't
+            if data > self._round_seen and self.engine.combat_started:
+                self.checkpoint()
+            self._round_seen = data
+
+    def _snapshot(self, char: Character) -> Snapshot:
+        """The character's newest snapshot, taking a new one only if they changed"""
+        key = id(char)
+        snapshot = self._latest.get(key)
+        if snapshot is None or key in self._dirty:
+            snapshot = Snapshot(char, _copy_record(char.to_dict()))
+            self._latest[key] = snapshot
+            self._dirty.discard(key)
+        return snapshot
+
+    def checkpoint(self) -> Checkpoint:
+        """Keep the combat as it is now as the start of the current round"""
+        engine = self.engine
+        characters = engine.characters
+        if self._order_dirty:
+            chunks = tuple(tuple(self._snapshot(char) for char in characters[start:start + CHUNK_SIZE])
+                           for start in range(0, len(characters), CHUNK_SIZE))
+            self._positions = {id(char): idx for idx, char in enumerate(characters)}
+            self._order_dirty = False
+        else:
+            # Same order: only rebuild the chunks holding changed characters
+            changed = {self._positions[key] // CHUNK_SIZE for key in self._dirty if key in self._positions}
+            chunks = list(self._chunks)
+            for idx in changed:
+                start = idx * CHUNK_SIZE
+                chunks[idx] = tuple(self._snapshot(char) for char in characters[start:start + CHUNK_SIZE])
+            chunks = tuple(chunks)
+        self._chunks = chunks
+        checkpoint = Checkpoint(engine.round, chunks, engine.current)
+        self.checkpoints[engine.round] = checkpoint
+        return checkpoint
+
+    def restore(self, round_number: int) -> None:
+        """
+        Rewind the engine to the start of a round
+
+        Raises:
+            KeyError: if there is no checkpoint for the round
+        """
+        checkpoint = self.checkpoints[round_number]
+        characters = []
+        for snapshot in checkpoint.snapshots():
+            char = snapshot.character
+            key = id(char)
+            if self._latest.get(key) is not snapshot or key in self._dirty:
+                # Changed since: put the record back into the same object
+                vars(char).update(vars(Character.from_dict(_copy_record(snapshot.record))))
+                self._latest[key] = snapshot
+                self._dirty.discard(key)
+            characters.append(char)
+
+        self._restoring = True
+        try:
+            self.engine.restore(characters, checkpoint.round, True, checkpoint.current)
+        finally:
+            self._restoring = False
+        # Later rounds stay available, to go forward again
+        self._chunks = checkpoint.chunks
+        self._positions = {id(char): idx for idx, char in enumerate(characters)}
+        self._order_dirty = any(a is not b for a, b in zip(characters, self.engine.characters))
+        self._round_seen = checkpoint.round
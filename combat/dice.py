@@ -0,0 +1,144 @@
+import random
+import re
+from functools import lru_cache
+from typing import Iterable, List, Optional
+
+# Rolled when no other initiative formula is given
+DEFAULT_INITIATIVE = '1d20+initiative_bonus'
+
+# One term of an expression: dice ('2d6', 'd20', '2d20kh1', '1d20adv'),
+# a number ('3') or a character field ('initiative_bonus', 'dex_mod')
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<sign>[+-])
+      | (?P<count>\d*)[dD](?P<sides>\d+)(?P<keep>kh\d+|kl\d+|adv|dis)?
+      | (?P<number>\d+)
+      | (?P<name>[A-Za-z_]\w*)
+    )\s*""", re.VERBOSE)
+
+# Guards against typos like '1000000d6' locking up the UI
+MAX_DICE = 1000
+
+class DiceError(ValueError):
+    """Raised for malformed dice expressions or unknown field names"""
+
+class DiceExpression:
+    """A parsed dice expression that can be rolled many times.
+
+    Numbers are folded into a single constant at compile time, so rolling
+    only walks the dice and field terms.
+    """
+
+    def __init__(self, text: str, dice, names, constant: int):
+        self.text = text
+        self.dice = dice  # [(sign, count, sides, kept, highest), ...]
+        self.names = names  # [(sign, field name), ...]
+        self.constant = constant
+
+    def __repr__(self):
+        return f"DiceExpression({self.text!r})"
+
+    def roll(self, context=None, rng: Optional[random.Random] = None) -> int:
+        """Roll the expression once, reading field names from context"""
+        return self.roll_many([context], rng)[0]
+
+    def roll_many(self, contexts: Iterable, rng: Optional[random.Random] = None) -> List[int]:
+        """Roll the expression once per context
+
+        Every die of one term is drawn in a single choices() call for the
+        whole batch instead of one randint() call per die.
+        """
+        contexts = list(contexts)
+        rng = rng or random
+        totals = [self.constant] * len(contexts)
+        for sign, name in self.names:
+            for idx, context in enumerate(contexts):
+                totals[idx] += sign * field_value(context, name)
+        for sign, count, sides, kept, highest in self.dice:
+            draws = rng.choices(range(1, sides + 1), k=count * len(contexts))
+            if kept == count:
+                for idx in range(len(contexts)):
+                    totals[idx] += sign * sum(draws[idx * count:(idx + 1) * count])
+            else:
+                for idx in range(len(contexts)):
+                    group = sorted(draws[idx * count:(idx + 1) * count], reverse=highest)
+                    totals[idx] += sign * sum(group[:kept])
+        return totals
+
+def field_value(context, name: str) -> int:
+    """Get the numeric value of a character field or custom field"""
+    if context is None:
+        raise DiceError(f"'{name}' needs a character to roll for")
+    value = getattr(context, name, None)
+    if value is None or isinstance(value, (dict, list)):
+        value = getattr(context, 'custom_fields', {}).get(name)
+    if isinstance(value, bool) or value is None:
+        raise DiceError(f"Unknown field '{name}'")
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise DiceError(f"Field '{name}' is not a number: {value!r}")
+
+@lru_cache(maxsize=256)
+def compile_expression(text: str) -> DiceExpression:
+    """
+    Parse a dice expression, caching the result by its text
+
+    Args:
+        text: Expression such as '1d20+initiative_bonus', '8d6', '2d20kh1' or '1d20adv'
+    """
+    dice = []
+    names = []
+    constant = 0
+    sign = 1
+    expect_term = True
+    pos = 0
+    text_end = len(text.rstrip())
+    while pos < text_end:
+        match = _TOKEN.match(text, pos)
+        if not match or match.end() == pos:
+            raise DiceError(f"Unexpected '{text[pos:].strip()}' in dice expression")
+        pos = match.end()
+
+        if match.group('sign'):
+            if not expect_term:
+                sign = 1 if match.group('sign') == '+' else -1
+                expect_term = True
+                continue
+            if match.group('sign') == '-':
+                sign = -sign
+            continue
+        if not expect_term:
+            raise DiceError(f"Missing '+' or '-' before '{match.group().strip()}'")
+
+        if match.group('sides') is not None:
+            count = int(match.group('count') or 1)
+            sides = int(match.group('sides'))
+            keep = match.group('keep')
+            kept, highest = count, True
+            if keep in ('adv', 'dis'):
+                # Advantage rolls the dice twice and keeps the better set
+                kept, highest, count = count, keep == 'adv', count * 2
+            elif keep:
+                kept, highest = int(keep[2:]), keep.startswith('kh')
+            if sides < 1 or count < 1:
+                raise DiceError(f"Invalid dice '{match.group().strip()}'")
+            if count > MAX_DICE:
+                raise DiceError(f"Too many dice in '{match.group().strip()}' (at most {MAX_DICE})")
+            if not 1 <= kept <= count:
+                raise DiceError(f"Cannot keep {kept} of {count} dice")
+            dice.append((sign, count, sides, kept, highest))
+        elif match.group('number') is not None:
+            constant += sign * int(match.group('number'))
+        else:
+            names.append((sign, match.group('name')))
+        sign = 1
+        expect_term = False
+
+    if expect_term:
+        raise DiceError(f"Incomplete dice expression '{text}'" if text.strip() else "Empty dice expression")
+    return DiceExpression(text, dice, names, constant)
+
+def roll(text: str, context=None, rng: Optional[random.Random] = None) -> int:
+    """Roll a dice expression once"""
+    return compile_expression(text).roll(context, rng)
@@ -0,0 +1,228 @@
+"""Encounter difficulty from the roster, kept up to date incrementally.
+
+Uses the Dungeon Master's Guide method: monsters are worth XP by
+challenge rating (custom field 'cr', or 'xp' to give it directly), the
+total is multiplied by a factor for the number of monsters, and the
+result is compared with the party's thresholds, summed from each
+player's 'level' custom field.
+
+DifficultyMeter keeps running totals and each character's contribution,
+so an added, removed or edited combatant costs O(1) however large the
+roster is; only a roster reset recounts everyone.
+"""
+from fractions import Fraction
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+CR_FIELD = 'cr'
+XP_FIELD = 'xp'
+LEVEL_FIELD = 'level'
+
+XP_BY_CR = {
+    Fraction(0): 10, Fraction(1, 8): 25, Fraction(1, 4): 50, Fraction(1, 2): 100,
+    Fraction(1): 200, Fraction(2): 450, Fraction(3): 700, Fraction(4): 1100, Fraction(5): 1800,
+    Fraction(6): 2300, Fraction(7): 2900, Fraction(8): 3900, Fraction(9): 5000, Fraction(10): 5900,
+    Fraction(11): 7200, Fraction(12): 8400, Fraction(13): 10000, Fraction(14): 11500,
+    Fraction(15): 13000, Fraction(16): 15000, Fraction(17): 18000, Fraction(18): 20000,
+    Fraction(19): 22000, Fraction(20): 25000, Fraction(21): 33000, Fraction(22): 41000,
+    Fraction(23): 50000, Fraction(24): 62000, Fraction(25): 75000, Fraction(26): 90000,
+    Fraction(27): 105000, Fraction(28): 120000, Fraction(29): 135000, Fraction(30): 155000,
+}
+
+# Easy, medium, hard and deadly XP thresholds per character level
+THRESHOLDS = {
+    1: (25, 50, 75, 100), 2: (50, 100, 150, 200), 3: (75, 150, 225, 400),
+    4: (125, 250, 375, 500), 5: (250, 500, 750, 1100), 6: (300, 600, 900, 1400),
+    7: (350, 750, 1100, 1700), 8: (450, 900, 1400, 2100), 9: (550, 1100, 1600, 2400),
+    10: (600, 1200, 1900, 2800), 11: (800, 1600, 2400, 3600), 12: (1000, 2000, 3000, 4500),
+    13: (1100, 2200, 3400, 5100), 14: (1250, 2500, 3800, 5700), 15: (1400, 2800, 4300, 6400),
+    16: (1600, 3200, 4800, 7200), 17: (2000, 3900, 5900, 8800), 18: (2100, 4200, 6300, 9500),
+    19: (2400, 4900, 7300, 10900), 20: (2800, 5700, 8500, 12700),
+}
+
+DIFFICULTIES = ('Trivial', 'Easy', 'Medium', 'Hard', 'Deadly')
+
+# (fewest monsters, multiplier), from the top
+MULTIPLIERS = ((15, 4.0), (11, 3.0), (7, 2.5), (3, 2.0), (2, 1.5), (1, 1.0))
+# The same steps, for moving one step with the party's size
+STEPS = (0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 4.0, 5.0)
+
+NO_THRESHOLDS = (0, 0, 0, 0)
+
+class Rating(NamedTuple):
+    """Difficulty of an encounter"""
+    difficulty: str
+    xp: int  # monster XP before the multiplier
+    adjusted_xp: int
+    multiplier: float
+    thresholds: Tuple[int, int, int, int]
+    monsters: int
+    players: int
+    unrated: int  # characters without a CR/XP or level
+
+def monster_xp(char) -> Optional[int]:
+    """Get a monster's XP from its 'xp' or 'cr' custom field"""
+    fields = char.custom_fields
+    try:
+        if str(fields.get(XP_FIELD, '')).strip():
+            return int(fields[XP_FIELD])
+        if str(fields.get(CR_FIELD, '')).strip():
+            return XP_BY_CR.get(Fraction(str(fields[CR_FIELD]).strip()))
+    except (TypeError, ValueError, ZeroDivisionError):
+        pass
+    return None
+
+def player_thresholds(char) -> Optional[Tuple[int, int, int, int]]:
+    """Get a player's thresholds from their 'level' custom field"""
+    try:
+        return THRESHOLDS.get(int(char.custom_fields.get(LEVEL_FIELD)))
+    except (TypeError, ValueError):
+        return None
+
+def multiplier(monsters: int, players: int) -> float:
+    """Encounter multiplier for the number of monsters, adjusted for party size"""
+    if monsters <= 0:
+        return 1.0
+    base = next(value for fewest, value in MULTIPLIERS if monsters >= fewest)
+    step = STEPS.index(base)
+    if 0 < players < 3:
+        step += 1
+    elif players >= 6:
+        step -= 1
+    return STEPS[max(0, min(step, len(STEPS) - 1))]
+
+class DifficultyMeter:
+    """Running difficulty totals for an engine's roster.
+
+    Subscribers are called with the new Rating after every change.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.xp = 0
+        self.monsters = 0
+        self.players = 0
+        self.unrated = 0
+        self.thresholds = list(NO_THRESHOLDS)
+        self._contributions: Dict[int, tuple] = {}  # id(character) -> contribution
+        self._listeners: List[Callable] = []
+        self.recount()
+        engine.subscribe(self._on_engine_event)
+
+    def subscribe(self, callback: Callable) -> None:
+        """Register a callback(rating) for difficulty changes"""
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback: Callable) -> None:
+        """Remove a previously registered callback"""
+        try:
+            self._listeners.remove(callback)
+        except ValueError:
+            pass
+
+    def close(self) -> None:
+        """Stop following the engine"""
+        self.engine.unsubscribe(self._on_engine_event)
+
+    @staticmethod
+    def contribution(char) -> tuple:
+        """What a character adds to the totals: (players, monsters, unrated, xp, thresholds)"""
+        if char.is_player:
+            thresholds = player_thresholds(char)
+            return (1, 0, 0 if thresholds else 1, 0, thresholds or NO_THRESHOLDS)
+        xp = monster_xp(char)
+        return (0, 1, 0 if xp is not None else 1, xp or 0, NO_THRESHOLDS)
+
+    def _apply(self, contribution: tuple, sign: int) -> None:
+        players, monsters, unrated, xp, thresholds = contribution
+        self.players += sign * players
+        self.monsters += sign * monsters
+        self.unrated += sign * unrated
+        self.xp += sign * xp
+        for idx, value in enumerate(thresholds):
+            self.thresholds[idx] += sign * value
+
+    def add(self, char) -> None:
+        """Count a character"""
+        contribution = self.contribution(char)
+        self._contributions[id(char)] = contribution
+        self._apply(contribution, 1)
+
+    def remove(self, char) -> None:
+        """Stop counting a character, subtracting exactly what it added"""
+        contribution = self._contributions.pop(id(char), None)
+        if contribution is not None:
+            self._apply(contribution, -1)
+
+    def update(self, char) -> None:
+        """Recount a character whose fields changed"""
+        contribution = self.contribution(char)
+        if self._contributions.get(id(char)) != contribution:
+            self.remove(char)
+            self._contributions[id(char)] = contribution
+            self._apply(contribution, 1)
+
+    def recount(self) -> None:
+        """Count the whole roster from scratch"""
+        self.xp = self.monsters = self.players = self.unrated = 0
+        self.thresholds = list(NO_THRESHOLDS)
+        self._contributions = {}
+        for char in self.engine.characters:
+            self.add(char)
+
+    def _on_engine_event(self, event, data) -> None:
+        if event == 'added':
+            for char in data:
+                self.add(char)
+        elif event == 'removed':
+            for char in data:
+                self.remove(char)
+        elif event == 'changed':
+            for char in data:
+                self.update(char)
+        elif event == 'reset':
+            self.recount()
+        else:
+            return
+        rating = self.rating()
+        for callback in list(self._listeners):
+            callback(rating)
+
+    def rating(self, extra: Iterable = ()) -> Rating:
+        """
+        Rate the encounter, optionally as if more characters were added
+
+        Args:
+            extra: Characters to include without adding them, for previews
+        """
+        players, monsters, unrated, xp = self.players, self.monsters, self.unrated, self.xp
+        thresholds = list(self.thresholds)
+        for char in extra:
+            add_players, add_monsters, add_unrated, add_xp, add_thresholds = self.contribution(char)
+            players += add_players
+            monsters += add_monsters
+            unrated += add_unrated
+            xp += add_xp
+            thresholds = [a + b for a, b in zip(thresholds, add_thresholds)]
+
+        factor = multiplier(monsters, players)
+        adjusted = int(xp * factor)
+        difficulty = DIFFICULTIES[0]
+        if any(thresholds):
+            for name, threshold in zip(DIFFICULTIES[1:], thresholds):
+                if adjusted >= threshold:
+                    difficulty = name
+        return Rating(difficulty, xp, adjusted, factor, tuple(thresholds), monsters, players, unrated)
+
+def describe(rating: Rating) -> str:
+    """One-line summary of a rating for the UI"""
+    if not rating.players:
+        text = f"{rating.adjusted_xp} XP (x{rating.multiplier:g}), no party"
+    elif not any(rating.thresholds):
+        text = f"{rating.adjusted_xp} XP (x{rating.multiplier:g}), party levels unknown"
+    else:
+        easy, medium, hard, deadly = rating.thresholds
+        text = (f"{rating.difficulty}: {rating.adjusted_xp} XP (x{rating.multiplier:g}) "
+                f"vs {easy}/{medium}/{hard}/{deadly}")
+    if rating.unrated:
+        text += f"; {rating.unrated} without CR/level"
+    return text
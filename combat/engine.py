@@ -0,0 +1,519 @@
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from character.character import Character
+from character.condition import Condition
+from combat.timer_wheel import TimerWheel
+from combat.turn_timer import TurnTimer
+
+# Order in which coalesced events are delivered at the end of a batch
+EVENT_ORDER = ('reset', 'removed', 'added', 'changed', 'reordered', 'round', 'combat', 'turn')
+
+class CombatEngine:
+    """Roster, turn cursor and round counter without any Tk dependency.
+
+    Every state change is a plain method call that notifies subscribers with
+    an (event, data) pair:
+
+        'added'     list of characters added to the roster
+        'removed'   list of characters removed from the roster
+        'changed'   list of characters whose fields changed
+        'reordered' None, the initiative order changed
+        'reset'     None, the whole roster was replaced
+        'round'     the new round number
+        'combat'    whether combat has started
+        'turn'      the character whose turn it is (or None)
+
+    Inside a batch() block events are coalesced and delivered once when the
+    outermost block exits, so bulk edits cause a single repaint.
+    """
+
+    def __init__(self):
+        self.characters: List[Character] = []
+        self.round = 1
+        self.combat_started = False
+        self.current: Optional[Character] = None
+        self.turn_timer = TurnTimer()
+        self.timers = TimerWheel()
+        self._turn_index = None
+        self._listeners: List[Callable] = []
+        self._batch_depth = 0
+        self._pending: Dict[str, object] = {}
+
+    # Events
+
+    def subscribe(self, callback: Callable) -> None:
+        """Register a callback(event, data) for state changes"""
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback: Callable) -> None:
+        """Remove a previously registered callback"""
+        try:
+            self._listeners.remove(callback)
+        except ValueError:
+            pass
+
+    @contextmanager
+    def batch(self):
+        """Coalesce all events raised inside the block into one delivery"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush()
+
+    def _emit(self, event: str, data=None) -> None:
+        """Deliver an event now, or queue it while batching"""
+        if self._batch_depth:
+            if event in ('added', 'removed', 'changed'):
+                self._pending.setdefault(event, []).extend(data)
+            else:
+                self._pending[event] = data
+            return
+        for callback in list(self._listeners):
+            callback(event, data)
+
+    def _flush(self) -> None:
+        """Deliver the events queued during a batch"""
+        pending, self._pending = self._pending, {}
+        if 'reset' in pending:
+            # A reset supersedes any roster events raised before it
+            for event in ('removed', 'added', 'changed', 'reordered'):
+                pending.pop(event, None)
+        if 'changed' in pending:
+            # Report each character once, in first-changed order
+            pending['changed'] = list({id(char): char for char in pending['changed']}.values())
+        for event in EVENT_ORDER:
+            if event in pending:
+                self._emit(event, pending[event])
+
+    # Roster
+
+    @staticmethod
+    def sort_key(char: Character):
+        """Initiative order: highest initiative, then bonus, then name
+        
+        Group members sort by their group name so they stay next to each
+        other, ahead of an ungrouped character of the same name.
+        """
+        return (-char.initiative, -char.initiative_bonus, (char.group or char.name).lower(),
+                char.group is None, char.name.lower())
+
+    @staticmethod
+    def turn_name(char: Character) -> str:
+        """Name shown for a character's turn: their group, if they have one"""
+        return char.group or char.name
+
+    def sort(self) -> None:
+        """Sort the roster into initiative order"""
+        old_order = self.characters
+        new_order = sorted(old_order, key=self.sort_key)
+        if any(a is not b for a, b in zip(old_order, new_order)):
+            self.characters[:] = new_order
+            self._turn_index = None
+            self._emit('reordered')
+
+    def add_character(self, char: Character) -> None:
+        """Add a character and place it in initiative order"""
+        self.add_characters([char])
+
+    def add_characters(self, chars: Iterable[Character]) -> None:
+        """Add several characters with a single sort and event"""
+        chars = list(chars)
+        if not chars:
+            return
+        # Newcomers to a group take the group's initiative so its slot stays together
+        grouped = [char for char in chars if char.group is not None]
+        if grouped:
+            leaders = {}
+            for char in self.characters + grouped:
+                leader = leaders.setdefault(char.group, char) if char.group is not None else None
+                if leader is not None and leader is not char:
+                    char.initiative = leader.initiative
+                    char.initiative_bonus = leader.initiative_bonus
+        with self.batch():
+            self.characters.extend(chars)
+            self._emit('added', chars)
+            self.sort()
+
+    def remove_character(self, char: Character) -> None:
+        """Remove a character, passing the turn on if it was theirs"""
+        idx = self.index_of(char)
+        if idx is None:
+            return
+        with self.batch():
+            del self.characters[idx]
+            self._turn_index = None
+            self.timers.discard_owner(char)
+            self._emit('removed', [char])
+
+            if char is self.current:
+                if self.characters:
+                    # The next character in order now occupies the same index
+                    if idx == len(self.characters):
+                        idx = 0
+                        self.increment_round()
+                    self.set_current(self.characters[idx])
+                else:
+                    self.set_current(None)
+
+    def clear(self) -> None:
+        """Remove all characters and reset the round and turn"""
+        with self.batch():
+            self.characters.clear()
+            self._turn_index = None
+            self.timers.clear()
+            self.turn_timer.clear()
+            self.set_round(1)
+            self.set_current(None)
+            self.set_combat_started(False)
+            self._emit('reset')
+
+    def index_of(self, char: Character) -> Optional[int]:
+        """Get a character's position in the roster by identity"""
+        for idx, other in enumerate(self.characters):
+            if other is char:
+                return idx
+        return None
+
+    def members(self, char: Character) -> List[Character]:
+        """Get the characters sharing a character's initiative slot"""
+        if char.group is None:
+            return [char]
+        return [other for other in self.characters if other.group == char.group] or [char]
+
+    def _slot_start(self, idx: int) -> int:
+        """Get the first roster index of the slot containing idx"""
+        group = self.characters[idx].group
+        if group is not None:
+            while idx > 0 and self.characters[idx - 1].group == group:
+                idx -= 1
+        return idx
+
+    def _slot_end(self, idx: int) -> int:
+        """Get the roster index just past the slot containing idx"""
+        group = self.characters[idx].group
+        end = idx + 1
+        if group is not None:
+            while end < len(self.characters) and self.characters[end].group == group:
+                end += 1
+        return end
+
+    def find(self, name: str) -> Optional[Character]:
+        """Get the first character with the given name"""
+        for char in self.characters:
+            if char.name == name:
+                return char
+        return None
+
+    # Character changes
+
+    def character_changed(self, char: Character) -> None:
+        """Notify subscribers that a character was edited outside the engine"""
+        with self.batch():
+            self._emit('changed', [char])
+            self.sort()
+
+    def update_character(self, char: Character, **fields) -> None:
+        """Set character fields, re-sorting if initiative changed
+        
+        Initiative changes apply to the character's whole group.
+        """
+        self.update_characters([(char, fields)])
+
+    def update_characters(self, edits: Iterable[Tuple[Character, dict]]) -> None:
+        """Apply several update_character edits as one change
+        
+        The roster is sorted once and subscribers are notified once, however
+        many characters are edited.
+        
+        Args:
+            edits: (character, {field: value}) pairs
+        """
+        with self.batch():
+            changed = []
+            for char, fields in edits:
+                shared = {name: value for name, value in fields.items()
+                          if name in ('initiative', 'initiative_bonus')}
+                targets = self.members(char) if shared and char.group is not None else [char]
+                for name, value in fields.items():
+                    setattr(char, name, value)
+                for member in targets:
+                    for name, value in shared.items():
+                        setattr(member, name, value)
+                changed.extend(targets)
+            if changed:
+                self._emit('changed', changed)
+            self.sort()
+
+    def set_health(self, char: Character, health: int) -> None:
+        """Set a character's health, capped at max HP and not below 0"""
+        char.health = max(0, min(health, char.maxhp))
+        self._emit('changed', [char])
+
+    def heal(self, char: Character, amount: int) -> None:
+        """Heal a character, capped at max HP"""
+        char.modify_health(amount)
+        self._emit('changed', [char])
+
+    def damage(self, char: Character, amount: int) -> None:
+        """Damage a character, not going below 0"""
+        char.modify_health(-amount)
+        self._emit('changed', [char])
+
+    def roll_initiative(self, chars: Iterable[Character], expression: Optional[str] = None,
+                        rng=None) -> List[int]:
+        """
+        Roll initiative for several characters with a single sort and event
+        
+        Args:
+            chars: Characters to roll for
+            expression: Dice expression, rolled with each character's fields
+            rng: Optional random.Random to roll with
+        """
+        from combat.dice import DEFAULT_INITIATIVE, compile_expression
+        # Groups roll once, with their first character's fields
+        slots = {}
+        for char in chars:
+            slots.setdefault(char.group if char.group is not None else id(char), char)
+        rollers = list(slots.values())
+        # Compile and roll everything before touching the roster so a bad
+        # expression or field leaves it unchanged
+        rolls = compile_expression(expression or DEFAULT_INITIATIVE).roll_many(rollers, rng)
+        by_group = {char.group: value for char, value in zip(rollers, rolls) if char.group is not None}
+        changed = [char for char in rollers if char.group is None]
+        for char, value in zip(rollers, rolls):
+            if char.group is None:
+                char.initiative = value
+        if by_group:
+            for char in self.characters:
+                if char.group in by_group:
+                    char.initiative = by_group[char.group]
+                    changed.append(char)
+        with self.batch():
+            if changed:
+                self._emit('changed', changed)
+            self.sort()
+        return rolls
+
+    # Conditions
+
+    def next_turn_round(self, char: Character) -> int:
+        """Get the round in which a character's next turn starts"""
+        if not self.combat_started or self.current is None:
+            return self.round
+        owner_idx = self.index_of(char)
+        current_idx = self.current_index()
+        if owner_idx is None or current_idx is None or owner_idx >= self._slot_end(current_idx):
+            return self.round
+        return self.round + 1
+
+    def add_condition(self, char: Character, name: str, rounds: Optional[int] = None,
+                      health_per_turn: int = 0) -> Condition:
+        """
+        Attach a condition to a character
+        
+        Args:
+            char: Character receiving the condition
+            name: Condition name, e.g. 'Poisoned'
+            rounds: Number of the character's turns it lasts, or None until removed
+            health_per_turn: Health change applied at the start of each of their turns
+        
+        Raises:
+            ValueError: if rounds is less than 1
+        """
+        if rounds is not None and rounds < 1:
+            raise ValueError("Rounds must be positive (None lasts until removed)")
+        first_round = self.next_turn_round(char)
+        condition = Condition(name, first_round + rounds if rounds is not None else None, health_per_turn)
+        char.conditions.append(condition)
+        self._schedule_condition(char, condition, first_round)
+        self._emit('changed', [char])
+        return condition
+
+    def remove_condition(self, char: Character, condition: Condition) -> None:
+        """Remove a condition; its pending timer is skipped when it comes due"""
+        if condition in char.conditions:
+            char.conditions.remove(condition)
+            self._emit('changed', [char])
+
+    def _schedule_condition(self, char: Character, condition: Condition, first_round: int) -> None:
+        """Put a condition on the timer wheel at the next turn it needs attention"""
+        if condition.health_per_turn:
+            self.timers.schedule(first_round, char, condition)
+        elif condition.expires_round is not None:
+            self.timers.schedule(condition.expires_round, char, condition)
+
+    def _rebuild_timers(self) -> None:
+        """Schedule every character's conditions, e.g. after loading a save"""
+        self.timers.clear()
+        current_idx = self.current_index() if self.combat_started else None
+        # Characters up to the end of the current slot have had this round's turn
+        started_end = self._slot_end(current_idx) if current_idx is not None else 0
+        for idx, char in enumerate(self.characters):
+            if not char.conditions:
+                continue
+            first_round = self.round
+            if idx < started_end:
+                first_round += 1
+            for condition in char.conditions:
+                self._schedule_condition(char, condition, first_round)
+
+    def _start_turn(self, char: Character) -> None:
+        """Tick or expire only the conditions due at the start of this turn"""
+        due = self.timers.pop_due(self.round, char)
+        changed = False
+        for condition in due:
+            if condition not in char.conditions:
+                continue  # Removed by hand since it was scheduled
+            if condition.expires_round is not None and self.round >= condition.expires_round:
+                char.conditions.remove(condition)
+            else:
+                char.modify_health(condition.health_per_turn)
+                self.timers.schedule(self.round + 1, char, condition)
+            changed = True
+        if changed:
+            self._emit('changed', [char])
+
+    def _start_slot(self, idx: int) -> None:
+        """Start the turn of everyone in the slot at idx"""
+        for char in self.characters[idx:self._slot_end(idx)]:
+            self._start_turn(char)
+
+    # Rounds and turns
+
+    def set_round(self, round_number: int) -> None:
+        """Set the round number"""
+        if round_number != self.round:
+            self.round = round_number
+            self._emit('round', round_number)
+
+    def increment_round(self) -> None:
+        """Increment the round number"""
+        self.set_round(self.round + 1)
+
+    def decrement_round(self) -> None:
+        """Decrement the round number, not going below 1"""
+        if self.round > 1:
+            self.set_round(self.round - 1)
+
+    def set_combat_started(self, started: bool) -> None:
+        """Mark combat as started or not"""
+        if started != self.combat_started:
+            self.combat_started = started
+            self._emit('combat', started)
+
+    def set_current(self, char: Optional[Character]) -> None:
+        """Give the turn to a character (or nobody)"""
+        self.current = char
+        self._turn_index = None
+        self._emit('turn', char)
+
+    def current_index(self) -> Optional[int]:
+        """Get the roster index of the current character"""
+        idx = self._turn_index
+        if idx is not None and idx < len(self.characters) and self.characters[idx] is self.current:
+            return idx
+        idx = self.index_of(self.current) if self.current is not None else None
+        self._turn_index = idx
+        return idx
+
+    def start_combat(self) -> bool:
+        """Start combat with the first character in order"""
+        if not self.characters:
+            return False
+        # Pacing stats cover one combat at a time
+        self.turn_timer.clear()
+        with self.batch():
+            self.set_current(self.characters[0])
+            self.set_combat_started(True)
+            self._start_slot(0)
+        self.turn_timer.record(self.turn_name(self.current), self.round)
+        return True
+
+    def next_turn(self) -> None:
+        """Advance to the next slot, starting a new round after the last
+        
+        A group takes a single turn, so the whole group is skipped at once.
+        """
+        if not self.combat_started:
+            return
+        if not self.characters:
+            self.set_current(None)
+            return
+        idx = self.current_index()
+        if idx is None:
+            self.set_current(self.characters[0])
+            return
+        next_idx = self._slot_end(idx) % len(self.characters)
+        # Record before notifying so repaints don't skew the timestamp
+        self.turn_timer.record(self.turn_name(self.characters[next_idx]), self.round + (next_idx == 0))
+        with self.batch():
+            if next_idx == 0:
+                self.increment_round()
+            self.set_current(self.characters[next_idx])
+            self._start_slot(next_idx)
+        self._turn_index = next_idx
+
+    def previous_turn(self) -> None:
+        """Go back to the previous slot, returning to the previous round before the first"""
+        if not self.combat_started:
+            return
+        if not self.characters:
+            self.set_current(None)
+            return
+        idx = self.current_index()
+        if idx is None:
+            self.set_current(self.characters[-1])
+            return
+        start = self._slot_start(idx)
+        prev_idx = self._slot_start((start - 1) % len(self.characters))
+        with self.batch():
+            if start == 0:
+                self.decrement_round()
+            self.set_current(self.characters[prev_idx])
+        self._turn_index = prev_idx
+
+    # Persistence
+
+    def to_dict(self) -> dict:
+        """Convert the combat state to a dictionary for saving"""
+        from combat.schema import SCHEMA_VERSION
+        return {
+            'version': SCHEMA_VERSION,
+            'characters': [char.to_dict() for char in self.characters],
+            'round': self.round,
+            'combat_started': self.combat_started,
+            'current_turn_index': self.current_index() if self.combat_started else None
+        }
+
+    def load_dict(self, save_data) -> None:
+        """Replace the combat state with previously saved data
+        
+        Data from older versions is migrated as a whole first; current data
+        is read without per-record fallbacks.
+        """
+        from combat.schema import migrate
+        save_data, _ = migrate(save_data)
+
+        characters = [Character.from_dict(char_data) for char_data in save_data['characters']]
+        combat_started = save_data['combat_started']
+        current_turn_index = save_data['current_turn_index']
+        current = None
+        if combat_started and current_turn_index is not None and 0 <= current_turn_index < len(characters):
+            current = characters[current_turn_index]
+        self.restore(characters, save_data['round'], combat_started, current)
+
+    def restore(self, characters: List[Character], round_number: int, combat_started: bool,
+                current: Optional[Character]) -> None:
+        """Replace the roster and turn state with existing characters, e.g. a checkpoint"""
+        with self.batch():
+            self.characters[:] = characters
+            self._turn_index = None
+            self.set_round(round_number)
+            self.set_combat_started(combat_started)
+            self.set_current(current)
+            self._emit('reset')
+            self.sort()
+            self._rebuild_timers()
@@ -0,0 +1,230 @@
+"""Recording combats for replay, without any Tk dependency.
+
+ReplayRecorder follows an engine from the start of combat and appends
+one JSON line per turn to a file in saves/replays. Each line holds only
+the characters that changed since the previous turn. Every
+KEYFRAME_INTERVAL turns the line is a keyframe with the whole roster
+instead.
+
+Replay reads such a file and rebuilds the combat at any turn. It starts
+from the nearest keyframe at or before that turn and applies the few
+deltas after it, so seeking costs the same anywhere in a long fight.
+
+A recording covers one sitting. Loading a session that is still in
+combat starts a new recording.
+"""
+import json
+import os
+import re
+from bisect import bisect_right
+from datetime import datetime
+from typing import Dict, List, Optional
+
+REPLAY_DIR = os.path.join('saves', 'replays')
+# Turns between full snapshots; seeking applies at most this many deltas
+KEYFRAME_INTERVAL = 25
+
+class ReplayRecorder:
+    """Writes an engine's combat to a replay file, turn by turn"""
+
+    def __init__(self, engine, name: str = "Combat", directory: str = REPLAY_DIR):
+        """
+        Args:
+            engine: CombatEngine to follow
+            name: Encounter name, used in the file name
+            directory: Folder the replay files go in
+        """
+        self.engine = engine
+        self.name = name
+        self.directory = directory
+        self.path: Optional[str] = None
+        self._file = None
+        self._keys: Dict[int, str] = {}  # id(character) -> key in the recording
+        self._next_key = 0
+        self._dirty: Dict[str, object] = {}  # key -> character changed since the last step
+        self._dropped: List[str] = []
+        self._order_dirty = False
+        self._steps = 0
+        self._last_turn = None  # (round, current key) of the last step
+        engine.subscribe(self._on_engine_event)
+
+    @property
+    def recording(self) -> bool:
+        return self._file is not None
+
+    def _key(self, char) -> str:
+        key = self._keys.get(id(char))
+        if key is None:
+            key = self._keys[id(char)] = str(self._next_key)
+            self._next_key += 1
+        return key
+
+    def _on_engine_event(self, event, data) -> None:
+        if event == 'reset':
+            # The roster was replaced wholesale, e.g. by loading a session
+            self._close()
+            if self.engine.combat_started:
+                self.start()
+        elif event == 'combat':
+            if data and not self.recording:
+                self.start()
+            elif not data:
+                self.finish()
+        elif not self.recording:
+            return
+        elif event in ('added', 'changed'):
+            for char in data:
+                self._dirty[self._key(char)] = char
+            self._order_dirty = self._order_dirty or event == 'added'
+        elif event == 'removed':
+            for char in data:
+                key = self._keys.pop(id(char), None)
+                if key is not None:
+                    self._dirty.pop(key, None)
+                    self._dropped.append(key)
+            self._order_dirty = True
+        elif event == 'reordered':
+            self._order_dirty = True
+        elif event == 'turn':
+            self._step()
+
+    def start(self) -> None:
+        """Start a new replay file with a keyframe of the roster as it is now
+
+        If the file can't be created, e.g. in a read-only saves folder, the
+        combat goes on without a recording.
+        """
+        self._close()
+        started = datetime.now()
+        safe_name = re.sub(r'[^\w\- ]', '_', self.name).strip() or "Combat"
+        self.path = os.path.join(self.directory, f"{safe_name} {started:%Y-%m-%d %H%M%S}.jsonl")
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            self._file = open(self.path, 'w')
+        except OSError:
+            self._file = None
+            self.path = None
+            return
+        self._keys = {}
+        self._next_key = 0
+        self._steps = 0
+        from combat.schema import SCHEMA_VERSION
+        self._write({'type': 'header', 'name': self.name, 'version': SCHEMA_VERSION,
+                     'started': started.isoformat(sep=' ', timespec='seconds')})
+        self._write_keyframe()
+
+    def finish(self) -> None:
+        """Record anything that changed since the last turn and close the file"""
+        if self.recording:
+            self._step()
+            self._close()
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._dirty = {}
+        self._dropped = []
+        self._order_dirty = False
+
+    def _write(self, line: dict) -> None:
+        self._file.write(json.dumps(line, separators=(',', ':')) + "\n")
+        self._file.flush()
+
+    def _turn(self) -> dict:
+        engine = self.engine
+        current = engine.current
+        return {
+            'round': engine.round,
+            'current': self._key(current) if current is not None else None,
+            'turn_name': engine.turn_name(current) if current is not None else None
+        }
+
+    def _write_keyframe(self) -> None:
+        line = {'type': 'keyframe', **self._turn(),
+                'records': {self._key(char): char.to_dict() for char in self.engine.characters},
+                'order': [self._key(char) for char in self.engine.characters]}
+        self._write(line)
+        self._last_turn = (line['round'], line['current'])
+        self._dirty = {}
+        self._dropped = []
+        self._order_dirty = False
+
+    def _step(self) -> None:
+        """Append the changes since the last step"""
+        turn = self._turn()
+        if not self._dirty and not self._dropped and not self._order_dirty \
+                and self._last_turn == (turn['round'], turn['current']):
+            return
+        self._steps += 1
+        if self._steps % KEYFRAME_INTERVAL == 0:
+            self._write_keyframe()
+            return
+        line = {'type': 'delta', **turn,
+                'set': {key: char.to_dict() for key, char in self._dirty.items()},
+                'drop': self._dropped}
+        if self._order_dirty:
+            line['order'] = [self._key(char) for char in self.engine.characters]
+        self._write(line)
+        self._last_turn = (turn['round'], turn['current'])
+        self._dirty = {}
+        self._dropped = []
+        self._order_dirty = False
+
+class Replay:
+    """A recorded combat that can be rebuilt at any turn"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.header = {}
+        self.steps: List[dict] = []
+        self.keyframes: List[int] = []  # Step indices of the keyframes
+        with open(path, 'r') as f:
+            for line in f:
+                try:
+                    step = json.loads(line)
+                except ValueError:
+                    continue  # A line cut short by a crash
+                if step.get('type') == 'header':
+                    self.header = step
+                    continue
+                if step.get('type') == 'keyframe':
+                    self.keyframes.append(len(self.steps))
+                self.steps.append(step)
+        if not self.keyframes or self.keyframes[0] != 0:
+            raise ValueError(f"{os.path.basename(path)} is not a combat replay")
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def label(self, index: int) -> str:
+        """Describe a step, e.g. 'Round 3: Goblins'"""
+        step = self.steps[index]
+        return f"Round {step['round']}: {step['turn_name'] or '-'}"
+
+    def state_at(self, index: int) -> dict:
+        """
+        Rebuild the combat at a step, for CombatEngine.load_dict
+
+        Starts from the nearest keyframe and applies only the deltas after it.
+        """
+        start = self.keyframes[bisect_right(self.keyframes, index) - 1]
+        keyframe = self.steps[start]
+        records = dict(keyframe['records'])
+        order = keyframe['order']
+        for step in self.steps[start + 1:index + 1]:
+            records.update(step['set'])
+            for key in step['drop']:
+                records.pop(key, None)
+            order = step.get('order', order)
+
+        step = self.steps[index]
+        order = [key for key in order if key in records]
+        current = step['current']
+        return {
+            'version': self.header.get('version', 1),
+            'characters': [records[key] for key in order],
+            'round': step['round'],
+            'combat_started': True,
+            'current_turn_index': order.index(current) if current in order else None
+        }
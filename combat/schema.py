@@ -0,0 +1,126 @@
+"""Session file versions and the migrations between them.
+
+    0  a bare list of character records (the first release)
+    1  {'characters', 'round', 'combat_started', 'current_turn_index'},
+       with character records that may lack later fields
+    2  version 1 plus a 'version' key; every character and condition
+       record has every field
+    3  version 2 plus a 'token' field (image path or None) on every
+       character record
+
+Older files are upgraded once, as a whole, when they are read. Current
+files skip this module entirely, so Character.from_dict can read records
+without per-field fallbacks.
+
+Upgrade files in place with:
+
+    python -m combat.schema saves/*.json
+"""
+import sys
+from typing import Callable, Dict, Tuple
+
+SCHEMA_VERSION = 3
+
+def schema_version(save_data) -> int:
+    """Get the version of loaded session data"""
+    if isinstance(save_data, list):
+        return 0
+    return save_data.get('version', 1)
+
+def upgrade_character(record: dict) -> dict:
+    """Fill in the fields older versions didn't write for a character record"""
+    health = record['health']
+    return {
+        'name': record['name'],
+        'initiative': record.get('initiative', 0),
+        'initiative_bonus': record.get('initiative_bonus', 0),
+        'health': health,
+        'maxhp': record.get('maxhp', health),  # Older saves only had health
+        'ac': record.get('ac', 0),
+        'is_player': record.get('is_player', False),
+        'group': record.get('group'),
+        'custom_fields': record.get('custom_fields', {}),
+        'conditions': [
+            {
+                'name': condition['name'],
+                'expires_round': condition.get('expires_round'),
+                'health_per_turn': condition.get('health_per_turn', 0)
+            }
+            for condition in record.get('conditions', [])
+        ],
+        'token': record.get('token')
+    }
+
+def _from_v0(save_data: list) -> dict:
+    """Wrap a bare character list in the session layout"""
+    return {
+        'characters': save_data,
+        'round': 1,
+        'combat_started': False,
+        'current_turn_index': None
+    }
+
+def _from_v1(save_data: dict) -> dict:
+    """Complete every character record and stamp the version"""
+    return {
+        'version': 2,
+        'characters': [upgrade_character(record) for record in save_data.get('characters', [])],
+        'round': save_data.get('round', 1),
+        'combat_started': save_data.get('combat_started', False),
+        'current_turn_index': save_data.get('current_turn_index')
+    }
+
+def _from_v2(save_data: dict) -> dict:
+    """Give every character record an empty token"""
+    return {
+        **save_data,
+        'version': 3,
+        'characters': [{**record, 'token': record.get('token')} for record in save_data['characters']]
+    }
+
+# Migration from each version to the next
+MIGRATIONS: Dict[int, Callable] = {
+    0: _from_v0,
+    1: _from_v1,
+    2: _from_v2,
+}
+
+def migrate(save_data) -> Tuple[dict, bool]:
+    """
+    Upgrade session data to the current version
+
+    Returns:
+        (current data, whether anything was migrated)
+    """
+    version = schema_version(save_data)
+    if version == SCHEMA_VERSION:
+        return save_data, False
+    if version > SCHEMA_VERSION:
+        raise ValueError(f"Session was saved by a newer version (format {version}, "
+                         f"this version reads up to {SCHEMA_VERSION})")
+    while version < SCHEMA_VERSION:
+        save_data = MIGRATIONS[version](save_data)
+        version += 1
+    return save_data, True
+
+def main(argv=None) -> int:
+    """Upgrade session files in place"""
+    from combat.session_file import upgrade_session
+    paths = sys.argv[1:] if argv is None else argv
+    if not paths:
+        print("Usage: python -m combat.schema SESSION [SESSION ...]", file=sys.stderr)
+        return 2
+    failed = False
+    for path in paths:
+        try:
+            migrated = upgrade_session(path)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            # Unreadable JSON, or JSON that isn't a session
+            print(f"{path}: {e}", file=sys.stderr)
+            failed = True
+            continue
+        print(f"{path}: {'upgraded' if migrated else 'already current'}")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,247 @@
+"""Text commands applied to a CombatEngine, for the command line and scripts.
+
+One command per line; blank lines and '#' comments are ignored. Arguments
+are split like a shell, so names with spaces can be quoted. Amounts may be
+dice expressions, which are rolled once per command.
+
+    damage TARGET AMOUNT        heal TARGET AMOUNT        hp TARGET VALUE
+    condition TARGET NAME [ROUNDS] [HP_PER_TURN]
+    spawn TEMPLATE [COUNT] [--group]                      remove TARGET
+    roll [TARGET] [FORMULA]     start                     next [N]
+    prev [N]                    round N                   end
+    list
+
+A TARGET is a character name, 'group:NAME' for a group, or one of
+'all', 'players' and 'monsters'.
+"""
+import random
+import shlex
+from typing import Callable, Dict, Iterable, List, Optional, TextIO
+from character.character import Character
+from character.validation import FieldError, parse_amount
+from combat.dice import DiceError, roll
+
+class ScriptError(ValueError):
+    """Raised for a command that can't be applied"""
+
+class CommandRunner:
+    """Applies text commands to an engine"""
+
+    def __init__(self, engine, templates=None, rng: Optional[random.Random] = None,
+                 out: Optional[TextIO] = None):
+        """
+        Args:
+            engine: CombatEngine to modify
+            templates: Optional TemplateStore for the spawn command
+            rng: Optional random.Random for dice rolls
+            out: Stream that the list command writes to
+        """
+        self.engine = engine
+        self.templates = templates
+        self.rng = rng
+        self.out = out
+        self.commands: Dict[str, Callable] = {
+            'damage': self.damage,
+            'heal': self.heal,
+            'hp': self.set_health,
+            'condition': self.condition,
+            'spawn': self.spawn,
+            'remove': self.remove,
+            'roll': self.roll_initiative,
+            'start': self.start,
+            'next': self.next_turn,
+            'prev': self.previous_turn,
+            'round': self.set_round,
+            'end': self.end,
+            'list': self.list,
+        }
+
+    def run(self, lines: Iterable[str], keep_going: bool = False) -> List[str]:
+        """
+        Apply every command as one engine batch
+
+        Args:
+            lines: Command lines
+            keep_going: Report failing commands and continue instead of stopping
+
+        Returns:
+            Error messages for the commands that failed (only when keep_going)
+        """
+        errors = []
+        with self.engine.batch():
+            for number, line in enumerate(lines, 1):
+                try:
+                    self.run_line(line)
+                except ScriptError as e:
+                    message = f"line {number}: {e}"
+                    if not keep_going:
+                        raise ScriptError(message) from None
+                    errors.append(message)
+        return errors
+
+    def run_line(self, line: str) -> None:
+        """Apply a single command"""
+        try:
+            args = shlex.split(line, comments=True)
+        except ValueError as e:
+            raise ScriptError(str(e))
+        if not args:
+            return
+        command = self.commands.get(args[0].lower())
+        if command is None:
+            raise ScriptError(f"Unknown command '{args[0]}'")
+        command(*args[1:])
+
+    # Argument helpers
+
+    def targets(self, target: str) -> List[Character]:
+        """Resolve a TARGET to characters"""
+        characters = self.engine.characters
+        if target == 'all':
+            return list(characters)
+        if target == 'players':
+            return [char for char in characters if char.is_player]
+        if target == 'monsters':
+            return [char for char in characters if not char.is_player]
+        if target.startswith('group:'):
+            group = target[len('group:'):]
+            found = [char for char in characters if char.group == group]
+        else:
+            found = [char for char in characters if char.name == target]
+        if not found:
+            raise ScriptError(f"No character matches '{target}'")
+        return found
+
+    def amount(self, text: str, context=None) -> int:
+        """Read a number or roll a dice expression"""
+        try:
+            return int(text)
+        except ValueError:
+            pass
+        try:
+            return roll(text, context, self.rng)
+        except DiceError as e:
+            raise ScriptError(str(e))
+
+    def non_negative(self, text: str, context=None) -> int:
+        """Read an amount that can't be negative, by the same rules as the command palette"""
+        try:
+            return parse_amount(text, context, self.rng)
+        except FieldError as e:
+            raise ScriptError(str(e)) from None
+
+    def _arguments(self, args, required: int, optional: int = 0):
+        if not required <= len(args) <= required + optional:
+            raise ScriptError(f"Expected {required}{f' to {required + optional}' if optional else ''} "
+                              f"arguments, got {len(args)}")
+
+    # Commands
+
+    def _apply_amount(self, change, args):
+        """Roll the amount once and apply it to every target, like an area effect"""
+        self._arguments(args, 2)
+        targets = self.targets(args[0])
+        if not targets:
+            # 'all', 'players' and 'monsters' may match nobody
+            raise ScriptError(f"No character matches '{args[0]}'")
+        value = self.non_negative(args[1], targets[0])
+        for char in targets:
+            change(char, value)
+
+    def damage(self, *args):
+        self._apply_amount(self.engine.damage, args)
+
+    def heal(self, *args):
+        self._apply_amount(self.engine.heal, args)
+
+    def set_health(self, *args):
+        self._apply_amount(self.engine.set_health, args)
+
+    def condition(self, *args):
+        self._arguments(args, 2, 2)
+        rounds = self.amount(args[2]) if len(args) > 2 else None
+        if rounds is not None and rounds < 1:
+            raise ScriptError("Rounds must be positive (leave them out for no limit)")
+        health_per_turn = self.amount(args[3]) if len(args) > 3 else 0
+        for char in self.targets(args[0]):
+            self.engine.add_condition(char, args[1], rounds, health_per_turn)
+
+    def spawn(self, *args):
+        grouped = '--group' in args
+        args = [arg for arg in args if arg != '--group']
+        self._arguments(args, 1, 1)
+        if self.templates is None:
+            raise ScriptError("No template library to spawn from")
+        template = self.templates.find(args[0])
+        if template is None:
+            raise ScriptError(f"No template named '{args[0]}'")
+        count = self.amount(args[1]) if len(args) > 1 else 1
+        if count < 1:
+            raise ScriptError("Count must be at least 1")
+
+        # Number copies past names already in combat, like the templates screen
+        existing = {char.name for char in self.engine.characters}
+        new_characters = []
+        number = 1
+        while len(new_characters) < count:
+            name = template.name if count == 1 and template.name not in existing else f"{template.name} {number}"
+            number += 1
+            if name in existing:
+                continue
+            existing.add(name)
+            char = template.copy()
+            char.name = name
+            if grouped:
+                char.group = template.name
+            new_characters.append(char)
+        self.engine.add_characters(new_characters)
+
+    def remove(self, *args):
+        self._arguments(args, 1)
+        for char in self.targets(args[0]):
+            self.engine.remove_character(char)
+
+    def roll_initiative(self, *args):
+        self._arguments(args, 0, 2)
+        chars = self.targets(args[0]) if args else self.engine.characters
+        formula = args[1] if len(args) > 1 else None
+        try:
+            self.engine.roll_initiative(chars, formula, self.rng)
+        except DiceError as e:
+            raise ScriptError(str(e))
+
+    def start(self, *args):
+        self._arguments(args, 0)
+        if not self.engine.start_combat():
+            raise ScriptError("Can't start combat without characters")
+
+    def next_turn(self, *args):
+        self._arguments(args, 0, 1)
+        for _ in range(self.amount(args[0]) if args else 1):
+            self.engine.next_turn()
+
+    def previous_turn(self, *args):
+        self._arguments(args, 0, 1)
+        for _ in range(self.amount(args[0]) if args else 1):
+            self.engine.previous_turn()
+
+    def set_round(self, *args):
+        self._arguments(args, 1)
+        self.engine.set_round(max(1, self.amount(args[0])))
+
+    def end(self, *args):
+        self._arguments(args, 0)
+        self.engine.clear()
+
+    def list(self, *args):
+        self._arguments(args, 0)
+        if self.out is None:
+            return
+        engine = self.engine
+        state = f"round {engine.round}" if engine.combat_started else "not started"
+        print(f"# {len(engine.characters)} characters, {state}", file=self.out)
+        for char in engine.characters:
+            marker = '>' if char is engine.current else ' '
+            conditions = ', '.join(condition.describe(engine.next_turn_round(char)) for condition in char.conditions)
+            line = f"{marker} {char.initiative:>3}  {char.name:<24} {char.health:>4}/{char.maxhp:<4} AC {char.ac:<3}  {conditions}"
+            print(line.rstrip(), file=self.out)
@@ -0,0 +1,118 @@
+"""Fuzzy name search over a prebuilt index, without any Tk dependency.
+
+Entries are normalised once when they are added: the lowercase key, the
+positions where words start and a bitmask of the letters they contain.
+A query first skips every entry whose mask lacks one of its letters, so
+a keystroke only scores the few names that can match at all.
+
+Scoring follows the usual command-palette rules: the query's characters
+must appear in order; matches at word starts and runs of consecutive
+characters score higher, and a gap between matched characters costs a
+little.
+"""
+import heapq
+from typing import Any, Iterable, List, NamedTuple, Optional, Tuple
+
+class SearchEntry(NamedTuple):
+    label: str
+    kind: str
+    value: Any
+    key: str
+    starts: frozenset
+    mask: int
+
+def _mask(text: str) -> int:
+    """Bitmask of the characters in text, folded into 64 bits"""
+    mask = 0
+    for ch in text:
+        mask |= 1 << (ord(ch) & 63)
+    return mask
+
+def _word_starts(key: str) -> frozenset:
+    starts = set()
+    previous = ' '
+    for idx, ch in enumerate(key):
+        if ch.isalnum() and not previous.isalnum():
+            starts.add(idx)
+        previous = ch
+    return frozenset(starts)
+
+def fuzzy_score(query: str, key: str, starts=frozenset()) -> Optional[int]:
+    """
+    Score how well a lowercase query matches a lowercase key
+
+    Returns:
+        A higher-is-better score, or None if the query isn't a subsequence
+    """
+    if not query:
+        return 0
+    score = 0
+    position = 0
+    previous = -2
+    for ch in query:
+        found = key.find(ch, position)
+        if found < 0:
+            return None
+        if found in starts:
+            score += 8
+        if found == previous + 1:
+            score += 5
+        elif previous >= 0:
+            score -= min(found - previous, 5)
+        score += 1
+        previous = found
+        position = found + 1
+    if key.startswith(query):
+        score += 10
+    # Shorter names win ties, so "Orc" ranks above "Orc Warchief"
+    return score * 4 - len(key)
+
+class SearchIndex:
+    """Names to search, normalised once when added"""
+
+    def __init__(self):
+        self.entries: List[SearchEntry] = []
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        self.entries = []
+
+    def add(self, label: str, kind: str, value=None, aliases: Iterable[str] = ()) -> None:
+        """
+        Add a searchable entry
+
+        Args:
+            label: Text shown for the entry and matched against
+            kind: Category of the entry, such as 'combatant', 'template' or 'action'
+            value: Object returned with the entry
+            aliases: Extra text matched as well, such as a group name
+        """
+        key = ' '.join([label, *aliases]).lower()
+        self.entries.append(SearchEntry(label, kind, value, key, _word_starts(key), _mask(key)))
+
+    def search(self, query: str, limit: int = 10,
+               kinds: Optional[Iterable[str]] = None) -> List[Tuple[int, SearchEntry]]:
+        """
+        Get the best matches for a query, best first
+
+        Args:
+            query: Text typed by the user; spaces are ignored
+            limit: Largest number of matches to return
+            kinds: Only match entries of these kinds
+        """
+        query = ''.join(query.lower().split())
+        kinds = set(kinds) if kinds is not None else None
+        needed = _mask(query)
+        matches = []
+        for entry in self.entries:
+            if entry.mask & needed != needed:
+                continue
+            if kinds is not None and entry.kind not in kinds:
+                continue
+            score = fuzzy_score(query, entry.key, entry.starts)
+            if score is not None:
+                matches.append((score, entry))
+        return heapq.nlargest(limit, matches, key=lambda match: match[0])
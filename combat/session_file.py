@@ -0,0 +1,47 @@
+"""Reading and writing session files without any Tk dependency."""
+import json
+import os
+from typing import Tuple
+from combat.schema import migrate
+
+def _read(file_path: str, rewrite: bool) -> Tuple[dict, bool]:
+    with open(file_path, 'r') as f:
+        save_data, migrated = migrate(json.load(f))
+    if migrated and rewrite:
+        write_session(file_path, save_data)
+    return save_data, migrated
+
+def read_session(file_path: str, rewrite: bool = False) -> dict:
+    """
+    Read saved combat state in the current format, migrating older files
+    
+    Args:
+        file_path: Path to load the file from
+        rewrite: Save a migrated file back in the current format, so it is
+                 only migrated once
+    """
+    return _read(file_path, rewrite)[0]
+
+def upgrade_session(file_path: str) -> bool:
+    """Rewrite a session file in the current format, returning whether it needed it"""
+    return _read(file_path, rewrite=True)[1]
+
+def write_session(file_path: str, save_data: dict) -> None:
+    """
+    Write combat state (CombatEngine.to_dict()) to a JSON file
+    
+    The file is written next to the target and moved into place, so a
+    crash mid-write never leaves a truncated session.
+    
+    Args:
+        file_path: Path to save the file to
+        save_data: Combat state to save
+    """
+    # Create saves directory if it doesn't exist
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{file_path}.tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(save_data, f, indent=2)
+    os.replace(temp_path, file_path)
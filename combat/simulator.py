@@ -0,0 +1,236 @@
+"""Monte Carlo simulation of an encounter, without any Tk dependency.
+
+Each character fights for their side (players against monsters) using
+custom fields:
+
+    attack   to-hit bonus added to a d20, e.g. '5' or 'str_mod+prof'
+    damage   damage on a hit, e.g. '1d8+3' or '2d6+str_mod'
+    attacks  attacks per turn (default 1)
+
+A character without a damage field doesn't attack but can still be hit.
+Every fight rolls fresh initiative, then each standing combatant attacks
+a random standing enemy in turn; a natural 20 always hits and a natural
+1 always misses. A fight ends when a side is down, or as a draw after
+MAX_ROUNDS.
+
+Fights run in chunks on a ProcessPoolExecutor that is kept alive between
+runs, and each chunk only returns its tallies. Chunks are seeded from the
+run's seed and their index, so a seeded run gives the same result however
+many workers there are.
+"""
+import atexit
+import multiprocessing
+import os
+import random
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+from combat.dice import DEFAULT_INITIATIVE, DiceError, compile_expression, field_value
+
+ATTACK_FIELD = 'attack'
+DAMAGE_FIELD = 'damage'
+ATTACKS_FIELD = 'attacks'
+
+DEFAULT_FIGHTS = 2000
+MAX_ROUNDS = 50
+# Fights per task; small enough to show progress, large enough to amortise the IPC
+CHUNK_SIZE = 250
+# Below this many fights, starting the pool costs more than it saves
+IN_PROCESS_FIGHTS = 500
+
+class SimulationError(ValueError):
+    """Raised for a roster that can't be simulated"""
+
+class Roll(NamedTuple):
+    """A dice expression with a character's fields already filled in"""
+    dice: Tuple[Tuple[int, int, int, int, bool], ...]
+    fixed: int
+
+class CombatantSpec(NamedTuple):
+    """What a worker needs to know about a character; cheap to pickle"""
+    name: str
+    is_player: bool
+    health: int
+    ac: int
+    initiative: Roll
+    to_hit: Roll
+    damage: Optional[Roll]
+    attacks: int
+
+def _bind(text: str, char) -> Roll:
+    """Compile an expression and resolve its field names for a character"""
+    expression = compile_expression(str(text))
+    fixed = expression.constant + sum(sign * field_value(char, name) for sign, name in expression.names)
+    return Roll(tuple(expression.dice), fixed)
+
+def build_specs(characters: Iterable) -> List[CombatantSpec]:
+    """
+    Describe characters for simulation
+
+    Raises:
+        SimulationError: if an expression is invalid or a side is empty
+    """
+    specs = []
+    for char in characters:
+        fields = char.custom_fields
+        try:
+            damage = _bind(fields[DAMAGE_FIELD], char) if str(fields.get(DAMAGE_FIELD, '')).strip() else None
+            to_hit = _bind(fields.get(ATTACK_FIELD) or '0', char)
+            attacks = int(fields.get(ATTACKS_FIELD) or 1)
+            initiative = _bind(DEFAULT_INITIATIVE, char)
+        except (DiceError, ValueError) as e:
+            raise SimulationError(f"{char.name}: {e}") from None
+        specs.append(CombatantSpec(char.name, char.is_player, char.health, char.ac,
+                                   initiative, to_hit, damage, max(attacks, 0)))
+    if not any(spec.is_player for spec in specs) or all(spec.is_player for spec in specs):
+        raise SimulationError("The encounter needs both players and monsters")
+    if not any(spec.damage for spec in specs):
+        raise SimulationError(f"Nobody has a '{DAMAGE_FIELD}' custom field to attack with")
+    return specs
+
+def _roll(roll: Roll, rng: random.Random) -> int:
+    total = roll.fixed
+    for sign, count, sides, kept, highest in roll.dice:
+        draws = [int(rng.random() * sides) + 1 for _ in range(count)]
+        if kept != count:
+            draws = sorted(draws, reverse=highest)[:kept]
+        total += sign * sum(draws)
+    return total
+
+class Tally:
+    """Counts from a number of fights; tallies from separate chunks add up"""
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.fights = 0
+        self.party_wins = 0
+        self.monster_wins = 0
+        self.draws = 0
+        self.wipes = 0  # fights where every player went down
+        self.rounds = 0
+        self.party_deaths = 0
+        self.monster_deaths = 0
+        self.deaths = [0] * len(list(names))  # per combatant, in spec order
+
+    def merge(self, other: 'Tally') -> 'Tally':
+        """Add another tally's counts to this one"""
+        for field in ('fights', 'party_wins', 'monster_wins', 'draws', 'wipes', 'rounds',
+                      'party_deaths', 'monster_deaths'):
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+        if not self.deaths:
+            self.deaths = [0] * len(other.deaths)
+        self.deaths = [a + b for a, b in zip(self.deaths, other.deaths)]
+        return self
+
+    def rate(self, count: int) -> float:
+        """A count as a fraction of the fights"""
+        return count / self.fights if self.fights else 0.0
+
+    @property
+    def expected_rounds(self) -> float:
+        return self.rate(self.rounds)
+
+    @property
+    def expected_party_deaths(self) -> float:
+        return self.rate(self.party_deaths)
+
+    @property
+    def expected_monster_deaths(self) -> float:
+        return self.rate(self.monster_deaths)
+
+def run_fights(specs: List[CombatantSpec], fights: int, seed=None) -> Tally:
+    """Play out fights in this process"""
+    rng = random.Random(seed)
+    tally = Tally(spec.name for spec in specs)
+    count = len(specs)
+    for _ in range(fights):
+        health = [spec.health for spec in specs]
+        order = sorted(range(count), key=lambda idx: -_roll(specs[idx].initiative, rng))
+        party = [idx for idx in range(count) if specs[idx].is_player and health[idx] > 0]
+        monsters = [idx for idx in range(count) if not specs[idx].is_player and health[idx] > 0]
+
+        rounds = 0
+        while party and monsters and rounds < MAX_ROUNDS:
+            rounds += 1
+            for idx in order:
+                if health[idx] <= 0:
+                    continue
+                spec = specs[idx]
+                if spec.damage is None:
+                    continue
+                enemies = monsters if spec.is_player else party
+                for _ in range(spec.attacks):
+                    if not enemies:
+                        break
+                    target = enemies[int(rng.random() * len(enemies))]
+                    natural = int(rng.random() * 20) + 1
+                    if natural == 1 or (natural != 20 and natural + _roll(spec.to_hit, rng) < specs[target].ac):
+                        continue
+                    health[target] -= max(_roll(spec.damage, rng), 0)
+                    if health[target] <= 0:
+                        enemies.remove(target)
+                if not party or not monsters:
+                    break
+
+        tally.fights += 1
+        tally.rounds += rounds
+        if not monsters:
+            tally.party_wins += 1
+        elif not party:
+            tally.monster_wins += 1
+        else:
+            tally.draws += 1
+        if not party:
+            tally.wipes += 1
+        for idx in range(count):
+            if health[idx] <= 0 and specs[idx].health > 0:
+                tally.deaths[idx] += 1
+                if specs[idx].is_player:
+                    tally.party_deaths += 1
+                else:
+                    tally.monster_deaths += 1
+    return tally
+
+_pool = None
+
+def pool() -> ProcessPoolExecutor:
+    """The shared worker pool, started on first use"""
+    global _pool
+    if _pool is None:
+        # Spawn rather than fork: the app already runs background threads,
+        # and a forked copy of a threaded process can deadlock
+        _pool = ProcessPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) - 1),
+                                    mp_context=multiprocessing.get_context('spawn'))
+        atexit.register(shutdown)
+    return _pool
+
+def shutdown() -> None:
+    """Stop the worker pool"""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+def submit(specs: List[CombatantSpec], fights: int, seed=None) -> List[Future]:
+    """
+    Start fights in chunks, returning a Future per chunk that yields a Tally
+
+    Small runs are played in this process and returned as finished futures.
+    """
+    base = seed if seed is not None else random.randrange(1 << 30)
+    chunks = [(index, min(CHUNK_SIZE, fights - start)) for index, start in enumerate(range(0, fights, CHUNK_SIZE))]
+    if fights < IN_PROCESS_FIGHTS:
+        futures = []
+        for index, count in chunks:
+            future = Future()
+            future.set_result(run_fights(specs, count, f"{base}-{index}"))
+            futures.append(future)
+        return futures
+    executor = pool()
+    return [executor.submit(run_fights, specs, count, f"{base}-{index}") for index, count in chunks]
+
+def simulate(characters: Iterable, fights: int = DEFAULT_FIGHTS, seed=None) -> Tally:
+    """Simulate an encounter and wait for the combined result"""
+    specs = build_specs(characters)
+    tally = Tally(spec.name for spec in specs)
+    for future in submit(specs, fights, seed):
+        tally.merge(future.result())
+    return tally
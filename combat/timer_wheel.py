@@ -0,0 +1,51 @@
+from typing import Dict, List, Tuple
+from character.character import Character
+from character.condition import Condition
+
+class TimerWheel:
+    """Condition timers bucketed by round and by the turn owner they fire on.
+
+    A slot only holds conditions that need attention at that turn: ticking
+    effects for their next tick and non-ticking effects for their expiry.
+    Starting a turn therefore touches just the due conditions instead of
+    scanning every character's every effect.
+    """
+
+    def __init__(self):
+        # round -> id(owner) -> [(owner, condition), ...]
+        self._slots: Dict[int, Dict[int, List[Tuple[Character, Condition]]]] = {}
+
+    def schedule(self, round_number: int, owner: Character, condition: Condition) -> None:
+        """Fire a condition at the start of the owner's turn in the given round"""
+        self._slots.setdefault(round_number, {}).setdefault(id(owner), []).append((owner, condition))
+
+    def pop_due(self, round_number: int, owner: Character) -> List[Condition]:
+        """Remove and return the owner's conditions due by the given round
+
+        Slots from earlier rounds are included so timers aren't stranded when
+        the round counter is moved by hand past an owner's turn.
+        """
+        due = []
+        for slot_round in [r for r in self._slots if r <= round_number]:
+            slot = self._slots[slot_round]
+            entries = slot.pop(id(owner), None)
+            if entries:
+                due.extend(condition for _, condition in entries)
+            if not slot:
+                del self._slots[slot_round]
+        return due
+
+    def discard_owner(self, owner: Character) -> None:
+        """Drop every timer belonging to a character"""
+        for slot_round in list(self._slots):
+            slot = self._slots[slot_round]
+            slot.pop(id(owner), None)
+            if not slot:
+                del self._slots[slot_round]
+
+    def clear(self) -> None:
+        """Drop all timers"""
+        self._slots.clear()
+
+    def __len__(self) -> int:
+        return sum(len(entries) for slot in self._slots.values() for entries in slot.values())
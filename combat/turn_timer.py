@@ -0,0 +1,124 @@
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+import csv
+import math
+import time
+
+class TurnTimer:
+    """Fixed-size ring buffer of turn start timestamps.
+
+    Recording a turn is a constant-time write into preallocated arrays, so it
+    can sit directly on the turn advancement path. All statistics are
+    computed lazily when the stats panel asks for them.
+    """
+
+    def __init__(self, capacity: int = 4096, clock=time.monotonic):
+        """
+        Initialize the turn timer
+
+        Args:
+            capacity: Number of turn starts kept before the oldest are overwritten
+            clock: Monotonic clock returning seconds
+        """
+        self.capacity = capacity
+        self._clock = clock
+        self._times = array('d', [0.0]) * capacity
+        self._rounds = array('l', [0]) * capacity
+        self._names: List[Optional[str]] = [None] * capacity
+        self._next = 0
+        self._count = 0
+
+    def record(self, name: str, round_number: int) -> None:
+        """Record that the given character's turn started now"""
+        i = self._next
+        self._times[i] = self._clock()
+        self._rounds[i] = round_number
+        self._names[i] = name
+        self._next = (i + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def clear(self) -> None:
+        """Forget all recorded turns"""
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def entries(self) -> Iterator[Tuple[float, str, int]]:
+        """Iterate over recorded (timestamp, name, round) tuples, oldest first"""
+        start = (self._next - self._count) % self.capacity
+        for offset in range(self._count):
+            i = (start + offset) % self.capacity
+            yield self._times[i], self._names[i], self._rounds[i]
+
+    def turns(self) -> List[Tuple[str, int, float, float]]:
+        """Get completed turns as (name, round, start, duration) tuples
+
+        A turn lasts until the next recorded turn start, so the turn that is
+        currently in progress is not included.
+        """
+        turns = []
+        previous = None
+        for entry in self.entries():
+            if previous is not None:
+                start, name, round_number = previous
+                turns.append((name, round_number, start, entry[0] - start))
+            previous = entry
+        return turns
+
+    def character_stats(self) -> Dict[str, Dict[str, float]]:
+        """Get turn count, average, median, 90th percentile and longest turn per character"""
+        durations: Dict[str, List[float]] = {}
+        for name, _, _, duration in self.turns():
+            durations.setdefault(name, []).append(duration)
+
+        stats = {}
+        for name, values in durations.items():
+            values.sort()
+            stats[name] = {
+                'turns': len(values),
+                'average': sum(values) / len(values),
+                'median': percentile(values, 50),
+                'p90': percentile(values, 90),
+                'longest': values[-1],
+            }
+        return stats
+
+    def summary(self) -> Dict[str, float]:
+        """Get overall pacing figures for the recorded turns"""
+        turns = self.turns()
+        if not turns:
+            return {'turns': 0, 'average': 0.0, 'rounds': 0, 'rounds_per_hour': 0.0}
+
+        elapsed = turns[-1][2] + turns[-1][3] - turns[0][2]
+        rounds = len({round_number for _, round_number, _, _ in turns})
+        return {
+            'turns': len(turns),
+            'average': sum(turn[3] for turn in turns) / len(turns),
+            'rounds': rounds,
+            'rounds_per_hour': rounds * 3600 / elapsed if elapsed > 0 else 0.0,
+        }
+
+    def export_csv(self, file_path: str) -> None:
+        """
+        Write every completed turn to a CSV file
+
+        Args:
+            file_path: Path to write the CSV file to
+        """
+        turns = self.turns()
+        origin = turns[0][2] if turns else 0.0
+        with open(file_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['round', 'character', 'start_seconds', 'duration_seconds'])
+            for name, round_number, start, duration in turns:
+                writer.writerow([round_number, name, f"{start - origin:.3f}", f"{duration:.3f}"])
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Get the nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values), math.ceil(pct / 100 * len(sorted_values))) - 1)
+    return sorted_values[rank]
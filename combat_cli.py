@@ -0,0 +1,82 @@
+"""Apply commands to saved sessions without opening the Tk window.
+
+Usage:
+    python combat_cli.py SESSION [SESSION ...] [-s SCRIPT] [-o OUTPUT]
+                         [--templates DIR] [--seed N] [--dry-run] [--keep-going]
+
+Commands are read from SCRIPT, or from stdin when no script is given, and
+applied to each session in turn; see combat/script.py for the command list.
+A session that doesn't exist yet starts empty.
+
+Examples:
+    python combat_cli.py saves/last_session.json -s prep.txt
+    echo "damage group:Skeleton 2d6" | python combat_cli.py saves/*.json
+"""
+import argparse
+import os
+import random
+import sys
+
+from combat.engine import CombatEngine
+from combat.script import CommandRunner, ScriptError
+from combat.session_file import read_session, write_session
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Apply combat commands to saved sessions")
+    parser.add_argument('sessions', nargs='+', help="Session files to update")
+    parser.add_argument('-s', '--script', help="Command file (default: read stdin)")
+    parser.add_argument('-o', '--output', help="Write the result here instead of back to the session")
+    parser.add_argument('--templates', help="Template directory for spawn (default: the application's)")
+    parser.add_argument('--seed', type=int, help="Seed dice rolls for repeatable results")
+    parser.add_argument('--dry-run', action='store_true', help="Apply the commands but don't save")
+    parser.add_argument('--keep-going', action='store_true', help="Report failing commands and continue")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.output and len(args.sessions) > 1:
+        print("--output can only be used with a single session", file=sys.stderr)
+        return 2
+
+    if args.script:
+        with open(args.script, 'r') as f:
+            lines = f.read().splitlines()
+    else:
+        lines = sys.stdin.read().splitlines()
+
+    # Only load templates when a script needs them
+    templates = None
+    if any(line.strip().lower().startswith('spawn') for line in lines):
+        from character.template_store import TemplateStore
+        templates = TemplateStore(args.templates)
+        templates.ensure_loaded()
+
+    rng = random.Random(args.seed) if args.seed is not None else None
+    failed = False
+    for session_path in args.sessions:
+        engine = CombatEngine()
+        if os.path.exists(session_path):
+            try:
+                engine.load_dict(read_session(session_path))
+            except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+                print(f"{session_path}: {e}", file=sys.stderr)
+                failed = True
+                continue
+
+        runner = CommandRunner(engine, templates, rng, out=sys.stdout)
+        try:
+            errors = runner.run(lines, keep_going=args.keep_going)
+        except ScriptError as e:
+            print(f"{session_path}: {e}", file=sys.stderr)
+            failed = True
+            continue
+        for error in errors:
+            print(f"{session_path}: {error}", file=sys.stderr)
+        failed = failed or bool(errors)
+
+        if not args.dry_run:
+            write_session(args.output or session_path, engine.to_dict())
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,19 @@
+import time
+STARTED = time.perf_counter()
+
 import tkinter as tk
 from GUI.gui import CombatTrackerGUI
+from profiling.profiler import enable_from_environment
 
 def main():
+    # Opt-in instrumentation of hot paths (COMBAT_TRACKER_PROFILE=1)
+    enable_from_environment()
     root = tk.Tk()
-    app = CombatTrackerGUI(root)
+    app = CombatTrackerGUI(root, started=STARTED)
     root.mainloop()
 
 if __name__ == "__main__":
+    # Lets the encounter simulator's worker processes start in a frozen build
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
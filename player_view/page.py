@@ -0,0 +1,79 @@
+"""The player view page served at /. It applies the server's snapshot and diff messages."""
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Combat Tracker - Player View</title>
+<style>
+  body { font-family: sans-serif; background: #1e1e1e; color: #eee; margin: 1.5em; }
+  h1 { font-size: 1.4em; margin: 0 0 0.8em; }
+  #status { color: #888; font-size: 0.8em; margin-left: 1em; }
+  table { border-collapse: collapse; width: 100%; font-size: 1.2em; }
+  td { padding: 0.4em 0.6em; border-bottom: 1px solid #333; }
+  tr.current { background: #3a4a2a; font-weight: bold; }
+  .bloodied { color: #e0a030; }
+  .down { color: #d04040; text-decoration: line-through; }
+  .player { color: #7fb0ff; }
+  .conditions { color: #aaa; font-size: 0.85em; }
+</style>
+</head>
+<body>
+<h1>Round <span id="round">-</span><span id="status">connecting...</span></h1>
+<table><tbody id="rows"></tbody></table>
+<script>
+let view = {rows: {}, order: [], round: 1, turn: null, combat: false};
+
+function apply(message) {
+  if (message.type === 'snapshot') {
+    view = {rows: message.rows || {}, order: message.order || [], round: message.round,
+            turn: message.turn, combat: message.combat};
+  } else {
+    for (const id of message.removed || []) delete view.rows[id];
+    Object.assign(view.rows, message.rows || {});
+    for (const key of ['order', 'round', 'turn', 'combat']) {
+      if (key in message) view[key] = message[key];
+    }
+  }
+  render();
+}
+
+function render() {
+  document.getElementById('round').textContent = view.combat ? view.round : '-';
+  const current = view.turn === null ? null : view.rows[view.turn];
+  const body = document.getElementById('rows');
+  body.replaceChildren();
+  for (const id of view.order) {
+    const row = view.rows[id];
+    if (!row) continue;
+    const tr = document.createElement('tr');
+    // A group takes its turn together
+    if (view.combat && current && (String(id) === String(view.turn) ||
+        (row.group && row.group === current.group))) tr.className = 'current';
+    const name = document.createElement('td');
+    name.textContent = row.name;
+    if (row.player) name.className = 'player';
+    const health = document.createElement('td');
+    health.textContent = row.player ? row.hp + ' / ' + row.maxhp : row.status;
+    health.className = row.status;
+    const conditions = document.createElement('td');
+    conditions.textContent = row.conditions.join(', ');
+    conditions.className = 'conditions';
+    tr.append(name, health, conditions);
+    body.append(tr);
+  }
+}
+
+function connect() {
+  const socket = new WebSocket('ws://' + location.host + '/ws');
+  const status = document.getElementById('status');
+  socket.onopen = () => { status.textContent = ''; };
+  socket.onmessage = (event) => apply(JSON.parse(event.data));
+  socket.onclose = () => { status.textContent = 'reconnecting...'; setTimeout(connect, 2000); };
+}
+connect();
+</script>
+</body>
+</html>
+"""
@@ -0,0 +1,139 @@
+"""What players are allowed to see, and the diffs sent when it changes.
+
+Everything here runs on the thread that owns the CombatEngine (the Tk
+mainloop). It only builds plain dicts; encoding and sending happen on the
+server thread.
+"""
+from typing import Dict, List, Optional
+from character.character import Character
+
+def health_status(char: Character) -> str:
+    """Describe health without numbers: 'healthy', 'bloodied' or 'down'"""
+    if char.health <= 0:
+        return 'down'
+    if char.health * 2 <= char.maxhp:
+        return 'bloodied'
+    return 'healthy'
+
+def public_row(char: Character) -> dict:
+    """Project a character onto the fields players may see
+
+    Monsters' hit points are redacted to a health status; player
+    characters also show their numbers.
+    """
+    row = {
+        'name': char.name,
+        'player': char.is_player,
+        'status': health_status(char),
+        'conditions': [condition.name for condition in char.conditions],
+    }
+    if char.group is not None:
+        row['group'] = char.group
+    if char.is_player:
+        row['hp'] = char.health
+        row['maxhp'] = char.maxhp
+    return row
+
+class PublicState:
+    """The players' view of one engine, kept up to date from engine events.
+
+    Characters get small public ids on first sight so messages never carry
+    internal identifiers. Each update returns only what changed: rows whose
+    public projection differs, removed ids, and the order, round or turn if
+    they moved. Damage that doesn't change a monster's status produces no
+    diff at all.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._ids: Dict[int, int] = {}  # id(character) -> public id
+        self._next_id = 1
+        self.rows: Dict[int, dict] = {}
+        self.order: List[int] = []
+        self.round = engine.round
+        self.turn: Optional[int] = None
+        self.combat = engine.combat_started
+
+    def _public_id(self, char: Character) -> int:
+        pid = self._ids.get(id(char))
+        if pid is None:
+            pid = self._ids[id(char)] = self._next_id
+            self._next_id += 1
+        return pid
+
+    def snapshot(self) -> dict:
+        """Rebuild the whole view from the engine"""
+        self._ids.clear()
+        self.rows.clear()
+        self.order = []
+        self.sync_roster()
+        self.round = self.engine.round
+        self.combat = self.engine.combat_started
+        self.turn = self._ids.get(id(self.engine.current)) if self.engine.current is not None else None
+        return {
+            'rows': dict(self.rows),
+            'order': list(self.order),
+            'round': self.round,
+            'turn': self.turn,
+            'combat': self.combat,
+        }
+
+    def sync_roster(self) -> dict:
+        """Diff the roster after characters were added, removed or reordered"""
+        diff = {}
+        rows = {}
+        order = []
+        seen = set()
+        for char in self.engine.characters:
+            pid = self._public_id(char)
+            row = public_row(char)
+            if self.rows.get(pid) != row:
+                self.rows[pid] = row
+                rows[pid] = row
+            order.append(pid)
+            seen.add(id(char))
+        removed = [key for key in self._ids if key not in seen]
+        if removed:
+            removed_ids = [self._ids.pop(key) for key in removed]
+            for pid in removed_ids:
+                self.rows.pop(pid, None)
+            diff['removed'] = removed_ids
+        if rows:
+            diff['rows'] = rows
+        if order != self.order:
+            self.order = order
+            diff['order'] = order
+        return diff
+
+    def update(self, event: str, data) -> dict:
+        """Apply an engine event and return the diff to send (empty if nothing visible changed)"""
+        diff = {}
+        if event == 'changed':
+            rows = {}
+            for char in data:
+                pid = self._ids.get(id(char))
+                if pid is None:
+                    continue
+                row = public_row(char)
+                if self.rows.get(pid) != row:
+                    self.rows[pid] = rows[pid] = row
+            if rows:
+                diff['rows'] = rows
+        elif event in ('added', 'removed', 'reordered', 'reset'):
+            diff = self.sync_roster()
+            if event == 'reset':
+                # The current character may be a new object after a reload
+                turn = self._ids.get(id(self.engine.current)) if self.engine.current is not None else None
+                if turn != self.turn:
+                    self.turn = diff['turn'] = turn
+        elif event == 'round':
+            if data != self.round:
+                self.round = diff['round'] = data
+        elif event == 'turn':
+            turn = self._ids.get(id(data)) if data is not None else None
+            if turn != self.turn:
+                self.turn = diff['turn'] = turn
+        elif event == 'combat':
+            if data != self.combat:
+                self.combat = diff['combat'] = data
+        return diff
@@ -0,0 +1,237 @@
+"""Local HTTP/WebSocket server for a players' second screen.
+
+The server runs its own asyncio loop on a daemon thread. Engine events are
+turned into small diffs on the Tk thread (see protocol.PublicState) and
+handed to the loop with call_soon_threadsafe, so the mainloop never waits
+on the network. Only the standard library is used.
+
+    GET /       the player view page
+    GET /state  the current view as JSON
+    GET /ws     WebSocket: a 'snapshot' message, then 'diff' messages
+"""
+import asyncio
+import base64
+import hashlib
+import json
+import threading
+from typing import Optional
+from player_view.page import PAGE
+from player_view.protocol import PublicState
+
+DEFAULT_PORT = 8765
+
+# Handshake constant from RFC 6455
+WEBSOCKET_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+# Players' browsers only send pings and close frames
+MAX_CLIENT_FRAME = 4096
+
+# Clients that fall this far behind are disconnected instead of buffering forever
+MAX_CLIENT_BACKLOG = 1 << 20
+
+def encode_frame(payload: bytes, opcode: int = 0x1) -> bytes:
+    """Build an unmasked server-to-client WebSocket frame"""
+    header = bytearray([0x80 | opcode])
+    length = len(payload)
+    if length < 126:
+        header.append(length)
+    elif length < 1 << 16:
+        header.append(126)
+        header += length.to_bytes(2, 'big')
+    else:
+        header.append(127)
+        header += length.to_bytes(8, 'big')
+    return bytes(header) + payload
+
+async def read_frame(reader: asyncio.StreamReader):
+    """Read one client frame, returning (opcode, payload)"""
+    first, second = await reader.readexactly(2)
+    length = second & 0x7f
+    if length == 126:
+        length = int.from_bytes(await reader.readexactly(2), 'big')
+    elif length == 127:
+        length = int.from_bytes(await reader.readexactly(8), 'big')
+    if length > MAX_CLIENT_FRAME:
+        raise ConnectionError("Client frame too large")
+    mask = await reader.readexactly(4) if second & 0x80 else None
+    payload = await reader.readexactly(length)
+    if mask:
+        payload = bytes(byte ^ mask[i % 4] for i, byte in enumerate(payload))
+    return first & 0x0f, payload
+
+class PlayerViewServer:
+    """Serves the players' view of a CombatEngine and pushes its changes"""
+
+    def __init__(self, engine, host: str = '127.0.0.1', port: int = DEFAULT_PORT):
+        """
+        Args:
+            engine: CombatEngine to follow
+            host: Interface to bind; '0.0.0.0' shares the view on the LAN
+            port: Port to listen on (0 picks a free port)
+        """
+        self.engine = engine
+        self.host = host
+        self.port = port
+        self._state: Optional[PublicState] = None
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._error: Optional[BaseException] = None
+
+        # Owned by the loop thread
+        self._view = {}
+        self._clients = set()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def url(self) -> str:
+        host = 'localhost' if self.host in ('127.0.0.1', '0.0.0.0', '') else self.host
+        return f"http://{host}:{self.port}/"
+
+    def start(self) -> None:
+        """Start the server thread and begin following the engine"""
+        if self.running:
+            return
+        ready = threading.Event()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, args=(ready,), name='player-view', daemon=True)
+        self._thread.start()
+        ready.wait(5)
+        if self._error is not None:
+            self._thread.join()
+            self._thread = None
+            raise self._error
+        self.set_engine(self.engine)
+
+    def stop(self) -> None:
+        """Stop following the engine and shut the server down"""
+        self.engine.unsubscribe(self._on_engine_event)
+        if self.running:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+        self._thread = None
+
+    def set_engine(self, engine) -> None:
+        """Follow another engine, e.g. when the selected encounter changes"""
+        self.engine.unsubscribe(self._on_engine_event)
+        self.engine = engine
+        self._state = PublicState(engine)
+        snapshot = self._state.snapshot()
+        engine.subscribe(self._on_engine_event)
+        if self.running:
+            self._loop.call_soon_threadsafe(self._publish, 'snapshot', snapshot)
+
+    # Tk thread
+
+    def _on_engine_event(self, event, data) -> None:
+        """Turn an engine event into a diff and hand it to the server thread"""
+        diff = self._state.update(event, data)
+        if diff and self.running:
+            self._loop.call_soon_threadsafe(self._publish, 'diff', diff)
+
+    # Server thread
+
+    def _run(self, ready: threading.Event) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        try:
+            server = loop.run_until_complete(asyncio.start_server(self._handle, self.host, self.port))
+        except OSError as e:
+            self._error = e
+            ready.set()
+            loop.close()
+            return
+        self.port = server.sockets[0].getsockname()[1]
+        ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            server.close()
+            for writer in list(self._clients):
+                writer.close()
+            self._clients.clear()
+            loop.run_until_complete(server.wait_closed())
+            loop.close()
+
+    def _publish(self, kind: str, message: dict) -> None:
+        """Update the served view and push the message to every client"""
+        if kind == 'snapshot':
+            self._view = message
+        else:
+            view = self._view
+            rows = view.setdefault('rows', {})
+            for pid in message.get('removed', ()):
+                rows.pop(pid, None)
+            rows.update(message.get('rows', {}))
+            for key in ('order', 'round', 'turn', 'combat'):
+                if key in message:
+                    view[key] = message[key]
+
+        # Encode once for all clients
+        frame = encode_frame(json.dumps({'type': kind, **message}, separators=(',', ':')).encode())
+        for writer in list(self._clients):
+            if writer.transport.get_write_buffer_size() > MAX_CLIENT_BACKLOG:
+                self._clients.discard(writer)
+                writer.close()
+            else:
+                writer.write(frame)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one HTTP request, upgrading /ws to a WebSocket"""
+        try:
+            request = await reader.readuntil(b'\r\n\r\n')
+            lines = request.decode('latin-1').split('\r\n')
+            method, path, _ = (lines[0].split(' ') + ['', ''])[:3]
+            headers = {}
+            for line in lines[1:]:
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+            if method != 'GET':
+                self._respond(writer, '405 Method Not Allowed', 'text/plain', b'Method not allowed')
+            elif path == '/ws' and headers.get('upgrade', '').lower() == 'websocket':
+                await self._serve_websocket(reader, writer, headers)
+                return
+            elif path == '/':
+                self._respond(writer, '200 OK', 'text/html; charset=utf-8', PAGE.encode())
+            elif path == '/state':
+                self._respond(writer, '200 OK', 'application/json', json.dumps(self._view).encode())
+            else:
+                self._respond(writer, '404 Not Found', 'text/plain', b'Not found')
+            await writer.drain()
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _respond(self, writer, status: str, content_type: str, body: bytes) -> None:
+        writer.write(f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                     f"Content-Length: {len(body)}\r\nCache-Control: no-store\r\n"
+                     f"Connection: close\r\n\r\n".encode() + body)
+
+    async def _serve_websocket(self, reader, writer, headers) -> None:
+        """Complete the handshake, send the current view and keep the client until it leaves"""
+        key = headers.get('sec-websocket-key')
+        if not key:
+            self._respond(writer, '400 Bad Request', 'text/plain', b'Missing Sec-WebSocket-Key')
+            return
+        accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode()).digest()).decode()
+        writer.write(("HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                      f"Sec-WebSocket-Accept: {accept}\r\n\r\n").encode())
+        writer.write(encode_frame(json.dumps({'type': 'snapshot', **self._view}, separators=(',', ':')).encode()))
+        self._clients.add(writer)
+        try:
+            while True:
+                opcode, payload = await read_frame(reader)
+                if opcode == 0x8:  # Close
+                    writer.write(encode_frame(payload[:2], 0x8))
+                    break
+                if opcode == 0x9:  # Ping
+                    writer.write(encode_frame(payload, 0xA))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._clients.discard(writer)
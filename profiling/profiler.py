@@ -0,0 +1,167 @@
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+import functools
+import importlib
+import json
+import os
+import time
+
+# Hot paths instrumented when profiling is enabled: (module, class, method)
+HOT_PATHS: List[Tuple[str, str, str]] = [
+    ('GUI.components.encounter', 'Encounter', 'update_character_list'),
+    ('GUI.components.character_list', 'CharacterList', 'update_character_list'),
+    ('GUI.components.character_list', 'CharacterList', 'refresh_characters'),
+    ('combat.engine', 'CombatEngine', 'next_turn'),
+    ('GUI.components.session_manager', 'SessionManager', 'save_to_file'),
+    ('GUI.components.session_manager', 'SessionManager', 'load_from_file'),
+    ('GUI.components.template_list', 'TemplateList', 'load_templates'),
+    ('GUI.components.quick_edit', 'QuickEdit', '_update_health'),
+]
+
+# Environment variable that turns profiling on at startup
+ENV_VAR = 'COMBAT_TRACKER_PROFILE'
+
+class Histogram:
+    """Call counter with a log2 histogram of durations in microseconds"""
+
+    BUCKETS = 32
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Clear all recorded samples"""
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+        self.buckets = [0] * self.BUCKETS
+
+    def add(self, seconds: float) -> None:
+        """Record one duration"""
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        # Bucket n holds durations below 2**n microseconds
+        bucket = int(seconds * 1_000_000).bit_length()
+        self.buckets[min(bucket, self.BUCKETS - 1)] += 1
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """Estimate a percentile in seconds from the bucket upper bounds"""
+        if not self.count:
+            return 0.0
+        threshold = self.count * pct / 100
+        seen = 0
+        for bucket, hits in enumerate(self.buckets):
+            seen += hits
+            if seen >= threshold:
+                return min((2 ** bucket) / 1_000_000, self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        """Convert the histogram to a dictionary for dumping"""
+        return {
+            'count': self.count,
+            'total_ms': self.total * 1000,
+            'mean_ms': self.mean * 1000,
+            'min_ms': (self.min if self.count else 0.0) * 1000,
+            'max_ms': self.max * 1000,
+            'p50_ms': self.percentile(50) * 1000,
+            'p95_ms': self.percentile(95) * 1000,
+            'buckets_us': {f"<{2 ** i}": hits for i, hits in enumerate(self.buckets) if hits},
+        }
+
+class Profiler:
+    """Opt-in timing of the application's hot paths.
+
+    While disabled the instrumented methods are the original, unwrapped
+    functions, so there is no per-call cost at all. Enabling swaps timing
+    wrappers onto the classes listed in HOT_PATHS; disabling puts the
+    originals back.
+    """
+
+    def __init__(self, hot_paths=HOT_PATHS):
+        self.hot_paths = hot_paths
+        self.histograms: Dict[str, Histogram] = {}
+        self.enabled = False
+        self._originals: List[Tuple[type, str, object]] = []
+
+    def enable(self) -> None:
+        """Install timing wrappers on all hot paths"""
+        if self.enabled:
+            return
+        for module_name, class_name, method_name in self.hot_paths:
+            owner = getattr(importlib.import_module(module_name), class_name)
+            original = owner.__dict__[method_name]
+            self._originals.append((owner, method_name, original))
+            setattr(owner, method_name, self._wrap(f"{class_name}.{method_name}", original))
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Restore the original, unwrapped hot path functions"""
+        for owner, method_name, original in reversed(self._originals):
+            setattr(owner, method_name, original)
+        self._originals.clear()
+        self.enabled = False
+
+    def _wrap(self, label, func):
+        """Wrap a function so every call is timed under the given label"""
+        histogram = self.histograms.setdefault(label, Histogram())
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                histogram.add(time.perf_counter() - start)
+        return timed
+
+    def record(self, label: str, seconds: float) -> None:
+        """Record a duration measured elsewhere (ignored while disabled)"""
+        if self.enabled:
+            self.histograms.setdefault(label, Histogram()).add(seconds)
+
+    @contextmanager
+    def timer(self, label: str):
+        """Time a block of code under the given label"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(label, time.perf_counter() - start)
+
+    def reset(self) -> None:
+        """Clear all recorded samples"""
+        for histogram in self.histograms.values():
+            histogram.reset()
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Get the current statistics for every label"""
+        return {label: histogram.to_dict() for label, histogram in sorted(self.histograms.items())}
+
+    def dump(self, file_path: str) -> None:
+        """
+        Write the current statistics to a JSON file
+
+        Args:
+            file_path: Path to write the dump to
+        """
+        with open(file_path, 'w') as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+# Shared profiler instance used by the application
+profiler = Profiler()
+
+def enable_from_environment() -> bool:
+    """Enable the shared profiler if the environment asks for it"""
+    if os.environ.get(ENV_VAR, '') not in ('', '0'):
+        profiler.enable()
+    return profiler.enabled